@@ -25,6 +25,7 @@ import logging
 from moneySmarts import Game, GUIManager
 from moneySmarts.screens import TitleScreen
 from moneySmarts.exceptions import GameError
+from moneySmarts.image_manager import image_manager
 
 # GUI Constants
 SCREEN_WIDTH = 1024
@@ -75,6 +76,10 @@ def main():
         # Set initial screen
         gui_manager.set_screen(TitleScreen(game))
 
+        # Decode the next screens' backgrounds while the title screen is up
+        image_manager.queue_preload([('NAME_BG', None), ('INTRO_BG', None)], group='intro')
+        image_manager.start_preload()
+
         # Main game loop
         gui_manager.run()
     except GameError as ge:
@@ -15,6 +15,7 @@ DARK_GOLD = (150, 120, 40)
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
+IDLE_WAIT_MS = 500  # Longest idle sleep between frames; input wakes the loop at once
 
 # Colors
 WHITE = (255, 255, 255)
@@ -1,32 +1,371 @@
+import bisect
+import itertools
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from inspect import ismethod
+
+logger = logging.getLogger(__name__)
+
+
+class _WeakHandler:
+    """Calls a handler through a weak reference; the handler's owner is not kept alive."""
+    __slots__ = ('ref',)
+
+    def __init__(self, handler, on_dead):
+        # Bound methods die with their temporary method object, so reference self and function
+        self.ref = weakref.WeakMethod(handler, on_dead) if ismethod(handler) else weakref.ref(handler, on_dead)
+
+    def resolve(self):
+        return self.ref()
+
+    def __call__(self, **kwargs):
+        handler = self.ref()
+        if handler is not None:
+            handler(**kwargs)
+
+
+def _resolve(entry):
+    return entry.resolve() if isinstance(entry, _WeakHandler) else entry
+
+
+class EventScope:
+    """
+    A group of subscriptions released together, e.g. for the lifetime of a screen
+    or a ``with`` block.
+
+    Attributes:
+        bus (EventManager): The event manager the subscriptions are made on.
+        subscriptions (list): (event_type, handler) pairs still subscribed.
+    """
+    def __init__(self, bus):
+        self.bus = bus
+        self.subscriptions = []
+
+    def subscribe(self, event_type, handler, weak=False, priority=0):
+        """Subscribe through the scope; see ``EventManager.subscribe``."""
+        self.bus.subscribe(event_type, handler, weak=weak, priority=priority)
+        self.subscriptions.append((event_type, handler))
+        return handler
+
+    def close(self):
+        """Unsubscribe everything subscribed through this scope."""
+        for event_type, handler in self.subscriptions:
+            self.bus.unsubscribe(event_type, handler)
+        self.subscriptions = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Event types published by the game
+RANDOM_EVENT = "random_event"  # event, effect, player
+BALANCE_CHANGED = "balance_changed"  # player; coalesced, see EventManager.coalesce
+PRELOAD_PROGRESS = "preload_progress"  # group, done, total; see ImageManager.queue_preload
+
+
+class _Batch:
+    """Context manager behind ``EventManager.batch`` (cheaper than a generator)."""
+    __slots__ = ('bus', 'outer')
+
+    def __init__(self, bus):
+        self.bus = bus
+
+    def __enter__(self):
+        self.outer = self.bus._batch is None
+        if self.outer:
+            self.bus._batch = {}
+        return self.bus
+
+    def __exit__(self, *exc):
+        if self.outer:
+            pending, self.bus._batch = self.bus._batch, None
+            self.bus._deliver(pending)
+
+
+# Backpressure policies for AsyncChannel
+DROP_OLDEST = "drop_oldest"  # a full buffer discards its oldest event
+BLOCK = "block"  # publishers wait for room (up to block_timeout, then the event is dropped)
+COALESCE = "coalesce"  # a pending event of the same type is replaced; else as DROP_OLDEST
+POLICIES = (DROP_OLDEST, BLOCK, COALESCE)
+
+
+class AsyncChannel:
+    """
+    Delivers events to slow listeners (analytics, logging, autosave) on a background
+    thread, so publishing never waits for them.
+
+    Events for the channel's handlers go into a buffer of at most ``maxsize`` events;
+    ``policy`` decides what happens when it is full. Handler errors are logged and do
+    not stop the channel.
+
+    Attributes:
+        delivered (int): Events handed to the channel's handlers.
+        dropped (int): Events discarded or replaced because the buffer was full.
+    """
+    def __init__(self, bus, maxsize=1024, policy=DROP_OLDEST, block_timeout=None):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.bus = bus
+        self.maxsize = maxsize
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.delivered = 0
+        self.dropped = 0
+        self._handlers = {}
+        self._forwarders = {}
+        self._buffer = OrderedDict()
+        self._order = itertools.count()
+        self._lock = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._thread = None
+
+    def subscribe(self, event_type, handler):
+        """Call ``handler`` on the channel's thread for every ``event_type`` event."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("AsyncChannel is closed")
+            self._handlers[event_type] = self._handlers.get(event_type, ()) + (handler,)
+            if event_type not in self._forwarders:
+                forward = self._forwarders[event_type] = lambda **kwargs: self._put(event_type, kwargs)
+                self.bus.subscribe(event_type, forward)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="event-channel", daemon=True)
+                self._thread.start()
+        return handler
+
+    def unsubscribe(self, event_type, handler):
+        with self._lock:
+            handlers = tuple(h for h in self._handlers.get(event_type, ()) if h != handler)
+            if handlers:
+                self._handlers[event_type] = handlers
+            else:
+                self._handlers.pop(event_type, None)
+                forward = self._forwarders.pop(event_type, None)
+                if forward is not None:
+                    self.bus.unsubscribe(event_type, forward)
+
+    def _put(self, event_type, kwargs):
+        with self._lock:
+            if self._closed:
+                return
+            buffer = self._buffer
+            if self.policy == COALESCE and event_type in buffer:
+                buffer[event_type] = (event_type, kwargs)  # keeps its place in line
+                self.dropped += 1
+                return
+            if len(buffer) >= self.maxsize:
+                if self.policy == BLOCK:
+                    if not self._lock.wait_for(lambda: len(buffer) < self.maxsize or self._closed,
+                                               self.block_timeout) or self._closed:
+                        self.dropped += 1
+                        return
+                else:
+                    buffer.popitem(last=False)
+                    self.dropped += 1
+            key = event_type if self.policy == COALESCE else next(self._order)
+            buffer[key] = (event_type, kwargs)
+            self._lock.notify_all()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if self._busy:  # counted here so flush() never sees it short
+                    self.delivered += 1
+                self._busy = False
+                self._lock.notify_all()
+                self._lock.wait_for(lambda: self._buffer or self._closed)
+                if not self._buffer:
+                    return  # closed and drained
+                _, (event_type, kwargs) = self._buffer.popitem(last=False)
+                handlers = self._handlers.get(event_type, ())
+                self._busy = True
+                self._lock.notify_all()  # room for blocked publishers
+            for handler in handlers:
+                try:
+                    handler(**kwargs)
+                except Exception:
+                    logger.exception(f"Async {event_type} handler failed")
+
+    def pending(self):
+        """Events waiting for the channel's thread."""
+        return len(self._buffer)
+
+    def flush(self, timeout=None):
+        """Wait until every buffered event has been handled; False on timeout."""
+        with self._lock:
+            return self._lock.wait_for(lambda: not self._buffer and not self._busy, timeout)
+
+    def close(self, timeout=None):
+        """Stop listening, deliver what is buffered and stop the thread."""
+        for event_type in list(self._forwarders):
+            self.bus.unsubscribe(event_type, self._forwarders.pop(event_type))
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 class EventManager:
     """
     Centralized event manager for handling game and UI events using a publish/subscribe model.
 
+    Events can be delivered three ways: ``publish`` calls the handlers at once,
+    ``post`` queues the event until ``dispatch_pending`` (run once per frame by the
+    GUIManager), and inside ``with batch():`` published events are held back and
+    delivered when the block ends. Queued and batched events of a type registered
+    with ``coalesce`` collapse into the latest one.
+
     Attributes:
-        _subscribers (dict): Dictionary mapping event types to lists of handler functions.
+        _subscribers (dict): Dictionary mapping event types to lists of
+            ``(-priority, order, handler)``, highest priority first. Weak subscriptions
+            are stored as ``_WeakHandler`` entries that remove themselves once the
+            handler's owner is garbage collected.
+        _dispatch (dict): Event type to the tuple of handlers ``publish`` calls,
+            rebuilt whenever the subscribers change.
     """
     def __init__(self):
         """Initialize the EventManager with an empty subscriber dictionary."""
         self._subscribers = {}
+        self._dispatch = {}
+        self._order = itertools.count()
+        self._coalesced = set()
+        self._queue = {}
+        self._batch = None
 
-    def subscribe(self, event_type, handler):
-        """Subscribe a handler to a specific event type."""
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(handler)
+    def _compile(self, event_type):
+        handlers = self._subscribers.get(event_type)
+        if handlers:
+            self._dispatch[event_type] = tuple(entry for _, _, entry in handlers)
+        else:
+            self._subscribers.pop(event_type, None)
+            self._dispatch.pop(event_type, None)
+
+    def subscribe(self, event_type, handler, weak=False, priority=0):
+        """
+        Subscribe a handler to a specific event type.
+
+        Args:
+            event_type (str): Event to listen for.
+            handler (callable): Called with the event data as keyword arguments.
+            weak (bool): Hold the handler (for a bound method, its object) weakly so the
+                subscription ends when the owner is garbage collected.
+            priority (int): Handlers with a higher priority are called first; equal
+                priorities run in subscription order.
+        """
+        handlers = self._subscribers.setdefault(event_type, [])
+        if weak:
+            entry = _WeakHandler(handler, lambda _: self._discard(event_type, entry))
+        else:
+            entry = handler
+        bisect.insort(handlers, (-priority, next(self._order), entry))
+        self._compile(event_type)
+        return handler
+
+    def _discard(self, event_type, entry):
+        handlers = self._subscribers.get(event_type, ())
+        for i, item in enumerate(handlers):
+            if item[2] is entry:
+                del handlers[i]
+                self._compile(event_type)
+                return
 
     def unsubscribe(self, event_type, handler):
-        """Unsubscribe a handler from a specific event type."""
-        if event_type in self._subscribers:
-            self._subscribers[event_type].remove(handler)
-            if not self._subscribers[event_type]:
-                del self._subscribers[event_type]
+        """Unsubscribe a handler from a specific event type (a no-op if it is not subscribed)."""
+        for _, _, entry in self._subscribers.get(event_type, ()):
+            if entry is handler or _resolve(entry) == handler:
+                self._discard(event_type, entry)
+                return
+
+    def wants(self, event_type):
+        """Whether anyone listens for ``event_type``; lets hot paths skip building events."""
+        return event_type in self._dispatch
+
+    def coalesce(self, event_type, enabled=True):
+        """Keep only the latest pending ``event_type`` event in queues and batches."""
+        if enabled:
+            self._coalesced.add(event_type)
+        else:
+            self._coalesced.discard(event_type)
+
+    def scope(self):
+        """A new ``EventScope`` on this manager."""
+        return EventScope(self)
+
+    def channel(self, maxsize=1024, policy=DROP_OLDEST, block_timeout=None):
+        """A new ``AsyncChannel`` for listeners that must not run on the publishing thread."""
+        return AsyncChannel(self, maxsize, policy, block_timeout)
+
+    @contextmanager
+    def subscription(self, event_type, handler, weak=False, priority=0):
+        """Subscribe ``handler`` for the duration of a ``with`` block."""
+        self.subscribe(event_type, handler, weak=weak, priority=priority)
+        try:
+            yield handler
+        finally:
+            self.unsubscribe(event_type, handler)
+
+    def subscriber_count(self, event_type=None):
+        """Live subscribers for ``event_type``, or a dict of counts per event type."""
+        if event_type is not None:
+            return sum(_resolve(e) is not None for e in self._dispatch.get(event_type, ()))
+        return {name: self.subscriber_count(name) for name in self._dispatch}
+
+    def _hold(self, pending, event_type, kwargs):
+        # Coalesced events share one slot, which keeps its place in the queue
+        key = event_type if event_type in self._coalesced else next(self._order)
+        pending[key] = (event_type, kwargs)
+
+    def _deliver(self, pending):
+        for event_type, kwargs in pending.values():
+            self.publish(event_type, **kwargs)
+        return len(pending)
 
     def publish(self, event_type, **kwargs):
         """Publish an event to all subscribed handlers, passing event data as kwargs."""
-        if event_type in self._subscribers:
-            for handler in self._subscribers[event_type]:
-                handler(**kwargs)
+        handlers = self._dispatch.get(event_type)
+        if not handlers:
+            return
+        if self._batch is not None:
+            self._hold(self._batch, event_type, kwargs)
+            return
+        # A tuple: handlers may subscribe or unsubscribe while being called
+        for handler in handlers:
+            handler(**kwargs)
+
+    def post(self, event_type, **kwargs):
+        """Queue an event for the next ``dispatch_pending``. Dropped when nobody listens."""
+        if event_type in self._dispatch:
+            self._hold(self._queue, event_type, kwargs)
+
+    def has_pending(self):
+        return bool(self._queue)
+
+    def dispatch_pending(self):
+        """Deliver the queued events in order; returns how many were delivered."""
+        pending, self._queue = self._queue, {}
+        return self._deliver(pending)
+
+    def batch(self):
+        """Hold events published inside a ``with`` block and deliver them (coalesced)
+        when the outermost block ends."""
+        return _Batch(self)
 
 # Singleton instance for global use
 EventBus = EventManager()
+EventBus.coalesce(BALANCE_CHANGED)
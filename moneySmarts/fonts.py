@@ -0,0 +1,155 @@
+"""
+Font cache shared by every screen and UI element.
+
+``pygame.font.SysFont`` searches the system font list on each call and
+``pygame.font.Font`` re-reads the file, so fonts are created once per
+(family or path, size, bold) and reused afterwards. The cache empties itself on
+``pygame.quit()``: font objects must not outlive the font module.
+
+Rendered text is cached too: ``render_text`` keeps a bounded LRU of surfaces
+keyed by (font, text, antialias, color, background), and ``CachedText`` holds a
+single label (cash, net worth) that is re-rendered only when its text changes.
+Cached surfaces are shared, so callers must not draw on them.
+"""
+import logging
+from collections import OrderedDict
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FAMILY = 'Arial'
+TEXT_CACHE_SIZE = 1024  # Rendered strings kept by render_text
+
+
+class FontCache:
+    def __init__(self):
+        self._fonts = {}
+
+    def _store(self, key, font):
+        if not self._fonts:
+            # Quit hooks run once, so register again each time the cache refills
+            pygame.register_quit(self.clear)
+        self._fonts[key] = font
+        return font
+
+    def get(self, size, bold=False, family=DEFAULT_FAMILY):
+        """System font ``family`` at ``size`` (cached)."""
+        key = (family, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._store(key, pygame.font.SysFont(family, size, bold=bold))
+        return font
+
+    def load(self, path, size, bold=False):
+        """Font file at ``path`` (cached); falls back to the default system font
+        when the file cannot be loaded."""
+        key = (path, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            try:
+                font = pygame.font.Font(path, size)
+                font.set_bold(bold)
+            except (OSError, pygame.error) as e:  # missing or unreadable file
+                logger.debug(f"Font load failed {path}: {e}")
+                font = self.get(size, bold)
+            self._store(key, font)
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+        text_cache.clear()
+
+    def __len__(self):
+        return len(self._fonts)
+
+
+def _color_key(color):
+    # pygame.Color is unhashable
+    return color if color is None or isinstance(color, (tuple, str)) else tuple(color)
+
+
+class TextCache:
+    """Bounded LRU of rendered text surfaces."""
+    def __init__(self, maxsize=TEXT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """``font.render(text, antialias, color, background)``, cached."""
+        key = (font, text, antialias, _color_key(color), _color_key(background))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+class CachedText:
+    """
+    A label whose text changes rarely (cash, net worth). It keeps one surface and
+    re-renders only when the text or color changes, without filling the LRU with
+    every value the label has shown.
+    """
+    def __init__(self, font, color=(0, 0, 0), antialias=True):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self._key = None
+        self._surface = None
+
+    def render(self, text, color=None):
+        color = self.color if color is None else color
+        key = (text, _color_key(color))
+        if key != self._key:
+            self._surface = self.font.render(text, self.antialias, color)
+            self._key = key
+        return self._surface
+
+
+font_cache = FontCache()
+text_cache = TextCache()
+
+
+def get_font(size, bold=False, family=DEFAULT_FAMILY):
+    """Shortcut for ``font_cache.get``."""
+    return font_cache.get(size, bold, family)
+
+
+def load_font(path, size, bold=False):
+    """Shortcut for ``font_cache.load``."""
+    return font_cache.load(path, size, bold)
+
+
+def render_text(font, text, antialias, color, background=None):
+    """Shortcut for ``text_cache.render`` (same arguments as ``Font.render``)."""
+    return text_cache.render(font, text, antialias, color, background)
+
+
+__all__ = [
+    "CachedText",
+    "FontCache",
+    "TextCache",
+    "font_cache",
+    "get_font",
+    "load_font",
+    "render_text",
+    "text_cache",
+]
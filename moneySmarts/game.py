@@ -1,41 +1,102 @@
+import functools
 import os
 import random
 import pickle
 import logging
 import sys  # added for interactivity check
 from moneySmarts.models import Player, BankAccount, Card, Loan, Asset
-from moneySmarts.event_manager import EventBus
+from moneySmarts.event_manager import EventBus, RANDOM_EVENT, BALANCE_CHANGED
 from moneySmarts.config_manager import Config
 from moneySmarts.exceptions import GameError, BankAccountError
 from moneySmarts.utils import compute_net_worth
+from moneySmarts.money import to_cents, to_dollars
 from moneySmarts.quest import QuestManager  # NEW
+from moneySmarts.timeseries import TimeSeries
 
 SAVEGAME_VERSION = 1
 
+RANDOM_EVENT_CHANCE = 0.3  # Monthly chance of a random event
+FAMILY_PLANNING_CHANCE = 0.1  # Monthly chance of a family planning prompt once eligible
+
+# Pay, bill and utility amounts repeat month after month: convert each one to cents once
+_monthly_cents = functools.lru_cache(maxsize=256)(to_cents)
+
 # --- Random event effect helpers ---
-def tax_refund_effect():
-    return random.randint(100, 1000)
+# Each helper draws from ``rng`` (a random.Random or the random module itself).
+def tax_refund_effect(rng=random):
+    return rng.randint(100, 1000)
 
-def birthday_gift_effect():
-    return random.randint(20, 200)
+def birthday_gift_effect(rng=random):
+    return rng.randint(20, 200)
 
-def found_money_effect():
-    return random.randint(5, 50)
+def found_money_effect(rng=random):
+    return rng.randint(5, 50)
 
 def bonus_effect(game):
-    return int(game.player.salary * random.uniform(0.01, 0.1)) if game.player.salary else 0
+    return int(game.player.salary * game.rng.uniform(0.01, 0.1)) if game.player.salary else 0
 
 def car_repair_effect(game):
-    return -random.randint(100, 2000) if any(a.asset_type == "Car" for a in game.player.assets) else 0
+    return -game.rng.randint(100, 2000) if any(a.asset_type == "Car" for a in game.player.assets) else 0
 
-def medical_bill_effect():
-    return -random.randint(50, 5000)
+def medical_bill_effect(rng=random):
+    return -rng.randint(50, 5000)
 
 def lost_wallet_effect(game):
     return -min(50, game.player.cash)
 
-def phone_repair_effect():
-    return -random.randint(50, 300)
+def phone_repair_effect(rng=random):
+    return -rng.randint(50, 300)
+
+# --- Life event option tables ---
+JOB_OPTIONS = {
+    "High School Graduate": [
+        {"title": "Retail Associate", "salary": 25000},
+        {"title": "Food Service Worker", "salary": 22000},
+        {"title": "Warehouse Worker", "salary": 28000},
+    ],
+    "Trade School": [
+        {"title": "Electrician Apprentice", "salary": 35000},
+        {"title": "Plumber Assistant", "salary": 32000},
+        {"title": "HVAC Technician", "salary": 38000},
+    ],
+    "College Graduate": [
+        {"title": "Entry-Level Accountant", "salary": 50000},
+        {"title": "Marketing Coordinator", "salary": 45000},
+        {"title": "Software Developer", "salary": 65000},
+    ],
+}
+
+CAR_OPTIONS = [
+    {"name": "Used Economy Car", "value": 5000},
+    {"name": "New Economy Car", "value": 18000},
+    {"name": "Used Luxury Car", "value": 15000},
+    {"name": "New Luxury Car", "value": 35000},
+]
+
+HOUSE_OPTIONS = [
+    {"name": "Small Starter Home", "value": 150000},
+    {"name": "Mid-size Family Home", "value": 250000},
+    {"name": "Large Luxury Home", "value": 500000},
+    {"name": "Urban Condo", "value": 200000},
+]
+
+def auto_loan_rate(credit_score):
+    """Annual auto loan rate offered for a credit score."""
+    if credit_score >= 700:
+        return 0.03
+    if credit_score >= 650:
+        return 0.05
+    return 0.08
+
+def mortgage_rate(credit_score):
+    """Annual 30-year mortgage rate offered for a credit score."""
+    if credit_score >= 750:
+        return 0.035
+    if credit_score >= 700:
+        return 0.04
+    if credit_score >= 650:
+        return 0.045
+    return 0.055
 
 # --- Console helpers ---
 def clear_screen():
@@ -54,7 +115,10 @@ def get_choice(prompt, choices):
     return choices[sel-1]
 
 class Game:
-    def __init__(self):
+    def __init__(self, rng=None, record_history=False):
+        # Source of randomness for events and asset aging; a random.Random gives
+        # the game its own reproducible stream, the default shares the random module.
+        self.rng = rng if rng is not None else random
         self.player = None
         self.current_month = 1
         self.current_year = 0  # offset from 2023
@@ -65,6 +129,10 @@ class Game:
         self.quests = QuestManager(self)  # NEW quest manager
         self.quest_notifications = []  # recent completed quest titles
         self.met_mentor = False  # NPC mentor interaction flag
+        # One row per simulated month, kept only when asked for (charts, exports)
+        self.history = TimeSeries() if record_history else None
+        # Monthly living costs in cents by (year, house, car, family size)
+        self._living_cents = {}
 
     # Convenience wrapper so quests can call net worth
     def compute_net_worth(self):
@@ -76,25 +144,49 @@ class Game:
     def initialize_events(self):
         return {
             "positive": [
-                {"name": "Tax Refund", "description": "You received a tax refund!", "cash_effect": tax_refund_effect},
-                {"name": "Birthday Gift", "description": "You received money as a birthday gift!", "cash_effect": birthday_gift_effect},
-                {"name": "Found Money", "description": "You found money on the ground!", "cash_effect": found_money_effect},
+                {"name": "Tax Refund", "description": "You received a tax refund!", "cash_effect": lambda: tax_refund_effect(self.rng)},
+                {"name": "Birthday Gift", "description": "You received money as a birthday gift!", "cash_effect": lambda: birthday_gift_effect(self.rng)},
+                {"name": "Found Money", "description": "You found money on the ground!", "cash_effect": lambda: found_money_effect(self.rng)},
                 {"name": "Bonus", "description": "You received a bonus at work!", "cash_effect": lambda: bonus_effect(self)},
             ],
             "negative": [
                 {"name": "Car Repair", "description": "Your car needs repairs.", "cash_effect": lambda: car_repair_effect(self)},
-                {"name": "Medical Bill", "description": "Unexpected medical expenses.", "cash_effect": medical_bill_effect},
+                {"name": "Medical Bill", "description": "Unexpected medical expenses.", "cash_effect": lambda: medical_bill_effect(self.rng)},
                 {"name": "Lost Wallet", "description": "You lost your wallet!", "cash_effect": lambda: lost_wallet_effect(self)},
-                {"name": "Phone Repair", "description": "Phone screen cracked.", "cash_effect": phone_repair_effect},
+                {"name": "Phone Repair", "description": "Phone screen cracked.", "cash_effect": lambda: phone_repair_effect(self.rng)},
             ]
         }
 
+    # --- Console I/O hooks (overridden by headless engines) ---
+    def notify(self, message=""):
+        """Show a text-mode message to the player."""
+        print(message)
+
+    def clear(self):
+        """Clear the text-mode console."""
+        clear_screen()
+
+    def pause(self, prompt="\nPress Enter to continue..."):
+        """Wait for the player to acknowledge a text-mode message."""
+        input(prompt)
+
+    def choose(self, decision, prompt, options, labels=None):
+        """Ask the player to pick one of ``options`` and return the chosen option.
+
+        ``decision`` names the choice being made (e.g. 'education', 'car') so
+        non-interactive drivers can answer it without parsing the prompt.
+        ``labels`` are the strings shown for each option (defaults to str(option)).
+        """
+        labels = list(labels) if labels is not None else [str(o) for o in options]
+        picked = get_choice(prompt, labels)
+        return options[labels.index(picked)]
+
     # --- Text mode start ---
     def start_game(self):
-        clear_screen()
-        print("="*60)
-        print("WELCOME TO MONEY SMARTZ")
-        print("="*60)
+        self.clear()
+        self.notify("="*60)
+        self.notify("WELCOME TO MONEY SMARTZ")
+        self.notify("="*60)
         try:
             name = input("Enter your name: ").strip()
             if not name:
@@ -102,34 +194,60 @@ class Game:
             self.player = Player(name)
         except Exception as e:
             logging.error(f"Init error: {e}")
-            print("Error starting game.")
+            self.notify("Error starting game.")
             return
-        print(f"Welcome, {self.player.name}! You're 16 and beginning your financial journey.")
+        self.notify(f"Welcome, {self.player.name}! You're 16 and beginning your financial journey.")
+        self.open_starter_accounts()
+        self.pause("Press Enter to begin...")
+        self.game_loop()
+
+    def open_starter_accounts(self):
+        """Offer the 16-year-old a checking account (with a $50 starter deposit) and a debit card."""
         try:
-            if get_choice("Open a bank account?", ["Yes", "No"]) == "Yes":
+            if self.choose("open_bank_account", "Open a bank account?", ["Yes", "No"]) == "Yes":
                 self.player.bank_account = BankAccount()
                 self.player.bank_account.deposit(50)
-                print("Opened checking with $50 start.")
-                if get_choice("Get a debit card?", ["Yes", "No"]) == "Yes":
+                self.notify("Opened checking with $50 start.")
+                if self.choose("debit_card", "Get a debit card?", ["Yes", "No"]) == "Yes":
                     self.player.debit_card = Card("Debit")
-                    print("Debit card issued.")
+                    self.notify("Debit card issued.")
         except BankAccountError as e:
             logging.error(f"Bank error: {e}")
-        input("Press Enter to begin...")
-        self.game_loop()
 
     # --- Core loops ---
     def game_loop(self):
         while not self.game_over:
-            self.advance_month()
-            if random.random() < 0.3:
-                self.trigger_random_event()
-            self.check_life_stage_events()
+            self.simulate_month()
             self.display_status()
             self.get_player_action()
             if self.player.age >= Config.get("retirement_age", 65):
                 self.end_game("retirement")
 
+    def simulate_month(self):
+        """Advance one month, then roll the monthly random event and check life-stage events."""
+        self.advance_month()
+        if self.rng.random() < RANDOM_EVENT_CHANCE:
+            self.trigger_random_event()
+        self.check_life_stage_events()
+
+    def fast_forward(self, months, stop_on=None):
+        """
+        Simulate up to ``months`` months in one call: a ``simulate_month`` loop with an
+        early stop, not a skip-ahead, so every month costs the same as stepping.
+
+        ``stop_on(game)`` is checked after each month; returning True stops early.
+        Returns the number of months advanced. Life events use the text-mode hooks,
+        so this is for text and headless games (the GUI keeps stepping through
+        ``GameScreen.continue_to_next_month``).
+        """
+        done = 0
+        while done < months and not self.game_over:
+            self.simulate_month()
+            done += 1
+            if stop_on is not None and stop_on(self):
+                break
+        return done
+
     def advance_month(self):
         self.current_month += 1
         if self.current_month > 12:
@@ -139,427 +257,427 @@ class Game:
             if self.player.bank_account and self.player.bank_account.account_type == "Savings":
                 self.player.bank_account.apply_interest()
             for asset in self.player.assets:
-                asset.age_asset()
+                asset.age_asset(self.rng)
         # Monthly investment returns
         for inv in self.player.investments:
             inv.apply_monthly_return()
         self.process_monthly_finances()
+        if self.history is not None:
+            self.history.record(self)
 
     def process_monthly_finances(self):
+        """Pay the month's income, debts and bills. Balance-changed events raised on the
+        way reach subscribers once, when the month is done."""
+        if not EventBus.wants(BALANCE_CHANGED):
+            self._process_monthly_finances(False)  # nobody listens: no event overhead
+            return
+        with EventBus.batch():
+            self._process_monthly_finances(True)
+
+    def _balance_changed(self):
+        EventBus.publish(BALANCE_CHANGED, player=self.player)
+
+    def _process_monthly_finances(self, announce):
+        # Works in integer cents on the balance slots: every amount is converted once.
+        player = self.player
+        bank = player.bank_account
+        card = player.credit_card
+        card_limit = card._limit if card else 0
+        cash = player._cash
         # Income
-        if self.player.job:
-            monthly_income = self.player.salary / 12
-            self.player.cash += monthly_income
-            if self.player.bank_account:
-                auto = monthly_income * 0.8
-                self.player.bank_account.deposit(auto)
-                self.player.cash -= auto
+        if player.job:
+            monthly_income = _monthly_cents(player.salary / 12)
+            cash += monthly_income
+            if bank:
+                auto = round(monthly_income * 0.8)
+                bank.deposit_cents(auto)
+                cash -= auto
+            if announce:
+                self._balance_changed()
         # Loans
-        for loan in self.player.loans:
-            pay = loan.monthly_payment
-            if self.player.cash >= pay:
-                self.player.cash -= pay
-                loan.make_payment(pay)
-            elif self.player.bank_account and self.player.bank_account.balance >= pay:
-                self.player.bank_account.withdraw(pay)
-                loan.make_payment(pay)
-            elif self.player.credit_card and self.player.credit_card.balance + pay <= self.player.credit_card.limit:
-                self.player.credit_card.charge(pay)
-                loan.make_payment(pay)
+        for loan in player.loans:
+            pay = loan._monthly_payment
+            if cash >= pay:
+                cash -= pay
+                loan.make_payment_cents(pay)
+            elif bank and bank._balance >= pay:
+                bank.withdraw_cents(pay)
+                loan.make_payment_cents(pay)
+            elif card and card._balance + pay <= card_limit:
+                card.charge_cents(pay)
+                loan.make_payment_cents(pay)
             else:
-                self.player.credit_score -= 30
-                print(f"Missed {loan.loan_type} payment.")
+                player.credit_score -= 30
+                self.notify(f"Missed {loan.loan_type} payment.")
+            if announce:
+                self._balance_changed()
         # Credit card minimum
-        if self.player.credit_card and self.player.credit_card.balance > 0:
-            min_pay = max(25, self.player.credit_card.balance * 0.05)
-            if self.player.cash >= min_pay:
-                self.player.cash -= min_pay
-                self.player.credit_card.pay(min_pay)
-            elif self.player.bank_account and self.player.bank_account.balance >= min_pay:
-                self.player.bank_account.withdraw(min_pay)
-                self.player.credit_card.pay(min_pay)
+        if card and card._balance > 0:
+            min_pay = to_cents(max(25, to_dollars(card._balance) * 0.05))
+            if cash >= min_pay:
+                cash -= min_pay
+                card.pay_cents(min_pay)
+            elif bank and bank._balance >= min_pay:
+                bank.withdraw_cents(min_pay)
+                card.pay_cents(min_pay)
             else:
-                self.player.credit_score -= 50
-                print("Missed credit card payment.")
+                player.credit_score -= 50
+                self.notify("Missed credit card payment.")
+            if announce:
+                self._balance_changed()
         # Living expenses
-        living = Config.get("base_living_expenses", 1000)
-        if any(a.asset_type == "House" for a in self.player.assets):
-            living += Config.get("homeowner_expenses", 500)
-        if any(a.asset_type == "Car" for a in self.player.assets):
-            living += Config.get("car_expenses", 200)
-        if self.player.family:
-            living += Config.get("family_expenses_per_member", 500) * len(self.player.family)
-        infl = Config.get("inflation_rate", 0.02)
-        living *= (1 + infl) ** self.current_year
-        if self.player.cash >= living:
-            self.player.cash -= living
-        elif self.player.bank_account and self.player.bank_account.balance >= living:
-            self.player.bank_account.withdraw(living)
-        elif self.player.credit_card and self.player.credit_card.balance + living <= self.player.credit_card.limit:
-            self.player.credit_card.charge(living)
+        living = self._living_expenses_cents()
+        if cash >= living:
+            cash -= living
+        elif bank and bank._balance >= living:
+            bank.withdraw_cents(living)
+        elif card and card._balance + living <= card_limit:
+            card.charge_cents(living)
         else:
-            self.player.credit_score -= 20
-            print("Could not cover living expenses.")
+            player.credit_score -= 20
+            self.notify("Could not cover living expenses.")
+        if announce:
+            self._balance_changed()
         # Recurring bills
-        for bill in self.player.recurring_bills:
-            amt = bill['amount']
+        for bill in player.recurring_bills:
+            amt = _monthly_cents(bill['amount'])
             paid = False
             if bill.get('source') == 'bank_or_credit':
-                if self.player.bank_account and self.player.bank_account.balance >= amt:
-                    self.player.bank_account.withdraw(amt); paid = True
-                elif self.player.credit_card and self.player.credit_card.balance + amt <= self.player.credit_card.limit:
-                    self.player.credit_card.charge(amt); paid = True
-            if not paid and self.player.cash >= amt:
-                self.player.cash -= amt; paid = True
+                if bank and bank._balance >= amt:
+                    bank.withdraw_cents(amt); paid = True
+                elif card and card._balance + amt <= card_limit:
+                    card.charge_cents(amt); paid = True
+            if not paid and cash >= amt:
+                cash -= amt; paid = True
             if not paid:
-                self.player.credit_score -= 10
-                print(f"Missed bill: {bill['name']}")
+                player.credit_score -= 10
+                self.notify(f"Missed bill: {bill['name']}")
+            if announce:
+                self._balance_changed()
         # Utilities
-        for util in self.player.utility_bills:
-            amt = util['amount']; paid = False
-            if self.player.bank_account and self.player.bank_account.balance >= amt:
-                self.player.bank_account.withdraw(amt); paid = True
-            elif self.player.credit_card and self.player.credit_card.balance + amt <= self.player.credit_card.limit:
-                self.player.credit_card.charge(amt); paid = True
-            if not paid and self.player.cash >= amt:
-                self.player.cash -= amt; paid = True
+        for util in player.utility_bills:
+            amt = _monthly_cents(util['amount']); paid = False
+            if bank and bank._balance >= amt:
+                bank.withdraw_cents(amt); paid = True
+            elif card and card._balance + amt <= card_limit:
+                card.charge_cents(amt); paid = True
+            if not paid and cash >= amt:
+                cash -= amt; paid = True
             if not paid:
-                self.player.credit_score -= 5
-                print(f"Missed utility: {util['name']}")
+                player.credit_score -= 5
+                self.notify(f"Missed utility: {util['name']}")
+            if announce:
+                self._balance_changed()
+        player._cash = cash
         # After finances, check quest progress
+        self.check_quests()
+
+    def check_quests(self):
         newly = self.quests.check_all()
         if newly:
             self.quest_notifications.extend([f"Quest Completed: {q.title}" for q in newly])
             # limit backlog
             self.quest_notifications = self.quest_notifications[-5:]
 
+    def monthly_living_expenses(self):
+        """Base living costs plus home, car and family costs, inflated to the current year."""
+        return to_dollars(self._living_expenses_cents())
+
+    def _living_expenses_cents(self):
+        # The costs only change with the year and the household, so each combination
+        # is priced (and the config read) once per game
+        player = self.player
+        has_house = has_car = False
+        for a in player.assets:
+            if a.asset_type == "House":
+                has_house = True
+            elif a.asset_type == "Car":
+                has_car = True
+        key = (self.current_year, has_house, has_car, len(player.family))
+        cents = self._living_cents.get(key)
+        if cents is None:
+            living = Config.get("base_living_expenses", 1000)
+            if has_house:
+                living += Config.get("homeowner_expenses", 500)
+            if has_car:
+                living += Config.get("car_expenses", 200)
+            if player.family:
+                living += Config.get("family_expenses_per_member", 500) * len(player.family)
+            infl = Config.get("inflation_rate", 0.02)
+            cents = self._living_cents[key] = to_cents(living * (1 + infl) ** self.current_year)
+        return cents
+
     # --- Random events ---
     def trigger_random_event(self):
-        etypes = [t for t in ["positive", "negative"] if self.events.get(t) and len(self.events[t])]
+        etypes = [t for t in ("positive", "negative") if self.events.get(t)]
         if not etypes:
             return  # no events defined
-        etype = random.choice(etypes)
+        etype = self.rng.choice(etypes)
         event_list = self.events[etype]
-        event = random.choice(event_list)
+        event = self.rng.choice(event_list)
         effect = event['cash_effect']()
-        # Apply effect (single application) with source priority for negatives
+        # Apply effect (single application) with source priority for negatives, in cents
+        player = self.player
         if effect > 0:
-            self.player.cash += effect
+            player._cash += to_cents(effect)
         elif effect < 0:
-            cost = -effect
-            if self.player.cash >= cost:
-                self.player.cash -= cost
-            elif self.player.bank_account and self.player.bank_account.balance >= cost:
-                self.player.bank_account.withdraw(cost)
-            elif self.player.credit_card and self.player.credit_card.balance + cost <= self.player.credit_card.limit:
-                self.player.credit_card.charge(cost)
+            cost = to_cents(-effect)
+            bank = player.bank_account
+            card = player.credit_card
+            if player._cash >= cost:
+                player._cash -= cost
+            elif bank and bank._balance >= cost:
+                bank.withdraw_cents(cost)
+            elif card and card._balance + cost <= card._limit:
+                card.charge_cents(cost)
             else:
-                self.player.credit_score -= 15
-        EventBus.publish("random_event", event=event, effect=effect, player=self.player)
+                player.credit_score -= 15
+        EventBus.publish(RANDOM_EVENT, event=event, effect=effect, player=self.player)
         if effect == 0:
             return
+        self._balance_changed()
         if self.gui_manager is not None:
             from moneySmarts.screens.random_event_screens import RandomEventScreen
-            self.gui_manager.set_screen(RandomEventScreen(self, event, effect))
+            self.gui_manager.push(RandomEventScreen(self, event, effect))
             return
-        clear_screen()
-        print("\n!"*30)
-        print(f"EVENT: {event['name']}")
-        print(event['description'])
+        self.show_random_event(event, effect)
+
+    def show_random_event(self, event, effect):
+        """Present an applied random event in text mode."""
+        self.clear()
+        self.notify("\n!"*30)
+        self.notify(f"EVENT: {event['name']}")
+        self.notify(event['description'])
         if effect > 0:
-            print(f"You gained ${effect}")
+            self.notify(f"You gained ${effect}")
         else:
-            print(f"You paid ${-effect}")
-        print("!"*30)
+            self.notify(f"You paid ${-effect}")
+        self.notify("!"*30)
         # Only prompt for Enter if running interactively (avoid pytest capture OSError)
         if sys.stdin and sys.stdin.isatty():
             try:
-                input("Press Enter...")
+                self.pause("Press Enter...")
             except Exception:
                 pass
 
     # --- Life events (text) ---
     def check_life_stage_events(self):
-        if self.player.age == 18 and self.player.education == "High School":
+        player = self.player
+        age = player.age
+        if age == 18 and player.education == "High School":
             self.high_school_graduation_event()
-        if self.player.age == 22 and self.player.education == "College (In Progress)":
+        if age == 22 and player.education == "College (In Progress)":
             self.college_graduation_event()
-        if self.player.age == 22 and not self.player.job and self.player.education != "College (In Progress)":
+        if age == 22 and not player.job and player.education != "College (In Progress)":
             self.job_opportunity_event()
-        if self.player.age == 20 and not any(a.asset_type == "Car" for a in self.player.assets):
+        if age == 20 and not any(a.asset_type == "Car" for a in player.assets):
             self.car_purchase_opportunity()
-        if self.player.age == 30 and not any(a.asset_type == "House" for a in self.player.assets) and self.player.job:
+        if age == 30 and not any(a.asset_type == "House" for a in player.assets) and player.job:
             self.house_purchase_opportunity()
-        if self.player.age >= 28 and not self.player.family and self.player.job and random.random() < 0.1:
+        if age >= 28 and not player.family and player.job and self.rng.random() < FAMILY_PLANNING_CHANCE:
             self.family_planning_opportunity()
 
     def high_school_graduation_event(self):
-        clear_screen()
-        print("\n" + "=" * 60)
-        print("LIFE EVENT: HIGH SCHOOL GRADUATION")
-        print("=" * 60)
-        print("\nCongratulations! You've graduated from high school.")
-        print("It's time to make some important decisions about your future.")
+        self.clear()
+        self.notify("\n" + "=" * 60)
+        self.notify("LIFE EVENT: HIGH SCHOOL GRADUATION")
+        self.notify("=" * 60)
+        self.notify("\nCongratulations! You've graduated from high school.")
+        self.notify("It's time to make some important decisions about your future.")
 
         choices = ["Go to college (costs $20,000/year for 4 years)",
                   "Go to trade school (costs $10,000 for 2 years)",
                   "Start working full-time"]
 
-        choice = get_choice("What would you like to do?", choices)
+        choice = self.choose("education", "What would you like to do?", choices)
 
         if choice == choices[0]:  # College
-            print("\nYou've decided to go to college. This is a significant investment")
-            print("in your future that could lead to higher-paying jobs.")
+            self.notify("\nYou've decided to go to college. This is a significant investment")
+            self.notify("in your future that could lead to higher-paying jobs.")
 
             # Check if player can afford college
             annual_cost = 20000
             if self.player.cash >= annual_cost:
-                print(f"\nYou pay the first year's tuition of ${annual_cost} in cash.")
+                self.notify(f"\nYou pay the first year's tuition of ${annual_cost} in cash.")
                 self.player.cash -= annual_cost
             elif self.player.bank_account and self.player.bank_account.balance >= annual_cost:
-                print(f"\nYou pay the first year's tuition of ${annual_cost} from your bank account.")
+                self.notify(f"\nYou pay the first year's tuition of ${annual_cost} from your bank account.")
                 self.player.bank_account.withdraw(annual_cost)
             else:
                 # Need a student loan
-                print("\nYou don't have enough money to pay for college upfront.")
-                print("You'll need to take out student loans.")
+                self.notify("\nYou don't have enough money to pay for college upfront.")
+                self.notify("You'll need to take out student loans.")
 
                 loan_amount = 80000  # 4 years of college
                 loan = Loan("Student", loan_amount, 0.05, 20)  # 5% interest, 20-year term
                 self.player.loans.append(loan)
 
-                print(f"\nYou've taken out a student loan for ${loan_amount}.")
-                print(f"Your monthly payment will be ${loan.monthly_payment:.2f} for 20 years.")
+                self.notify(f"\nYou've taken out a student loan for ${loan_amount}.")
+                self.notify(f"Your monthly payment will be ${loan.monthly_payment:.2f} for 20 years.")
 
             self.player.education = "College (In Progress)"
-            print("\nYou're now a college student! Your education will take 4 years.")
+            self.notify("\nYou're now a college student! Your education will take 4 years.")
 
         elif choice == choices[1]:  # Trade school
-            print("\nYou've decided to go to trade school. This is a practical choice")
-            print("that will give you specific skills for certain careers.")
+            self.notify("\nYou've decided to go to trade school. This is a practical choice")
+            self.notify("that will give you specific skills for certain careers.")
 
             # Check if player can afford trade school
             cost = 10000
             if self.player.cash >= cost:
-                print(f"\nYou pay the trade school tuition of ${cost} in cash.")
+                self.notify(f"\nYou pay the trade school tuition of ${cost} in cash.")
                 self.player.cash -= cost
             elif self.player.bank_account and self.player.bank_account.balance >= cost:
-                print(f"\nYou pay the trade school tuition of ${cost} from your bank account.")
+                self.notify(f"\nYou pay the trade school tuition of ${cost} from your bank account.")
                 self.player.bank_account.withdraw(cost)
             else:
                 # Need a student loan
-                print("\nYou don't have enough money to pay for trade school upfront.")
-                print("You'll need to take out a student loan.")
+                self.notify("\nYou don't have enough money to pay for trade school upfront.")
+                self.notify("You'll need to take out a student loan.")
 
                 loan = Loan("Student", cost, 0.05, 10)  # 5% interest, 10-year term
                 self.player.loans.append(loan)
 
-                print(f"\nYou've taken out a student loan for ${cost}.")
-                print(f"Your monthly payment will be ${loan.monthly_payment:.2f} for 10 years.")
+                self.notify(f"\nYou've taken out a student loan for ${cost}.")
+                self.notify(f"Your monthly payment will be ${loan.monthly_payment:.2f} for 10 years.")
 
             self.player.education = "Trade School"
-            print("\nYou're now a trade school student! Your education will take 2 years.")
+            self.notify("\nYou're now a trade school student! Your education will take 2 years.")
 
         else:  # Start working
-            print("\nYou've decided to start working full-time without further education.")
-            print("You'll start with entry-level positions, but can work your way up.")
+            self.notify("\nYou've decided to start working full-time without further education.")
+            self.notify("You'll start with entry-level positions, but can work your way up.")
 
             self.player.education = "High School Graduate"
             self.job_opportunity_event()
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def college_graduation_event(self):
-        clear_screen()
-        print("\n" + "=" * 60)
-        print("LIFE EVENT: COLLEGE GRADUATION")
-        print("=" * 60)
-        print("\nCongratulations! You've graduated from college with a bachelor's degree.")
-        print("Your education will open up better job opportunities.")
+        self.clear()
+        self.notify("\n" + "=" * 60)
+        self.notify("LIFE EVENT: COLLEGE GRADUATION")
+        self.notify("=" * 60)
+        self.notify("\nCongratulations! You've graduated from college with a bachelor's degree.")
+        self.notify("Your education will open up better job opportunities.")
 
         self.player.education = "College Graduate"
         self.player.credit_score += 20  # Education boosts credit score
 
-        print("\nYour credit score has increased due to your educational achievement.")
-        print(f"Your credit score is now {self.player.credit_score}.")
+        self.notify("\nYour credit score has increased due to your educational achievement.")
+        self.notify(f"Your credit score is now {self.player.credit_score}.")
 
         # Offer job opportunities
-        print("\nWith your new degree, you have access to better job opportunities.")
+        self.notify("\nWith your new degree, you have access to better job opportunities.")
         self.job_opportunity_event()
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def job_opportunity_event(self):
-        clear_screen()
-        print("\n" + "=" * 60)
-        print("LIFE EVENT: JOB OPPORTUNITY")
-        print("=" * 60)
-
-        # Generate job options based on education
-        job_options = []
-
-        if self.player.education == "High School Graduate":
-            job_options = [
-                {"title": "Retail Associate", "salary": 25000},
-                {"title": "Food Service Worker", "salary": 22000},
-                {"title": "Warehouse Worker", "salary": 28000},
-            ]
-        elif self.player.education == "Trade School":
-            job_options = [
-                {"title": "Electrician Apprentice", "salary": 35000},
-                {"title": "Plumber Assistant", "salary": 32000},
-                {"title": "HVAC Technician", "salary": 38000},
-            ]
-        elif self.player.education == "College Graduate":
-            job_options = [
-                {"title": "Entry-Level Accountant", "salary": 50000},
-                {"title": "Marketing Coordinator", "salary": 45000},
-                {"title": "Software Developer", "salary": 65000},
-            ]
-
-        # Display job options
-        print("\nThe following job opportunities are available to you:")
-        for i, job in enumerate(job_options):
-            print(f"{i+1}. {job['title']} - ${job['salary']}/year")
+        self.clear()
+        self.notify("\n" + "=" * 60)
+        self.notify("LIFE EVENT: JOB OPPORTUNITY")
+        self.notify("=" * 60)
+
+        # Job options depend on education
+        job_options = JOB_OPTIONS.get(self.player.education, [])
+        if not job_options:
+            self.notify("\nNo job opportunities match your education right now.")
+            self.pause()
+            return
 
-        # Get player choice
-        choice = 0
-        while choice < 1 or choice > len(job_options):
-            try:
-                choice = int(input(f"\nWhich job would you like to take? (1-{len(job_options)}): "))
-            except ValueError:
-                print("Please enter a valid number.")
+        selected_job = self.choose(
+            "job", "Which job would you like to take?", job_options,
+            labels=[f"{job['title']} - ${job['salary']}/year" for job in job_options])
 
         # Apply job
-        selected_job = job_options[choice-1]
         self.player.job = selected_job["title"]
         self.player.salary = selected_job["salary"]
 
-        print(f"\nCongratulations! You are now a {self.player.job} earning ${self.player.salary}/year.")
-        print(f"Your monthly income is ${self.player.salary/12:.2f}.")
+        self.notify(f"\nCongratulations! You are now a {self.player.job} earning ${self.player.salary}/year.")
+        self.notify(f"Your monthly income is ${self.player.salary/12:.2f}.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def car_purchase_opportunity(self):
-        clear_screen()
-        print("\n" + "=" * 60)
-        print("LIFE EVENT: CAR PURCHASE OPPORTUNITY")
-        print("=" * 60)
-        print("\nYou're now at an age where having your own car could be beneficial.")
-        print("Would you like to look at some car options?")
+        self.clear()
+        self.notify("\n" + "=" * 60)
+        self.notify("LIFE EVENT: CAR PURCHASE OPPORTUNITY")
+        self.notify("=" * 60)
+        self.notify("\nYou're now at an age where having your own car could be beneficial.")
+        self.notify("Would you like to look at some car options?")
 
-        choice = get_choice("Do you want to buy a car?", ["Yes", "No"])
+        choice = self.choose("buy_car", "Do you want to buy a car?", ["Yes", "No"])
 
         if choice == "Yes":
-            # Car options
-            car_options = [
-                {"name": "Used Economy Car", "value": 5000},
-                {"name": "New Economy Car", "value": 18000},
-                {"name": "Used Luxury Car", "value": 15000},
-                {"name": "New Luxury Car", "value": 35000},
-            ]
-
-            print("\nHere are your car options:")
-            for i, car in enumerate(car_options):
-                print(f"{i+1}. {car['name']} - ${car['value']}")
-
-            # Get player choice
-            car_choice = 0
-            while car_choice < 1 or car_choice > len(car_options):
-                try:
-                    car_choice = int(input(f"\nWhich car would you like to buy? (1-{len(car_options)}): "))
-                except ValueError:
-                    print("Please enter a valid number.")
-
-            selected_car = car_options[car_choice-1]
+            selected_car = self.choose(
+                "car", "Which car would you like to buy?", CAR_OPTIONS,
+                labels=[f"{car['name']} - ${car['value']}" for car in CAR_OPTIONS])
 
             # Payment options
-            print(f"\nYou've selected the {selected_car['name']} for ${selected_car['value']}.")
-            print("How would you like to pay?")
+            self.notify(f"\nYou've selected the {selected_car['name']} for ${selected_car['value']}.")
+            self.notify("How would you like to pay?")
 
             payment_options = ["Cash"]
             if self.player.bank_account and self.player.bank_account.balance >= selected_car['value']:
                 payment_options.append("Bank Account")
             payment_options.append("Auto Loan")
 
-            payment_choice = get_choice("Select payment method:", payment_options)
+            payment_choice = self.choose("car_payment", "Select payment method:", payment_options)
 
             if payment_choice == "Cash" and self.player.cash >= selected_car['value']:
                 self.player.cash -= selected_car['value']
-                print(f"\nYou paid ${selected_car['value']} in cash for your new car.")
+                self.notify(f"\nYou paid ${selected_car['value']} in cash for your new car.")
             elif payment_choice == "Bank Account":
                 self.player.bank_account.withdraw(selected_car['value'])
-                print(f"\nYou paid ${selected_car['value']} from your bank account for your new car.")
+                self.notify(f"\nYou paid ${selected_car['value']} from your bank account for your new car.")
             else:  # Auto Loan
                 # Determine loan terms based on credit score
-                if self.player.credit_score >= 700:
-                    interest_rate = 0.03  # 3%
-                elif self.player.credit_score >= 650:
-                    interest_rate = 0.05  # 5%
-                else:
-                    interest_rate = 0.08  # 8%
+                interest_rate = auto_loan_rate(self.player.credit_score)
 
                 loan = Loan("Auto", selected_car['value'], interest_rate, 5)  # 5-year auto loan
                 self.player.loans.append(loan)
 
-                print(f"\nYou've taken out an auto loan for ${selected_car['value']}.")
-                print(f"Your interest rate is {interest_rate*100:.1f}% based on your credit score of {self.player.credit_score}.")
-                print(f"Your monthly payment will be ${loan.monthly_payment:.2f} for 5 years.")
+                self.notify(f"\nYou've taken out an auto loan for ${selected_car['value']}.")
+                self.notify(f"Your interest rate is {interest_rate*100:.1f}% based on your credit score of {self.player.credit_score}.")
+                self.notify(f"Your monthly payment will be ${loan.monthly_payment:.2f} for 5 years.")
 
             # Add car to assets
             self.player.assets.append(Asset("Car", selected_car['name'], selected_car['value']))
-            print(f"\nCongratulations on your new {selected_car['name']}!")
+            self.notify(f"\nCongratulations on your new {selected_car['name']}!")
 
         else:
-            print("\nYou've decided not to buy a car at this time.")
+            self.notify("\nYou've decided not to buy a car at this time.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def house_purchase_opportunity(self):
-        clear_screen()
-        print("\n" + "=" * 60)
-        print("LIFE EVENT: HOUSE PURCHASE OPPORTUNITY")
-        print("=" * 60)
-        print("\nYou're now at a stage in life where buying a house could be a good investment.")
-        print("Would you like to look at some housing options?")
+        self.clear()
+        self.notify("\n" + "=" * 60)
+        self.notify("LIFE EVENT: HOUSE PURCHASE OPPORTUNITY")
+        self.notify("=" * 60)
+        self.notify("\nYou're now at a stage in life where buying a house could be a good investment.")
+        self.notify("Would you like to look at some housing options?")
 
-        choice = get_choice("Do you want to buy a house?", ["Yes", "No"])
+        choice = self.choose("buy_house", "Do you want to buy a house?", ["Yes", "No"])
 
         if choice == "Yes":
-            # House options
-            house_options = [
-                {"name": "Small Starter Home", "value": 150000},
-                {"name": "Mid-size Family Home", "value": 250000},
-                {"name": "Large Luxury Home", "value": 500000},
-                {"name": "Urban Condo", "value": 200000},
-            ]
-
-            print("\nHere are your housing options:")
-            for i, house in enumerate(house_options):
-                print(f"{i+1}. {house['name']} - ${house['value']}")
-
-            # Get player choice
-            house_choice = 0
-            while house_choice < 1 or house_choice > len(house_options):
-                try:
-                    house_choice = int(input(f"\nWhich house would you like to buy? (1-{len(house_options)}): "))
-                except ValueError:
-                    print("Please enter a valid number.")
-
-            selected_house = house_options[house_choice-1]
+            selected_house = self.choose(
+                "house", "Which house would you like to buy?", HOUSE_OPTIONS,
+                labels=[f"{house['name']} - ${house['value']}" for house in HOUSE_OPTIONS])
 
             # Calculate down payment (20% is standard)
             down_payment = selected_house['value'] * 0.2
             loan_amount = selected_house['value'] - down_payment
 
-            print(f"\nYou've selected the {selected_house['name']} for ${selected_house['value']}.")
-            print(f"A standard mortgage requires a 20% down payment of ${down_payment}.")
+            self.notify(f"\nYou've selected the {selected_house['name']} for ${selected_house['value']}.")
+            self.notify(f"A standard mortgage requires a 20% down payment of ${down_payment}.")
 
             # Check if player can afford down payment
             if self.player.cash < down_payment and (not self.player.bank_account or self.player.bank_account.balance < down_payment):
-                print("\nYou don't have enough money for the down payment.")
-                print("You'll need to save up more money before buying a house.")
-                input("\nPress Enter to continue...")
+                self.notify("\nYou don't have enough money for the down payment.")
+                self.notify("You'll need to save up more money before buying a house.")
+                self.pause()
                 return
 
             # Down payment options
@@ -569,89 +687,82 @@ class Game:
             if self.player.bank_account and self.player.bank_account.balance >= down_payment:
                 payment_options.append("Bank Account")
 
-            payment_choice = get_choice("How would you like to pay the down payment?", payment_options)
+            payment_choice = self.choose("down_payment", "How would you like to pay the down payment?", payment_options)
 
             if payment_choice == "Cash":
                 self.player.cash -= down_payment
-                print(f"\nYou paid ${down_payment} in cash for your down payment.")
+                self.notify(f"\nYou paid ${down_payment} in cash for your down payment.")
             else:  # Bank Account
                 self.player.bank_account.withdraw(down_payment)
-                print(f"\nYou paid ${down_payment} from your bank account for your down payment.")
+                self.notify(f"\nYou paid ${down_payment} from your bank account for your down payment.")
 
             # Determine mortgage terms based on credit score
-            if self.player.credit_score >= 750:
-                interest_rate = 0.035  # 3.5%
-            elif self.player.credit_score >= 700:
-                interest_rate = 0.04   # 4.0%
-            elif self.player.credit_score >= 650:
-                interest_rate = 0.045  # 4.5%
-            else:
-                interest_rate = 0.055  # 5.5%
+            interest_rate = mortgage_rate(self.player.credit_score)
 
             loan = Loan("Mortgage", loan_amount, interest_rate, 30)  # 30-year mortgage
             self.player.loans.append(loan)
 
-            print(f"\nYou've taken out a mortgage for ${loan_amount}.")
-            print(f"Your interest rate is {interest_rate*100:.1f}% based on your credit score of {self.player.credit_score}.")
-            print(f"Your monthly payment will be ${loan.monthly_payment:.2f} for 30 years.")
+            self.notify(f"\nYou've taken out a mortgage for ${loan_amount}.")
+            self.notify(f"Your interest rate is {interest_rate*100:.1f}% based on your credit score of {self.player.credit_score}.")
+            self.notify(f"Your monthly payment will be ${loan.monthly_payment:.2f} for 30 years.")
 
             # Add house to assets
             self.player.assets.append(Asset("House", selected_house['name'], selected_house['value']))
-            print(f"\nCongratulations on your new {selected_house['name']}!")
+            self.notify(f"\nCongratulations on your new {selected_house['name']}!")
 
         else:
-            print("\nYou've decided not to buy a house at this time.")
+            self.notify("\nYou've decided not to buy a house at this time.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def family_planning_opportunity(self):
-        clear_screen()
-        print("\n" + "=" * 60)
-        print("LIFE EVENT: FAMILY PLANNING")
-        print("=" * 60)
-        print("\nYou've reached a stage in life where starting a family might be a consideration.")
-        print("Starting a family will increase your monthly expenses but can bring joy to your life.")
+        self.clear()
+        self.notify("\n" + "=" * 60)
+        self.notify("LIFE EVENT: FAMILY PLANNING")
+        self.notify("=" * 60)
+        self.notify("\nYou've reached a stage in life where starting a family might be a consideration.")
+        self.notify("Starting a family will increase your monthly expenses but can bring joy to your life.")
 
-        choice = get_choice("Would you like to start a family?", ["Yes", "No"])
+        choice = self.choose("start_family", "Would you like to start a family?", ["Yes", "No"])
 
         if choice == "Yes":
             # Add a spouse
-            spouse_age = self.player.age - random.randint(-3, 3)  # Spouse age is close to player age
+            spouse_age = self.player.age - self.rng.randint(-3, 3)  # Spouse age is close to player age
             self.player.family.append({"relation": "Spouse", "age": spouse_age})
 
-            print("\nCongratulations! You've gotten married.")
-            print(f"Your spouse is {spouse_age} years old.")
+            self.notify("\nCongratulations! You've gotten married.")
+            self.notify(f"Your spouse is {spouse_age} years old.")
 
             # Chance for dual income
-            if random.random() < 0.7:  # 70% chance of spouse having a job
-                spouse_income = int(self.player.salary * random.uniform(0.5, 1.5))  # Spouse income relative to player
+            if self.rng.random() < 0.7:  # 70% chance of spouse having a job
+                spouse_income = int(self.player.salary * self.rng.uniform(0.5, 1.5))  # Spouse income relative to player
                 self.player.salary += spouse_income  # Add spouse income to family income
-                print(f"Your spouse has a job that adds ${spouse_income}/year to your family income.")
-                print(f"Your combined family income is now ${self.player.salary}/year.")
+                self.notify(f"Your spouse has a job that adds ${spouse_income}/year to your family income.")
+                self.notify(f"Your combined family income is now ${self.player.salary}/year.")
             else:
-                print("Your spouse doesn't currently have a job.")
+                self.notify("Your spouse doesn't currently have a job.")
 
             # Ask about children
-            child_choice = get_choice("Would you like to have children?", ["Yes", "No"])
+            child_choice = self.choose("have_children", "Would you like to have children?", ["Yes", "No"])
 
             if child_choice == "Yes":
-                num_children = random.randint(1, 3)  # Random number of children
+                num_children = self.rng.randint(1, 3)  # Random number of children
 
                 for i in range(num_children):
                     child_name = f"Child {i+1}"  # Placeholder name
                     child_age = 0  # Newborn
                     self.player.family.append({"relation": "Child", "name": child_name, "age": child_age})
 
-                print(f"\nCongratulations! You now have {num_children} {'child' if num_children == 1 else 'children'}.")
-                print("Having children will increase your monthly expenses.")
+                self.notify(f"\nCongratulations! You now have {num_children} {'child' if num_children == 1 else 'children'}.")
+                self.notify("Having children will increase your monthly expenses.")
 
                 # Adjust expenses for children
-                print("\nYour monthly expenses have increased to account for your growing family.")
+                self.notify("\nYour monthly expenses have increased to account for your growing family.")
 
         else:
-            print("\nYou've decided not to start a family at this time.")
+            self.notify("\nYou've decided not to start a family at this time.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     # --- Status & actions (text mode) ---
     def display_status(self):
@@ -699,7 +810,7 @@ class Game:
             actions.append("View Assets")
         if not self.player.job and self.player.age >= 16:
             actions.append("Job Search")
-        elif self.player.job and random.random() < 0.1:
+        elif self.player.job and self.rng.random() < 0.1:
             actions.append("Job Search")
         for i,a in enumerate(actions):
             print(f"{i+1}. {a}")
@@ -801,7 +912,7 @@ class Game:
         extra = float(input("Extra payment: $"))
         if 0 < extra <= self.player.cash:
             self.player.cash -= extra
-            ln.make_payment(extra)
+            ln.make_extra_payment(extra)
 
     def view_assets(self):
         for a in self.player.assets:
@@ -814,7 +925,7 @@ class Game:
             {"title": "Technician", "salary": 38000},
             {"title": "Software Dev", "salary": 65000},
         ]
-        job = random.choice(options)
+        job = self.rng.choice(options)
         self.player.job = job['title']
         self.player.salary = job['salary']
         print(f"New job: {job['title']} at ${job['salary']}/yr")
@@ -824,28 +935,28 @@ class Game:
         triggered = False
         if self.player.age == 18 and self.player.education == "High School":
             from moneySmarts.screens.life_event_screens import HighSchoolGraduationScreen
-            self.gui_manager.set_screen(HighSchoolGraduationScreen(self)); return True
+            self.gui_manager.show(HighSchoolGraduationScreen); return True
         if self.player.age == 22 and self.player.education == "College (In Progress)":
             from moneySmarts.screens.life_event_screens import CollegeGraduationScreen
-            self.gui_manager.set_screen(CollegeGraduationScreen(self)); return True
+            self.gui_manager.show(CollegeGraduationScreen); return True
         if self.player.age == 22 and not self.player.job and self.player.education != "College (In Progress)":
             from moneySmarts.screens.financial_screens import JobSearchScreen
-            self.gui_manager.set_screen(JobSearchScreen(self)); return True
+            self.gui_manager.show(JobSearchScreen); return True
         if self.player.age == 20 and not any(a.asset_type=="Car" for a in self.player.assets):
             from moneySmarts.screens.life_event_screens import CarPurchaseScreen
-            self.gui_manager.set_screen(CarPurchaseScreen(self)); return True
+            self.gui_manager.show(CarPurchaseScreen); return True
         if self.player.age == 30 and not any(a.asset_type=="House" for a in self.player.assets) and self.player.job:
             from moneySmarts.screens.life_event_screens import HousingScreen
-            self.gui_manager.set_screen(HousingScreen(self)); return True
-        if self.player.age >= 28 and not self.player.family and self.player.job and random.random() < 0.1:
+            self.gui_manager.show(HousingScreen); return True
+        if self.player.age >= 28 and not self.player.family and self.player.job and self.rng.random() < FAMILY_PLANNING_CHANCE:
             from moneySmarts.screens.life_event_screens import FamilyPlanningScreen
-            self.gui_manager.set_screen(FamilyPlanningScreen(self)); return True
+            self.gui_manager.show(FamilyPlanningScreen); return True
         return triggered
 
     def end_game(self, reason):
-        clear_screen()
-        print(f"GAME OVER - {reason}")
-        print(f"Final Net Worth: ${compute_net_worth(self.player):.2f}")
+        self.clear()
+        self.notify(f"GAME OVER - {reason}")
+        self.notify(f"Final Net Worth: ${compute_net_worth(self.player):.2f}")
         self.game_over = True
 
     def end_game_gui(self, reason):
@@ -853,7 +964,7 @@ class Game:
         try:
             from moneySmarts.screens.base_screens import EndGameScreen  # lazy import
             if self.gui_manager:
-                self.gui_manager.set_screen(EndGameScreen(self, reason))
+                self.gui_manager.show(EndGameScreen, reason)
         except Exception as e:
             logging.debug(f"GUI end screen unavailable: {e}")
 
@@ -867,6 +978,7 @@ class Game:
             'quests': self.quests.serialize() if hasattr(self, 'quests') else [],
             'met_mentor': self.met_mentor,
             'quest_notifications': self.quest_notifications[-5:],
+            'history': self.history,
         }
 
     def _deserialize_state(self, data):
@@ -881,6 +993,9 @@ class Game:
             except Exception:
                 pass
         self.quest_notifications = data.get('quest_notifications', [])
+        history = data.get('history')
+        if history is not None:
+            self.history = history
 
     def save_state(self, filename="savegame.dat"):
         try:
@@ -907,10 +1022,10 @@ class Game:
             self.gui_manager.running = False
 
     def restart(self):
-        self.__init__()
+        self.__init__(rng=self.rng, record_history=self.history is not None)
         if self.gui_manager:
             try:
                 from moneySmarts.screens.base_screens import TitleScreen
-                self.gui_manager.set_screen(TitleScreen(self))
+                self.gui_manager.show(TitleScreen)
             except Exception as e:
                 logging.error(f"Restart screen failed: {e}")
@@ -2,67 +2,354 @@
 animation helpers, building image lookup, and diagnostics.
 
 Key features:
-- load_image(path_or_key, size=None): cached, auto-reload if mtime changes
-- get_building_image(building_name, image_type, size): uses world_assets discovery
+- load_image(path_or_key, size=None): cached; how changed files are noticed
+  depends on the cache mode (Config "image_cache_mode"):
+    stat   - stat the file on every call and reload when its mtime changes
+    watch  - hits are a dict lookup; a polling thread invalidates changed files
+    static - hits are a dict lookup; files are assumed not to change (production)
+  The cache is an LRU bounded by Config "image_cache_mb" (decoded bytes,
+  width x height x bytes per pixel); pinned images are never evicted
+- DiskImageCache: decoded and scaled pixels saved under ~/.cache/moneysmarts,
+  so later launches skip PNG/JPEG decoding and smoothscale
+- get_building_image(building_name, image_type, size): uses the world_assets building
+  index; repeat calls are a dict lookup with no filesystem access
 - slice_sheet / load_animation / get_animation_frame for sprite sheets
 - Transform helpers: scaled, tinted, rotated, outline
 - Placeholder generator for missing assets
 - Prewarm cache, unload, verify_assets
+- queue_preload / start_preload: decode on worker threads, convert on the main
+  thread in pump_preload, progress published as PRELOAD_PROGRESS events
 - Atlas builder stub (future extension)
 
 This is intentionally lightweight; expensive operations occur only once.
 """
 from __future__ import annotations
-import os
-import pygame
+
 import hashlib
+import io
 import logging
-from typing import Dict, Tuple, List, Optional
+import os
+import struct
+import threading
+from collections import OrderedDict, deque
+
+import pygame
 
+from moneySmarts.config_manager import Config
+from moneySmarts.event_manager import PRELOAD_PROGRESS, EventBus
+from moneySmarts.fonts import get_font
 from moneySmarts.images import IMAGES, get_image_path
-from moneySmarts.world_assets import discover_buildings
+from moneySmarts.world_assets import building_index
+
+logger = logging.getLogger(__name__)
 
 Surface = pygame.Surface
 
+# Cache modes, see the module docstring
+STAT = "stat"
+WATCH = "watch"
+STATIC = "static"
+CACHE_MODES = (STAT, WATCH, STATIC)
+WATCH_INTERVAL = 1.0  # Seconds between the watcher's polls
+IMAGE_CACHE_MB = 128  # Default budget for cached surfaces
+DISK_CACHE_MB = 256  # Default budget for DiskImageCache files
+
+def _default_cache_dir() -> str:
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'moneysmarts', 'images')
+
+def _scale(img: Surface, size: tuple[int, int] | None, smooth: bool) -> Surface:
+    if size and (img.get_width(), img.get_height()) != size:
+        if smooth:
+            img = pygame.transform.smoothscale(img, size)
+        else:
+            img = pygame.transform.scale(img, size)
+    return img
+
+def _mtime(path: str) -> float | None:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+class DiskImageCache:
+    """Decoded (and scaled) images stored as raw pixels, keyed by a hash of the
+    source file's bytes, the requested size and the smoothing flag. Edited files
+    hash differently, so entries never go stale; hits refresh a file's mtime and
+    the least recently used files are deleted once the directory grows past
+    ``budget_bytes``. Safe to use from the preload threads: files are written
+    under a temporary name and renamed.
+    """
+    HEADER = struct.Struct('<II')  # width, height
+
+    def __init__(self, directory: str | None = None, budget_bytes: int | None = None):
+        self.directory = directory or Config.get("image_disk_cache_dir") or _default_cache_dir()
+        if budget_bytes is None:
+            budget_bytes = int(Config.get("image_disk_cache_mb", DISK_CACHE_MB) * 1024 * 1024)
+        self.budget_bytes = budget_bytes
+        self.hits = 0
+        self.misses = 0
+        # Directory size at the last prune (None: not scanned yet) plus bytes
+        # written since; an estimate across threads, so prune rescans for real
+        self._scanned_bytes: int | None = None
+        self._written_bytes = 0
+
+    def _path(self, data: bytes, size: tuple[int, int] | None, smooth: bool) -> str:
+        digest = hashlib.sha1(data).hexdigest()
+        dims = f"{size[0]}x{size[1]}" if size else "orig"
+        return os.path.join(self.directory, f"{digest}-{dims}-{'s' if smooth else 'f'}")
+
+    def decode(self, path: str, size: tuple[int, int] | None, smooth: bool,
+               persist: bool = True) -> Surface:
+        """The image at ``path`` scaled to ``size``, from the cache when possible.
+        Misses are written back only if ``persist``."""
+        with open(path, 'rb') as f:
+            data = f.read()
+        entry = self._path(data, size, smooth)
+        img = self._load(entry)
+        if img is not None:
+            self.hits += 1
+            return img
+        self.misses += 1
+        img = _scale(pygame.image.load(io.BytesIO(data), path), size, smooth)
+        if persist and img.get_colorkey() is None:  # raw pixels would lose the colorkey
+            self._save(entry, img)
+        return img
+
+    def _load(self, entry: str) -> Surface | None:
+        for fmt in ('RGB', 'RGBA'):
+            target = f"{entry}.{fmt.lower()}"
+            try:
+                with open(target, 'rb') as f:
+                    data = f.read()
+                os.utime(target)  # prune evicts by mtime, so hits count as use
+            except OSError:
+                continue
+            try:
+                w, h = self.HEADER.unpack_from(data)
+                return pygame.image.frombuffer(memoryview(data)[self.HEADER.size:], (w, h), fmt)
+            except (struct.error, ValueError) as e:  # truncated or foreign file
+                logger.debug(f"Ignoring bad image cache file {entry}: {e}")
+        return None
+
+    def _save(self, entry: str, img: Surface):
+        fmt = 'RGBA' if img.get_alpha() else 'RGB'
+        target = f"{entry}.{fmt.lower()}"
+        tmp = f"{target}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            pixels = pygame.image.tobytes(img, fmt)
+            with open(tmp, 'wb') as f:
+                f.write(self.HEADER.pack(*img.get_size()))
+                f.write(pixels)
+            os.replace(tmp, target)
+        except OSError as e:
+            logger.debug(f"Image cache write failed {target}: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        self._written_bytes += self.HEADER.size + len(pixels)
+        if self._scanned_bytes is None or self._scanned_bytes + self._written_bytes > self.budget_bytes:
+            self.prune()
+
+    def prune(self):
+        """Delete the least recently used files until the cache fits its budget."""
+        try:
+            with os.scandir(self.directory) as it:
+                files = []
+                for e in it:
+                    if e.is_file():
+                        st = e.stat()
+                        files.append((st.st_mtime, st.st_size, e.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.budget_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._scanned_bytes = total
+        self._written_bytes = 0
+
+    def clear(self):
+        budget, self.budget_bytes = self.budget_bytes, -1
+        self.prune()
+        self.budget_bytes = budget
+
+class _PreloadItem:
+    __slots__ = ('group', 'key', 'path', 'size', 'smooth')
+
+    def __init__(self, key, path, size, smooth, group):
+        self.key = key
+        self.path = path
+        self.size = size
+        self.smooth = smooth
+        self.group = group
+
 class ImageManager:
-    def __init__(self):
-        self._cache: Dict[str, Surface] = {}
-        self._mtimes: Dict[str, float] = {}
-        self._usage: Dict[str, int] = {}
-        self._anim_frames: Dict[str, List[Surface]] = {}
-        self._animations: Dict[str, Dict[str, any]] = {}  # meta: frame_time, frames, loop
-        self._sheet_cache: Dict[str, List[Surface]] = {}
+    def __init__(self, mode: str | None = None, watch_interval: float = WATCH_INTERVAL,
+                 budget_bytes: int | None = None, preload_workers: int | None = None,
+                 disk_cache: DiskImageCache | bool | None = None):
+        mode = Config.get("image_cache_mode", WATCH) if mode is None else mode
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown image cache mode: {mode}")
+        self.mode = mode
+        self.watch_interval = watch_interval
+        if budget_bytes is None:
+            budget_bytes = int(Config.get("image_cache_mb", IMAGE_CACHE_MB) * 1024 * 1024)
+        self.budget_bytes = budget_bytes
+        # None: the default cache unless Config "image_disk_cache" is false; False: none
+        if disk_cache is None and Config.get("image_disk_cache", True):
+            disk_cache = DiskImageCache()
+        self.disk_cache = disk_cache or None
+        self.bytes_used = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+        self._cache: dict[str, Surface] = OrderedDict()  # least recently used first
+        self._bytes: dict[str, int] = {}
+        self._pins: dict[str, int] = {}
+        self._mtimes: dict[str, float] = {}
+        self._usage: dict[str, int] = {}
+        self._anim_frames: dict[str, list[Surface]] = {}
+        self._animations: dict[str, dict[str, any]] = {}  # meta: frame_time, frames, loop
+        self._sheet_cache: dict[str, list[Surface]] = {}
         self._display_ready = False
-        self._atlases: Dict[str, Tuple[Surface, Dict[str, pygame.Rect]]] = {}
-        self._preload_queue: List[Tuple[str, Optional[Tuple[int,int]]]] = []
-        self._preload_thread = None
-        self._preload_running = False
+        self._atlases: dict[str, tuple[Surface, dict[str, pygame.Rect]]] = {}
+        # Preloading: priority -> deque of items, items by key until a worker takes
+        # them, keys being decoded, decoded results for the main thread, and
+        # group -> [done, total]
+        self.preload_workers = preload_workers or Config.get("preload_workers", min(4, os.cpu_count() or 1))
+        self._preload_lock = threading.Condition()
+        self._preload_queues: dict[int, deque] = {}
+        self._queued: dict[str, _PreloadItem] = {}
+        self._decoding: set[str] = set()
+        self._preload_done: deque = deque()
+        self._preload_groups: dict[str | None, list[int]] = {}
+        self._preload_workers = 0
         self._preload_progress = 0
         self._preload_total = 0
+        self._buildings: dict[tuple[str, str, tuple[int, int] | None], tuple[Surface | None, str | None]] = {}
+        self._buildings_generation = None
+        # Stat-free modes: resolved paths, (path_or_key, size) -> (surface, cache key),
+        # mtimes of loaded files for the watcher and the paths it found changed
+        self._paths: dict[str, str] = {}
+        self._hits: dict[tuple[str, tuple[int, int] | None], tuple[Surface, str]] = {}
+        # Cache key -> the _hits and _buildings keys pointing at it, so dropping a
+        # surface forgets only its own aliases
+        self._hit_aliases: dict[str, set[tuple[str, tuple[int, int] | None]]] = {}
+        self._building_aliases: dict[str, set[tuple[str, str, tuple[int, int] | None]]] = {}
+        self._files: dict[str, float] = {}
+        self._changed: list[str] = []
+        self._watch_thread = None
+        self._watch_stop = threading.Event()
 
     # ---------------- Async preload ----------------
-    def queue_preload(self, items: List[Tuple[str, Optional[Tuple[int,int]]]]):
-        self._preload_queue.extend(items)
-        self._preload_total = len(self._preload_queue)
+    def queue_preload(self, items: list[tuple[str, tuple[int, int] | None]], priority: int = 0,
+                      group: str | None = None, smooth: bool = True):
+        """Queue (path_or_key, size) pairs for start_preload, e.g. the images of the
+        next screen as ``group``. Higher priorities are decoded first; missing files
+        and images already cached or queued are skipped."""
+        with self._preload_lock:
+            queue = self._preload_queues.setdefault(priority, deque())
+            for path_or_key, size in items:
+                path = self._resolve(path_or_key)
+                if path is None:
+                    continue
+                key = self._key(path, size)
+                if key in self._cache or key in self._queued or key in self._decoding:
+                    continue
+                item = _PreloadItem(key, path, size, smooth, group)
+                self._queued[key] = item
+                queue.append(item)
+                self._preload_total += 1
+                counts = self._preload_groups.setdefault(group, [0, 0])
+                counts[1] += 1
+
+    def start_preload(self):
+        """Start decoder threads (up to Config "preload_workers") for the queue."""
+        with self._preload_lock:
+            while self._preload_workers < self.preload_workers and self._queued:
+                self._preload_workers += 1
+                threading.Thread(target=self._preload_worker, name="image-preload", daemon=True).start()
+
+    def _next_preload(self) -> _PreloadItem | None:
+        # Called with the lock held; skips items claimed by load_image
+        for priority in sorted(self._preload_queues, reverse=True):
+            queue = self._preload_queues[priority]
+            while queue:
+                item = queue.popleft()
+                if self._queued.get(item.key) is item:
+                    del self._queued[item.key]
+                    self._decoding.add(item.key)
+                    return item
+            del self._preload_queues[priority]
+        return None
 
     def _preload_worker(self):
-        import time
-        while self._preload_queue and self._preload_running:
-            path, size = self._preload_queue.pop(0)
-            self.load_image(path, size=size)
+        while True:
+            with self._preload_lock:
+                item = self._next_preload()
+                if item is None:
+                    self._preload_workers -= 1
+                    return
+            # File reads and image decoding release the GIL; conversion needs the
+            # display, so it happens in pump_preload on the main thread
+            result = self._decode_item(item)
+            with self._preload_lock:
+                self._decoding.discard(item.key)
+                self._preload_done.append(result)
+                self._preload_lock.notify_all()
+
+    def _decode_item(self, item: _PreloadItem):
+        mtime = _mtime(item.path)
+        try:
+            img = self._decode(item.path, item.size, item.smooth)
+        except Exception:  # a worker must survive any bad file
+            logger.debug(f"Image preload failed {item.path}", exc_info=True)
+            img = None
+        return item, img, mtime
+
+    def _await_preload(self, key: str):
+        """Make a queued or decoding image available to load_image right away."""
+        with self._preload_lock:
+            item = self._queued.pop(key, None)
+            if item is None:
+                self._preload_lock.wait_for(lambda: key not in self._decoding)
+        if item is not None:
+            self._preload_done.append(self._decode_item(item))
+        self.pump_preload()
+
+    def pump_preload(self) -> int:
+        """Convert and cache decoded images and publish PRELOAD_PROGRESS for each.
+        Main thread only; GUIManager calls it every frame. Returns how many."""
+        handled = 0
+        while self._preload_done:
+            item, img, mtime = self._preload_done.popleft()
+            key = item.key
+            if img is not None and mtime is not None and not (key in self._cache and self._mtimes.get(key) == mtime):
+                self._ensure_display()
+                self._add(key, item.path, self._convert(img), mtime)
             self._preload_progress += 1
-            time.sleep(0)  # yield
-        self._preload_running = False
+            counts = self._preload_groups[item.group]
+            counts[0] += 1
+            done, total = counts
+            if done == total:
+                del self._preload_groups[item.group]
+            handled += 1
+            EventBus.publish(PRELOAD_PROGRESS, group=item.group, done=done, total=total)
+        return handled
 
-    def start_preload(self):
-        if self._preload_running or not self._preload_queue:
-            return
-        import threading
-        self._preload_running = True
-        self._preload_thread = threading.Thread(target=self._preload_worker, daemon=True)
-        self._preload_thread.start()
+    def preloading(self) -> bool:
+        """Whether images are queued, decoding or waiting for pump_preload."""
+        return bool(self._queued or self._decoding or self._preload_done)
 
-    def preload_status(self) -> Tuple[int,int]:
+    def preload_status(self) -> tuple[int,int]:
         return (self._preload_progress, self._preload_total)
 
     # ---------------- Core loading ----------------
@@ -71,88 +358,238 @@ class ImageManager:
             try:
                 if not pygame.get_init():
                     pygame.init()
-                if not pygame.display.get_init():
+                if pygame.display.get_surface() is None:
                     pygame.display.set_mode((1,1), pygame.HIDDEN)
                 self._display_ready = True
             except Exception:
                 pass
 
-    def _key(self, path: str, size: Optional[Tuple[int,int]]):
+    def _key(self, path: str, size: tuple[int, int] | None):
         return f"{path}|{size[0]}x{size[1]}" if size else path
 
-    def load_image(self, path_or_key: str, size: Optional[Tuple[int,int]] = None, smooth: bool = True, colorkey=None) -> Optional[Surface]:
-        """Load (or fetch cached) image. Accepts symbolic key in IMAGES or file path.
-        Auto-reloads if file mtime changed. Returns None if not found.
-        """
-        self._ensure_display()
+    def _resolve(self, path_or_key: str) -> str | None:
+        """Existing file for a symbolic key in IMAGES or a path, or None."""
+        if self.mode != STAT:
+            path = self._paths.get(path_or_key)
+            if path is not None:
+                return path
         # Absolute path short-circuit
         if os.path.isabs(path_or_key) and os.path.exists(path_or_key):
             path = path_or_key
         else:
             # Resolve symbolic key or relative path via images helper
-            if path_or_key in IMAGES:
-                path = get_image_path(path_or_key)
-            else:
-                path = get_image_path(path_or_key)
-        if not os.path.exists(path):
+            path = get_image_path(path_or_key)
+            if not os.path.exists(path):
+                return None
+        if self.mode != STAT:
+            self._paths[path_or_key] = path
+        return path
+
+    def load_image(self, path_or_key: str, size: tuple[int, int] | None = None, smooth: bool = True, colorkey=None,
+                   persist: bool = True) -> Surface | None:
+        """Load (or fetch cached) image. Accepts symbolic key in IMAGES or file path.
+        Reloads changed files as the cache mode allows. Returns None if not found.
+        Pass ``persist=False`` for transient sizes (e.g. the window during a resize
+        drag) to keep them out of the disk cache.
+        """
+        if self._changed:
+            self._apply_changes()
+        if self.mode != STAT:
+            hit = self._hits.get((path_or_key, size))
+            if hit is not None:
+                self._usage[hit[1]] += 1
+                self._cache.move_to_end(hit[1])
+                return hit[0]
+        self._ensure_display()
+        path = self._resolve(path_or_key)
+        if path is None:
+            return None
+        mtime = _mtime(path)
+        if mtime is None:  # deleted since it was resolved
+            self._paths.pop(path_or_key, None)
             return None
-        mtime = os.path.getmtime(path)
         cache_key = self._key(path, size)
+        if cache_key in self._queued or cache_key in self._decoding:
+            self._await_preload(cache_key)
+        elif self._preload_done:
+            self.pump_preload()
         if cache_key in self._cache and self._mtimes.get(cache_key) == mtime:
             self._usage[cache_key] = self._usage.get(cache_key,0)+1
-            return self._cache[cache_key]
+            self._cache.move_to_end(cache_key)
+            return self._remember(path_or_key, size, cache_key)
         # (Re)load
         try:
-            img = pygame.image.load(path)
-            if size and (img.get_width(), img.get_height()) != size:
-                if smooth:
-                    img = pygame.transform.smoothscale(img, size)
-                else:
-                    img = pygame.transform.scale(img, size)
-            if img.get_alpha():
-                img = img.convert_alpha()
-            else:
-                img = img.convert()
+            img = self._convert(self._decode(path, size, smooth, persist))
             if colorkey is not None:
                 img.set_colorkey(colorkey)
-            self._cache[cache_key] = img
-            self._mtimes[cache_key] = mtime
-            self._usage[cache_key] = 1
-            return img
+            self._add(cache_key, path, img, mtime)
+            return self._remember(path_or_key, size, cache_key)
         except Exception as e:
-            logging.debug(f"Image load failed {path}: {e}")
+            logger.debug(f"Image load failed {path}: {e}")
             return None
 
+    def _decode(self, path: str, size: tuple[int, int] | None, smooth: bool,
+                persist: bool = True) -> Surface:
+        """Read and scale an image; safe off the main thread."""
+        if self.disk_cache is not None:
+            return self.disk_cache.decode(path, size, smooth, persist)
+        return _scale(pygame.image.load(path), size, smooth)
+
+    @staticmethod
+    def _convert(img: Surface) -> Surface:
+        """Convert to the display format for fast blits; needs the display."""
+        return img.convert_alpha() if img.get_alpha() else img.convert()
+
+    def _add(self, cache_key: str, path: str, img: Surface, mtime: float):
+        if cache_key in self._cache:
+            self._drop([cache_key])  # an outdated copy
+        self._store(cache_key, img)
+        self._mtimes[cache_key] = mtime
+        self._usage[cache_key] = 1
+        self._files[path] = mtime
+
+    def _store(self, key: str, img: Surface):
+        size = img.get_width() * img.get_height() * img.get_bytesize()
+        self._cache[key] = img
+        self._bytes[key] = size
+        self.bytes_used += size
+        if self.bytes_used > self.budget_bytes:
+            self._evict(key)
+
+    def _evict(self, keep: str | None = None):
+        """Drop least recently used, unpinned surfaces until the cache fits its
+        budget. ``keep`` (the surface just stored, which the caller is about to
+        use) stays even if it alone is over budget."""
+        over = self.bytes_used - self.budget_bytes
+        victims = []
+        for k in self._cache:
+            if over <= 0:
+                break
+            if k != keep and not self._pins.get(k):
+                victims.append(k)
+                over -= self._bytes[k]
+        if victims:
+            self.evictions += len(victims)
+            self.evicted_bytes += sum(self._bytes[k] for k in victims)
+            logger.debug(f"Image cache over budget; evicting {len(victims)} surface(s)")
+            self._drop(victims)
+
+    # ---------------- Pinning ----------------
+    def _cache_key(self, path_or_key: str, size: tuple[int, int] | None) -> str | None:
+        path = self._resolve(path_or_key)
+        return self._key(path, size) if path else None
+
+    def pin(self, path_or_key: str, size: tuple[int, int] | None = None):
+        """Keep an image from being evicted until a matching ``unpin``. Pins nest."""
+        key = self._cache_key(path_or_key, size)
+        if key is not None:
+            self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, path_or_key: str, size: tuple[int, int] | None = None):
+        key = self._cache_key(path_or_key, size)
+        count = self._pins.get(key, 0) - 1
+        if count > 0:
+            self._pins[key] = count
+        else:
+            self._pins.pop(key, None)
+            if self.bytes_used > self.budget_bytes:
+                self._evict()
+
+    def cache_stats(self) -> dict[str, int]:
+        """Entries, bytes, budget, pinned entries and evictions so far."""
+        return {
+            'entries': len(self._cache),
+            'bytes': self.bytes_used,
+            'budget': self.budget_bytes,
+            'pinned': sum(1 for k in self._pins if k in self._cache),
+            'evictions': self.evictions,
+            'evicted_bytes': self.evicted_bytes,
+        }
+
+    def _remember(self, path_or_key: str, size: tuple[int, int] | None, cache_key: str) -> Surface:
+        img = self._cache[cache_key]
+        if self.mode != STAT:
+            self._hits[(path_or_key, size)] = (img, cache_key)
+            self._hit_aliases.setdefault(cache_key, set()).add((path_or_key, size))
+            if self.mode == WATCH:
+                self.start_watching()
+        return img
+
+    # ---------------- Hot reload ----------------
+    def start_watching(self, interval: float | None = None):
+        """Poll the loaded files from a daemon thread and reload changed ones."""
+        if self._watch_thread is not None and self._watch_thread.is_alive():
+            return
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(target=self._watch_worker, args=(interval or self.watch_interval,),
+                                              name="image-watch", daemon=True)
+        self._watch_thread.start()
+
+    def stop_watching(self):
+        self._watch_stop.set()
+        if self._watch_thread is not None:
+            self._watch_thread.join()
+            self._watch_thread = None
+
+    def _watch_worker(self, interval: float):
+        while not self._watch_stop.wait(interval):
+            self.check_changes()
+
+    def check_changes(self) -> list[str]:
+        """Stat every loaded file and queue the changed or deleted ones; their
+        cache entries are dropped by the next load on the main thread."""
+        changed = [path for path, mtime in list(self._files.items()) if _mtime(path) != mtime]
+        self._changed.extend(changed)
+        return changed
+
+    def _apply_changes(self):
+        while self._changed:
+            path = self._changed.pop()
+            self._files.pop(path, None)
+            self._drop([k for k in self._cache if k == path or k.startswith(path + '|')])
+
+    def _drop(self, keys: list[str]):
+        for k in keys:
+            for alias in self._hit_aliases.pop(k, ()):
+                self._hits.pop(alias, None)
+            for alias in self._building_aliases.pop(k, ()):
+                self._buildings.pop(alias, None)
+            self._cache.pop(k, None)
+            self.bytes_used -= self._bytes.pop(k, 0)
+            self._mtimes.pop(k, None)
+            self._usage.pop(k, None)
+
     # ---------------- Building helpers ----------------
-    def get_building_image(self, building_name: str, image_type: str = 'exterior', size: Optional[Tuple[int,int]] = None) -> Optional[Surface]:
+    def get_building_image(self, building_name: str, image_type: str = 'exterior', size: tuple[int, int] | None = None) -> Surface | None:
         """Fuzzy match building by name and load requested image type.
         image_type: 'exterior' | 'interior'
+        Results are remembered until building_index is rebuilt (see
+        BuildingIndex.refresh) or the image is unloaded.
         """
-        norm = building_name.lower().replace(' ','')
-        candidates = discover_buildings()
-        best = None
-        for b in candidates:
-            keyn = b.key.lower()
-            if keyn in norm or norm in keyn or building_name.lower() in b.display_name.lower():
-                best = b
-                break
-        if not best:
-            # fallback: first with matching type
-            for b in candidates:
-                if image_type == 'exterior' and b.exterior_path:
-                    best = b; break
-                if image_type == 'interior' and b.interior_path:
-                    best = b; break
-        if not best:
-            return None
-        target = best.exterior_path if image_type == 'exterior' else best.interior_path
-        if not target:
-            return None
-        rel = os.path.relpath(target, os.path.commonpath([target, os.getcwd()])) if os.path.exists(target) else target
-        return self.load_image(rel, size=size, smooth=True)
+        if self._changed:
+            self._apply_changes()
+        key = (building_name, image_type, size)
+        if self._buildings_generation != building_index.generation:
+            self._buildings.clear()
+            self._building_aliases.clear()
+        hit = self._buildings.get(key)
+        if hit is not None:
+            img, cache_key = hit
+            if cache_key is not None:
+                self._usage[cache_key] = self._usage.get(cache_key,0)+1
+            return img
+        target = building_index.image_path(building_name, image_type)
+        img = self.load_image(target, size=size, smooth=True) if target else None
+        # Fetch the generation after the lookup, which may have built the index
+        self._buildings_generation = building_index.generation
+        cache_key = self._key(target, size) if img is not None else None
+        self._buildings[key] = (img, cache_key)
+        if cache_key is not None:
+            self._building_aliases.setdefault(cache_key, set()).add(key)
+        return img
 
     # ---------------- Sprite sheets / animations ----------------
-    def slice_sheet(self, path_or_key: str, frame_w: int, frame_h: int, colorkey=None) -> List[Surface]:
+    def slice_sheet(self, path_or_key: str, frame_w: int, frame_h: int, colorkey=None) -> list[Surface]:
         cache_id = f"sheet:{path_or_key}:{frame_w}x{frame_h}"
         if cache_id in self._sheet_cache:
             return self._sheet_cache[cache_id]
@@ -174,7 +611,7 @@ class ImageManager:
         if frames:
             self._animations[name] = { 'frames': frames, 'frame_time': frame_time, 'loop': loop }
 
-    def get_animation_frame(self, name: str, elapsed: float) -> Optional[Surface]:
+    def get_animation_frame(self, name: str, elapsed: float) -> Surface | None:
         anim = self._animations.get(name)
         if not anim:
             return None
@@ -189,7 +626,7 @@ class ImageManager:
         return frames[idx]
 
     # ---------------- Transform utilities ----------------
-    def scaled(self, surf: Surface, size: Tuple[int,int], smooth=True) -> Surface:
+    def scaled(self, surf: Surface, size: tuple[int,int], smooth=True) -> Surface:
         return pygame.transform.smoothscale(surf, size) if smooth else pygame.transform.scale(surf, size)
 
     def tinted(self, surf: Surface, color) -> Surface:
@@ -214,45 +651,38 @@ class ImageManager:
         return outline_surf
 
     # ---------------- Placeholders / diagnostics ----------------
-    def placeholder(self, size: Tuple[int,int], text: str = "Missing") -> Surface:
+    def placeholder(self, size: tuple[int,int], text: str = "Missing") -> Surface:
         key = f"placeholder:{size}:{text}"
         if key in self._cache:
+            self._cache.move_to_end(key)
             return self._cache[key]
         surf = pygame.Surface(size, pygame.SRCALPHA)
         surf.fill((50,50,60))
         pygame.draw.rect(surf, (180,60,60), surf.get_rect(), 2)
-        font = pygame.font.SysFont('Arial', max(12, min(size[1]//4, 32)))
+        font = get_font(max(12, min(size[1]//4, 32)))
         label = font.render(text, True, (255,255,255))
         rect = label.get_rect(center=(size[0]//2, size[1]//2))
         surf.blit(label, rect)
-        self._cache[key] = surf
+        self._store(key, surf)
         return surf
 
-    def surface_info(self) -> List[Tuple[str, Tuple[int,int]]]:
+    def surface_info(self) -> list[tuple[str, tuple[int,int]]]:
         out = []
         for k,v in self._cache.items():
             out.append((k, v.get_size()))
         return out
 
-    def prewarm(self, keys: List[str]):
+    def prewarm(self, keys: list[str]):
         for k in keys:
             self.load_image(k)
 
     def unload(self, key_fragment: str):
-        to_del = [k for k in self._cache if key_fragment in k]
-        for k in to_del:
-            self._cache.pop(k, None)
-            self._mtimes.pop(k, None)
-            self._usage.pop(k, None)
+        self._drop([k for k in self._cache if key_fragment in k])
 
     def unload_unused(self, min_hits: int = 1):
-        to_del = [k for k,u in self._usage.items() if u <= min_hits]
-        for k in to_del:
-            self._cache.pop(k, None)
-            self._mtimes.pop(k, None)
-            self._usage.pop(k, None)
+        self._drop([k for k,u in self._usage.items() if u <= min_hits])
 
-    def verify_assets(self, manifest: List[str]) -> Dict[str, List[str]]:
+    def verify_assets(self, manifest: list[str]) -> dict[str, list[str]]:
         missing = []
         present = []
         for k in manifest:
@@ -264,7 +694,7 @@ class ImageManager:
         return {'present': present, 'missing': missing}
 
     # ---------------- Atlas packing ----------------
-    def build_atlas(self, name: str, paths: List[str], gap: int = 2, max_size: int = 2048, scale: Optional[Tuple[int,int]] = None) -> Optional[Tuple[Surface, Dict[str, pygame.Rect]]]:
+    def build_atlas(self, name: str, paths: list[str], gap: int = 2, max_size: int = 2048, scale: tuple[int, int] | None = None) -> tuple[Surface, dict[str, pygame.Rect]] | None:
         if name in self._atlases:
             return self._atlases[name]
         # Load images first
@@ -293,10 +723,10 @@ class ImageManager:
             row_h = max(row_h, h)
             atlas_h = max(atlas_h, y + row_h + gap)
             if atlas_h > max_size:
-                logging.debug("Atlas overflow; truncating remaining images")
+                logger.debug("Atlas overflow; truncating remaining images")
                 break
         atlas = pygame.Surface((atlas_w, atlas_h), pygame.SRCALPHA)
-        rect_map: Dict[str, pygame.Rect] = {}
+        rect_map: dict[str, pygame.Rect] = {}
         for p, rect in placements:
             img = self.load_image(p)
             if img:
@@ -305,7 +735,7 @@ class ImageManager:
         self._atlases[name] = (atlas, rect_map)
         return self._atlases[name]
 
-    def get_from_atlas(self, atlas_name: str, path: str) -> Optional[Surface]:
+    def get_from_atlas(self, atlas_name: str, path: str) -> Surface | None:
         data = self._atlases.get(atlas_name)
         if not data:
             return None
@@ -318,4 +748,4 @@ class ImageManager:
 # Global singleton
 image_manager = ImageManager()
 
-__all__ = ["ImageManager","image_manager"]
+__all__ = ["STAT", "STATIC", "WATCH", "DiskImageCache", "ImageManager", "image_manager"]
@@ -1,9 +1,144 @@
-import random
+import bisect
 import logging
+import math
+import random
+from array import array
+from collections.abc import Mapping, Sequence
+from enum import IntEnum
+from types import MappingProxyType
+from typing import ClassVar
 from moneySmarts.config_manager import Config
 from moneySmarts.exceptions import BankAccountError, LoanError, AssetError
+from moneySmarts.money import Cents, to_cents, to_dollars
+
+class EntryType(IntEnum):
+    """Kind of an account ledger entry (stored as one byte per entry)."""
+    DEPOSIT = 0
+    WITHDRAWAL = 1
+    INTEREST = 2
+    CHARGE = 3
+    PAYMENT = 4
 
-class Player:
+_ENTRY_LABELS = tuple(kind.name.lower() for kind in EntryType)
+# Plain-int kinds for the mutators: an IntEnum member lookup costs several times a global's
+_DEPOSIT, _WITHDRAWAL, _INTEREST, _CHARGE, _PAYMENT = (int(kind) for kind in EntryType)
+
+class _ColumnarHistory(Sequence):
+    """
+    History stored as parallel typed arrays (one column per field) instead of one
+    dict per entry. Reads (len, iteration, indexing, slicing) still yield dicts.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        return self._entry(index)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+class Ledger(_ColumnarHistory):
+    """Account transaction history: entry types in ``array('B')``, amounts as int cents in ``array('q')``."""
+    __slots__ = ("amounts", "types")
+
+    def __init__(self, entries=()):
+        self.types = array('B')
+        self.amounts = array('q')
+        for entry in entries:
+            self.append(entry)
+
+    def record(self, kind, cents):
+        """Append an entry of ``kind`` (an ``EntryType``) for ``cents``."""
+        self.types.append(kind)
+        self.amounts.append(cents)
+
+    def append(self, entry):
+        """Append a ``{"type": ..., "amount": dollars}`` dict."""
+        self.record(EntryType[entry["type"].upper()], to_cents(entry["amount"]))
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def _entry(self, i):
+        return {"type": _ENTRY_LABELS[self.types[i]], "amount": to_dollars(self.amounts[i])}
+
+class PaymentLedger(_ColumnarHistory):
+    """Loan payment history: amount/interest/principal columns in int cents
+    (``Loan.make_payment_cents`` appends to them directly)."""
+    __slots__ = ("amounts", "interest", "principal")
+
+    def __init__(self, entries=()):
+        self.amounts = array('q')
+        self.interest = array('q')
+        self.principal = array('q')
+        for entry in entries:
+            self.append(entry)
+
+    def record(self, amount, interest, principal):
+        """Append a payment; amounts in cents."""
+        self.amounts.append(amount)
+        self.interest.append(interest)
+        self.principal.append(principal)
+
+    def append(self, entry):
+        """Append an ``{"amount", "interest", "principal"}`` dict in dollars."""
+        self.record(to_cents(entry["amount"]), to_cents(entry["interest"]), to_cents(entry["principal"]))
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def _entry(self, i):
+        return {
+            "amount": to_dollars(self.amounts[i]),
+            "interest": to_dollars(self.interest[i]),
+            "principal": to_dollars(self.principal[i]),
+        }
+
+class _Slotted:
+    """
+    Base for the slotted models. Pickles as a plain ``{attribute: value}`` dict with
+    money in dollars (the same shape older ``__dict__`` saves have), and restores
+    either form (list histories become ledgers, attributes added since then get
+    their ``_defaults``). Subclasses extend both through class keywords, e.g.
+    ``class Loan(_Slotted, ledgers={...}, defaults={...})``.
+    """
+    __slots__ = ()
+    _ledgers: ClassVar[Mapping[str, type]] = MappingProxyType({})  # Attribute name -> ledger type
+    _defaults: ClassVar[Mapping[str, object]] = MappingProxyType({})  # Attributes older saves may lack
+
+    def __init_subclass__(cls, ledgers=None, defaults=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Fresh read-only merges, so no class can change what its bases restore
+        cls._ledgers = MappingProxyType({**cls._ledgers, **(ledgers or {})})
+        cls._defaults = MappingProxyType({**cls._defaults, **(defaults or {})})
+
+    def __getstate__(self):
+        state = {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+            for name, attr in vars(cls).items():
+                if isinstance(attr, Cents) and attr.slot in state:
+                    state[name] = to_dollars(state.pop(attr.slot))
+        return state
+
+    def __setstate__(self, state):
+        if isinstance(state, tuple):
+            dict_state, slot_state = state
+            state = {**(dict_state or {}), **(slot_state or {})}
+        for name, value in {**self._defaults, **state}.items():
+            ledger = self._ledgers.get(name)
+            if ledger is not None and not isinstance(value, ledger):
+                value = ledger(value)
+            setattr(self, name, value)
+
+class Player(_Slotted, defaults={"vehicle": None, "home": None}):
     """
     Represents the player character in the game.
     Tracks personal and financial information, including age, education, job, salary, cash, accounts, credit, loans, assets, family, and bills.
@@ -28,7 +163,17 @@ class Player:
         utility_bills (list): List of utility bills (dicts).
         insurance_policies (list): List of Insurance objects.
         investments (list): List of Investment objects.
+        vehicle (str): Name of the vehicle bought through the vehicle shop, if any.
+        home (str): Name of the home bought through the home shop, if any.
     """
+    __slots__ = (
+        "_cash", "age", "assets", "bank_account", "credit_card", "credit_score", "debit_card",
+        "education", "family", "home", "insurance_policies", "inventory", "investments", "job",
+        "loans", "name", "recurring_bills", "salary", "savings_account", "utility_bills",
+        "vehicle",
+    )
+    cash = Cents()
+
     def __init__(self, name):
         """
         Initialize a new Player instance with default financial attributes.
@@ -58,6 +203,32 @@ class Player:
         ])
         self.insurance_policies = []  # List of Insurance objects
         self.investments = []  # List of Investment objects
+        self.vehicle = None
+        self.home = None
+
+    @property
+    def net_worth(self):
+        """
+        Current net worth, summed when read: cash, checking (a savings-type primary
+        account does not count), savings, the card and loans add up exactly in cents;
+        investments and assets are dollar values. Nothing is tracked between reads.
+        """
+        cents = self._cash
+        bank = self.bank_account
+        if bank and bank.account_type != "Savings":
+            cents += bank._balance
+        if self.savings_account:
+            cents += self.savings_account._balance
+        if self.credit_card:
+            cents -= self.credit_card._balance
+        for loan in self.loans:
+            cents -= loan._current_balance
+        dollars = 0.0
+        for inv in self.investments:
+            dollars += inv.amount
+        for asset in self.assets:
+            dollars += asset.current_value
+        return cents / 100 + dollars
 
     def purchase_insurance(self, insurance_type, premium, coverage_amount, deductible):
         """
@@ -164,7 +335,7 @@ class Player:
         print("Insurance purchased.")
         return True
 
-class BankAccount:
+class BankAccount(_Slotted, ledgers={"transaction_history": Ledger}):
     """
     Represents a bank account that can hold money and earn interest.
 
@@ -172,54 +343,69 @@ class BankAccount:
         account_type (str): Type of account ('Checking' or 'Savings').
         balance (float): Current account balance.
         interest_rate (float): Annual interest rate (for savings).
-        transaction_history (list): List of transaction records (dicts).
+        transaction_history (Ledger): Transaction records (read as dicts).
     """
+    __slots__ = ("_balance", "account_type", "interest_rate", "transaction_history")
+    balance = Cents()
+
     def __init__(self, account_type="Checking"):
         self.account_type = account_type
         self.balance = 0
         self.interest_rate = 0.01 if account_type == "Savings" else 0.0
-        self.transaction_history = []
+        self.transaction_history = Ledger()
 
     def deposit(self, amount):
         """Deposit money into the account. Returns True if successful, raises BankAccountError on failure."""
         try:
             if amount > 0:
-                self.balance += amount
-                self.transaction_history.append({"type": "deposit", "amount": amount})
-                return True
+                return self.deposit_cents(to_cents(amount))
             else:
                 raise BankAccountError("Deposit amount must be positive.")
         except Exception as e:
             logging.error(f"BankAccount deposit error: {e}")
             raise BankAccountError(f"Deposit failed: {e}")
 
+    def deposit_cents(self, cents):
+        """Deposit a whole number of cents. Returns True, raises BankAccountError if not positive."""
+        if cents <= 0:
+            raise BankAccountError("Deposit amount must be positive.")
+        self._balance += cents
+        self.transaction_history.record(_DEPOSIT, cents)
+        return True
+
     def withdraw(self, amount):
         """Withdraw money from the account if sufficient funds are available. Returns True if successful, raises BankAccountError on failure."""
         try:
-            if 0 < amount <= self.balance:
-                self.balance -= amount
-                self.transaction_history.append({"type": "withdrawal", "amount": amount})
-                return True
+            if 0 < amount:
+                return self.withdraw_cents(to_cents(amount))
             else:
                 raise BankAccountError("Insufficient funds or invalid withdrawal amount.")
         except Exception as e:
             logging.error(f"BankAccount withdraw error: {e}")
             raise BankAccountError(f"Withdrawal failed: {e}")
 
+    def withdraw_cents(self, cents):
+        """Withdraw a whole number of cents. Returns True, raises BankAccountError on insufficient funds."""
+        if not 0 <= cents <= self._balance:
+            raise BankAccountError("Insufficient funds or invalid withdrawal amount.")
+        self._balance -= cents
+        self.transaction_history.record(_WITHDRAWAL, cents)
+        return True
+
     def apply_interest(self):
         """Apply interest to the account balance (for savings accounts). Returns the interest amount, logs errors."""
         try:
-            if self.account_type == "Savings" and self.balance > 0:
-                interest = self.balance * self.interest_rate
-                self.balance += interest
-                self.transaction_history.append({"type": "interest", "amount": interest})
-                return interest
+            if self.account_type == "Savings" and self._balance > 0:
+                interest = round(self._balance * self.interest_rate)
+                self._balance += interest
+                self.transaction_history.record(_INTEREST, interest)
+                return to_dollars(interest)
             return 0
         except Exception as e:
             logging.error(f"BankAccount interest error: {e}")
             return 0
 
-class Card:
+class Card(_Slotted, ledgers={"transaction_history": Ledger}):
     """
     Represents a payment card (debit or credit).
 
@@ -227,13 +413,17 @@ class Card:
         card_type (str): 'Debit' or 'Credit'.
         limit (float): Credit limit (for credit cards).
         balance (float): Current balance (for credit cards).
-        transaction_history (list): List of transaction records (dicts).
+        transaction_history (Ledger): Transaction records (read as dicts).
     """
+    __slots__ = ("_balance", "_limit", "card_type", "transaction_history")
+    balance = Cents()
+    limit = Cents()
+
     def __init__(self, card_type, limit=0):
         self.card_type = card_type
         self.limit = limit
         self.balance = 0
-        self.transaction_history = []
+        self.transaction_history = Ledger()
 
     def charge(self, amount):
         """
@@ -244,27 +434,89 @@ class Card:
         """
         if amount <= 0:
             return False
-            
+        return self.charge_cents(to_cents(amount))
+
+    def charge_cents(self, cents):
+        """``charge`` for a whole number of cents."""
         if self.card_type == "Credit":
-            if self.balance + amount <= self.limit:
-                self.balance += amount
-                self.transaction_history.append({"type": "charge", "amount": amount})
+            if self._balance + cents <= self._limit:
+                self._balance += cents
+                self.transaction_history.record(_CHARGE, cents)
                 return True
             return False
         return True  # Debit cards don't track balance here
 
     def pay(self, amount):
         """Pay off some of the credit card balance. Returns True if successful."""
-        if self.card_type == "Credit" and 0 < amount <= self.balance:
-            self.balance -= amount
-            self.transaction_history.append({"type": "payment", "amount": amount})
+        return amount > 0 and self.pay_cents(to_cents(amount))
+
+    def pay_cents(self, cents):
+        """``pay`` for a whole number of cents."""
+        if self.card_type == "Credit" and 0 < cents <= self._balance:
+            self._balance -= cents
+            self.transaction_history.record(_PAYMENT, cents)
             return True
         return False
 
-class Loan:
+def _amortized_balance(balance, rate, payment, months):
+    """Balance left after ``months`` scheduled payments, in closed form."""
+    if months <= 0 or balance <= 0:
+        return balance
+    if rate == 0:
+        remaining = balance - payment * months
+    elif payment <= balance * rate:
+        # Payment never covers the interest, so the principal never moves
+        return balance
+    else:
+        growth = (1 + rate) ** months
+        remaining = balance * growth - payment * (growth - 1) / rate
+    return 0 if remaining < 0.01 else remaining
+
+def _payments_to_payoff(balance, rate, payment):
+    """Number of scheduled payments until ``balance`` reaches zero (None if it never does)."""
+    if balance <= 0:
+        return 0
+    if rate == 0:
+        n = math.ceil(balance / payment)
+    elif payment <= balance * rate:
+        return None
+    else:
+        n = max(1, math.ceil(math.log(payment / (payment - rate * balance)) / math.log(1 + rate)))
+    # Nudge for floating-point error in the log solution
+    while n > 1 and _amortized_balance(balance, rate, payment, n - 1) == 0:
+        n -= 1
+    while _amortized_balance(balance, rate, payment, n) > 0:
+        n += 1
+    return n
+
+def _scheduled_interest(balance, rate, payment, months):
+    """Interest charged by the next ``months`` scheduled payments, in closed form."""
+    if months <= 0 or balance <= 0 or rate == 0:
+        return 0.0
+    remaining = _amortized_balance(balance, rate, payment, months)
+    if remaining > 0 and remaining != balance:
+        # Still amortizing after ``months`` payments: every payment was a full one
+        return payment * months - (balance - remaining)
+    payoff = _payments_to_payoff(balance, rate, payment)
+    if payoff is None:
+        return payment * months
+    # Full payments split into interest + principal; the final one only covers what is left
+    full = min(months, payoff - 1)
+    interest = payment * full - (balance - _amortized_balance(balance, rate, payment, full))
+    if months >= payoff:
+        interest += _amortized_balance(balance, rate, payment, payoff - 1) * rate
+    return interest
+
+class Loan(_Slotted, ledgers={"payment_history": PaymentLedger},
+           defaults={"payments_made": 0, "_segments": None}):
     """
     Represents a loan with principal, interest rate, and term.
 
+    The amortization schedule is kept analytically as a list of segments, each a
+    ``(payment_index, balance)`` starting point followed by scheduled payments, so
+    ``balance_at`` and ``interest_paid_between`` never replay payments. A new segment
+    starts only when an extra payment re-amortizes the loan.
+
     Attributes:
         loan_type (str): Type of loan (e.g., 'Student', 'Auto', 'Mortgage').
         original_amount (float): Original loan amount.
@@ -272,16 +524,27 @@ class Loan:
         interest_rate (float): Annual interest rate.
         term_years (int): Loan term in years.
         monthly_payment (float): Calculated monthly payment.
-        payment_history (list): List of payment records (dicts).
+        payment_history (PaymentLedger): Payment records (read as dicts).
+        payments_made (int): Number of scheduled monthly payments made so far.
     """
+    __slots__ = (
+        "_current_balance", "_monthly_payment", "_segments", "interest_rate", "loan_type",
+        "original_amount", "payment_history", "payments_made", "term_years",
+    )
+    current_balance = Cents()
+    monthly_payment = Cents()
+
     def __init__(self, loan_type, amount, interest_rate, term_years):
         self.loan_type = loan_type
         self.original_amount = amount
         self.current_balance = amount
         self.interest_rate = interest_rate
         self.term_years = term_years
-        self.monthly_payment = self.calculate_payment()
-        self.payment_history = []
+        # Round up to the cent so the schedule pays off within the term
+        self._monthly_payment = math.ceil(round(self.calculate_payment() * 100, 6))
+        self.payment_history = PaymentLedger()
+        self.payments_made = 0
+        self._segments = [(0, self.current_balance)]
 
     def calculate_payment(self):
         """Calculate the monthly payment for the loan. Returns the payment amount."""
@@ -289,42 +552,100 @@ class Loan:
         n = self.term_years * 12     # Total number of payments
         if r == 0:  # Handle zero interest case
             return self.original_amount / n
-        return (self.original_amount * r * (1 + r) ** n) / ((1 + r) ** n - 1)
+        growth = (1 + r) ** n
+        return (self.original_amount * r * growth) / (growth - 1)
 
     def make_payment(self, amount):
-        """Make a payment on the loan. Returns True if successful, raises LoanError on failure."""
+        """Make the scheduled monthly payment. Returns True if successful, raises LoanError on failure."""
+        self.make_payment_cents(to_cents(amount))
+        return True
+
+    def make_extra_payment(self, amount):
+        """Make an extra payment on top of the schedule and re-amortize from the new balance.
+        Returns True if successful, raises LoanError on failure."""
+        self.make_payment_cents(to_cents(amount), scheduled=False)
+        self.reamortize()
+        return True
+
+    def make_payment_cents(self, amount_cents, scheduled=True):
+        """``make_payment`` for a whole number of cents. An extra payment (``scheduled=False``)
+        does not count toward ``payments_made``."""
         try:
-            if amount <= 0:
+            if amount_cents <= 0:
                 raise LoanError("Payment amount must be positive.")
 
-            # Apply payment to interest first, then principal
-            interest_payment = self.current_balance * (self.interest_rate / 12)
+            # Apply payment to interest first, then principal (all in cents);
+            # a paid-off loan accrues nothing
+            balance = self._current_balance
+            interest_payment = round(balance * (self.interest_rate / 12)) if balance else 0
 
             # Check if payment covers interest
-            if amount <= interest_payment:
+            if amount_cents <= interest_payment:
                 # If payment doesn't cover interest, all goes to interest
-                interest_payment = amount
+                interest_payment = amount_cents
                 principal_payment = 0
             else:
                 # Payment covers interest and some principal
-                principal_payment = min(amount - interest_payment, self.current_balance)
-
-            self.current_balance -= principal_payment
-
-            if self.current_balance < 0.01:  # Handle small floating-point errors
-                self.current_balance = 0
+                principal_payment = min(amount_cents - interest_payment, balance)
 
-            self.payment_history.append({
-                "amount": amount,
-                "interest": interest_payment,
-                "principal": principal_payment
-            })
-            return True
+            self._current_balance = balance - principal_payment
+            history = self.payment_history
+            history.amounts.append(amount_cents)
+            history.interest.append(interest_payment)
+            history.principal.append(principal_payment)
         except Exception as e:
             logging.error(f"Loan payment error: {e}")
             raise LoanError(f"Loan payment failed: {e}")
-
-class Asset:
+        if scheduled:
+            self.payments_made += 1
+
+    # ---------------- Schedule ----------------
+    def reamortize(self):
+        """Start a new schedule segment from the current balance (after an off-schedule payment)."""
+        segments = self._schedule()
+        if segments[-1][0] == self.payments_made:
+            segments[-1] = (self.payments_made, self.current_balance)
+        else:
+            segments.append((self.payments_made, self.current_balance))
+
+    def _schedule(self):
+        if self._segments is None:
+            self._segments = [(self.payments_made, self.current_balance)]
+        return self._segments
+
+    def _segment_for(self, month):
+        """Index of the segment covering payment index ``month``."""
+        segments = self._schedule()
+        i = bisect.bisect_right(segments, month, key=lambda seg: seg[0]) - 1
+        return max(i, 0)
+
+    def balance_at(self, month):
+        """Balance after ``month`` scheduled payments (including extra payments made by then)."""
+        segments = self._schedule()
+        start, balance = segments[self._segment_for(month)]
+        return _amortized_balance(balance, self.interest_rate / 12, self.monthly_payment, month - start)
+
+    def interest_paid_between(self, a, b):
+        """Interest charged by scheduled payments ``a+1 .. b`` (i.e. over months ``(a, b]``)."""
+        segments = self._schedule()
+        rate = self.interest_rate / 12
+        total = 0.0
+        for i in range(self._segment_for(a), len(segments)):
+            start, balance = segments[i]
+            end = segments[i + 1][0] if i + 1 < len(segments) else b
+            lo, hi = max(a, start), min(b, end)
+            if lo >= b:
+                break
+            if hi > lo:
+                opening = _amortized_balance(balance, rate, self.monthly_payment, lo - start)
+                total += _scheduled_interest(opening, rate, self.monthly_payment, hi - lo)
+        return total
+
+    def remaining_payments(self):
+        """Scheduled payments left until payoff from the current balance (None if it never amortizes)."""
+        return _payments_to_payoff(self.current_balance, self.interest_rate / 12, self.monthly_payment)
+
+class Asset(_Slotted):
     """
     Represents an asset owned by the player (car, house, etc.).
 
@@ -336,6 +657,8 @@ class Asset:
         condition (str): Condition of the asset ('Good', 'Fair', 'Poor').
         age (int): Years since purchase.
     """
+    __slots__ = ("age", "asset_type", "condition", "current_value", "name", "purchase_value")
+
     def __init__(self, asset_type, name, value, condition="Good"):
         self.asset_type = asset_type
         self.name = name
@@ -344,8 +667,9 @@ class Asset:
         self.condition = condition
         self.age = 0  # Years since purchase
 
-    def age_asset(self):
-        """Age the asset by one year, affecting its value and condition."""
+    def age_asset(self, rng=random):
+        """Age the asset by one year, affecting its value and condition.
+        House appreciation is drawn from ``rng`` (defaults to the random module)."""
         self.age += 1
         
         # Update condition based on age
@@ -359,7 +683,7 @@ class Asset:
             self.current_value *= 0.85  # 15% depreciation per year
         elif self.asset_type == "House":
             # Houses might appreciate
-            appreciation = random.uniform(-0.05, 0.1)  # -5% to +10%
+            appreciation = rng.uniform(-0.05, 0.1)  # -5% to +10%
             self.current_value *= (1 + appreciation)
 
     def repair(self, cost):
@@ -371,10 +695,12 @@ class Asset:
             logging.error(f"Asset repair error: {e}")
             raise AssetError(f"Asset repair failed: {e}")
 
-class Insurance:
+class Insurance(_Slotted):
     """
     Represents insurance for an asset or health.
     """
+    __slots__ = ("active", "coverage_amount", "deductible", "insurance_type", "premium")
+
     def __init__(self, insurance_type, premium, coverage_amount, deductible):
         self.insurance_type = insurance_type  # e.g. 'Car', 'Home', 'Health'
         self.premium = premium  # Monthly cost
@@ -388,10 +714,12 @@ class Insurance:
         payout = max(0, min(loss_amount - self.deductible, self.coverage_amount))
         return payout
 
-class Investment:
+class Investment(_Slotted):
     """
     Represents an investment (stocks, bonds, retirement).
     """
+    __slots__ = ("amount", "expected_annual_return", "investment_type")
+
     def __init__(self, investment_type, amount, expected_annual_return):
         self.investment_type = investment_type  # e.g. 'Stock', 'Bond', 'Retirement'
         self.amount = amount
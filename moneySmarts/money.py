@@ -0,0 +1,46 @@
+"""
+Fixed-point money: balances are kept as integer cents.
+
+Models store whole cents in private slots and expose dollars through the
+``Cents`` descriptor, so ``player.cash -= 12.5`` keeps working while every
+stored balance is exact. Amounts are rounded half-to-even to the cent, the
+same rule as ``numpy.rint``, so the vectorized engines round identically.
+"""
+
+
+def to_cents(dollars):
+    """Dollar amount -> integer cents."""
+    return round(dollars * 100)
+
+
+def to_dollars(cents):
+    """Integer cents -> dollar amount."""
+    return cents / 100
+
+
+def to_money(dollars):
+    """Round a dollar amount to whole cents."""
+    return to_cents(dollars) / 100
+
+
+class Cents:
+    """
+    Descriptor exposing an integer-cents slot as dollars.
+
+    ``balance = Cents()`` on a class reads and writes the ``_balance`` slot,
+    which holds an int number of cents.
+    """
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj, self.slot) / 100
+
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, to_cents(value))
+
+
+__all__ = ["Cents", "to_cents", "to_dollars", "to_money"]
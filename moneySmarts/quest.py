@@ -46,7 +46,7 @@ class QuestManager:
     def check_all(self) -> List[Quest]:
         completed_now = []
         for q in self.quests:
-            if q.check(self.game):
+            if not q.completed and q.check(self.game):
                 completed_now.append(q)
         return completed_now
 
@@ -5,6 +5,7 @@ from moneySmarts.ui import Screen, Button
 from moneySmarts.screens.financial_screens import DepositScreen, WithdrawScreen, BankAccountScreen, SavingsDetailsScreen, BankDetailsScreen
 import os
 from moneySmarts.models import BankAccount  # added import
+from moneySmarts.fonts import get_font, load_font, render_text
 
 class BankScreen(Screen):
     """
@@ -16,13 +17,13 @@ class BankScreen(Screen):
         # Fonts
         try:
             font_path = os.path.join(ASSETS_DIR, 'fonts', 'pixelated_font.ttf')
-            self.title_font = pygame.font.Font(font_path, 48)
-            self.balance_font = pygame.font.Font(font_path, 28)
-            self.text_font = pygame.font.Font(font_path, 24)
+            self.title_font = load_font(font_path, 48)
+            self.balance_font = load_font(font_path, 28)
+            self.text_font = load_font(font_path, 24)
         except Exception:
-            self.title_font = pygame.font.SysFont('Arial', 48, bold=True)
-            self.balance_font = pygame.font.SysFont('Arial', 28, bold=True)
-            self.text_font = pygame.font.SysFont('Arial', 24)
+            self.title_font = get_font(48, bold=True)
+            self.balance_font = get_font(28, bold=True)
+            self.text_font = get_font(24)
         self.buttons = []
         self.create_buttons()
         self.status_message = None
@@ -55,26 +56,26 @@ class BankScreen(Screen):
             self.buttons.append(btn)
 
     def go_to_deposit(self):
-        self.game.gui_manager.set_screen(DepositScreen(self.game))
+        self.game.gui_manager.show(DepositScreen)
 
     def go_to_withdraw(self):
-        self.game.gui_manager.set_screen(WithdrawScreen(self.game))
+        self.game.gui_manager.show(WithdrawScreen)
 
     def go_to_deposit_savings(self):
-        self.game.gui_manager.set_screen(DepositToSavingsScreen(self.game))
+        self.game.gui_manager.show(DepositToSavingsScreen)
 
     def go_to_view_balance(self):
-        self.game.gui_manager.set_screen(BankDetailsScreen(self.game))
+        self.game.gui_manager.show(BankDetailsScreen)
 
     def go_to_view_savings(self):
-        self.game.gui_manager.set_screen(SavingsDetailsScreen(self.game))
+        self.game.gui_manager.show(SavingsDetailsScreen)
 
     def go_to_open_account(self):
-        self.game.gui_manager.set_screen(BankAccountScreen(self.game))
+        self.game.gui_manager.show(BankAccountScreen)
 
     def go_back(self):
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def handle_events(self, events):
         # Handle ESC to go back to the game screen
@@ -90,7 +91,7 @@ class BankScreen(Screen):
         # Header bar
         header_rect = pygame.Rect(0, 0, SCREEN_WIDTH, 80)
         pygame.draw.rect(surface, PRIMARY, header_rect)
-        title_surface = self.title_font.render("Bank", True, PRIMARY_TEXT)
+        title_surface = render_text(self.title_font, "Bank", True, PRIMARY_TEXT)
         title_rect = title_surface.get_rect(midleft=(40, 40))
         surface.blit(title_surface, title_rect)
         # Left card with balances
@@ -105,11 +106,11 @@ class BankScreen(Screen):
             f"Savings: ${player.savings_account.balance:.2f}" if getattr(player, 'savings_account', None) else "Savings: $0.00"
         ]
         for i, line in enumerate(info_lines):
-            text_surface = self.balance_font.render(line, True, BLACK)
+            text_surface = render_text(self.balance_font, line, True, BLACK)
             surface.blit(text_surface, (60, 140 + i * 36))
         # Status message
         if self.status_message:
-            status_surface = self.title_font.render(self.status_message, True, self.status_color)
+            status_surface = render_text(self.title_font, self.status_message, True, self.status_color)
             surface.blit(status_surface, (60, 260))
         # Draw buttons (right side)
         for button in self.buttons:
@@ -123,11 +124,11 @@ class DepositToSavingsScreen(Screen):
         super().__init__(game)
         try:
             font_path = os.path.join(ASSETS_DIR, 'fonts', 'pixelated_font.ttf')
-            self.title_font = pygame.font.Font(font_path, 40)
-            self.text_font = pygame.font.Font(font_path, 24)
+            self.title_font = load_font(font_path, 40)
+            self.text_font = load_font(font_path, 24)
         except Exception:
-            self.title_font = pygame.font.SysFont('Arial', 40, bold=True)
-            self.text_font = pygame.font.SysFont('Arial', 24)
+            self.title_font = get_font(40, bold=True)
+            self.text_font = get_font(24)
         self.input_active = False
         self.input_text = ""
         self.status_message = None
@@ -138,7 +139,7 @@ class DepositToSavingsScreen(Screen):
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
-                    self.game.gui_manager.set_screen(BankScreen(self.game))
+                    self.game.gui_manager.show(BankScreen)
                 elif event.key == pygame.K_RETURN:
                     self.deposit_to_savings()
                 elif event.key == pygame.K_BACKSPACE:
@@ -177,23 +178,23 @@ class DepositToSavingsScreen(Screen):
         # Background
         surface.fill(BG_TOP)
         # Title
-        title_surface = self.title_font.render("Deposit to Savings", True, BLACK)
+        title_surface = render_text(self.title_font, "Deposit to Savings", True, BLACK)
         surface.blit(title_surface, (40, 40))
         # Prompt
-        prompt_surface = self.text_font.render("Enter amount to deposit:", True, BLACK)
+        prompt_surface = render_text(self.text_font, "Enter amount to deposit:", True, BLACK)
         surface.blit(prompt_surface, (40, 120))
         # Input box
         input_box = pygame.Rect(40, 170, 260, 48)
         pygame.draw.rect(surface, CARD_BG, input_box, border_radius=8)
         pygame.draw.rect(surface, CARD_BORDER, input_box, 2, border_radius=8)
-        input_surface = self.text_font.render(self.input_text, True, BLACK)
+        input_surface = render_text(self.text_font, self.input_text, True, BLACK)
         surface.blit(input_surface, (input_box.x + 10, input_box.y + 10))
         # Status
         if self.status_message:
-            status_surface = self.text_font.render(self.status_message, True, self.status_color)
+            status_surface = render_text(self.text_font, self.status_message, True, self.status_color)
             surface.blit(status_surface, (40, 240))
         # Show current savings balance
         player = self.game.player
         savings_balance = getattr(getattr(player, 'savings_account', None), 'balance', 0.0)
-        balance_surface = self.text_font.render(f"Savings Balance: ${savings_balance:.2f}", True, BLACK)
+        balance_surface = render_text(self.text_font, f"Savings Balance: ${savings_balance:.2f}", True, BLACK)
         surface.blit(balance_surface, (40, 320))
@@ -9,7 +9,10 @@ from moneySmarts.ui import Screen, Button, TextInput
 from moneySmarts.sound_manager import SoundManager
 from moneySmarts.ui import GUIManager
 from moneySmarts.images import get_image_path
-from moneySmarts.image_manager import image_manager  # NEW
+from moneySmarts.image_manager import image_manager
+from moneySmarts.fonts import CachedText, get_font, load_font, render_text
+
+CONFIRM_DIALOG_SIZE = (480, 200)  # TitleScreen's yes/no dialog
 
 
 class TitleScreen(Screen):
@@ -19,7 +22,8 @@ class TitleScreen(Screen):
         super().__init__(game)
         # Load background image via image_manager
         self.background_image = None
-        self._background_original = image_manager.load_image('TITLE_BG')
+        self.background_key = 'TITLE_BG'
+        self._background_original = self.load_image(self.background_key)
         if self._background_original:
             self.background_image = self._background_original
         else:
@@ -31,12 +35,12 @@ class TitleScreen(Screen):
         assets_dir = os.path.join(root_dir, 'assets')
         font_path = os.path.join(assets_dir, PIXEL_FONT)
         try:
-            self.title_font = pygame.font.Font(font_path, FONT_TITLE)
-            self.subtitle_font = pygame.font.Font(font_path, FONT_LARGE)
+            self.title_font = load_font(font_path, FONT_TITLE)
+            self.subtitle_font = load_font(font_path, FONT_LARGE)
             button_font = font_path
         except Exception:
-            self.title_font = pygame.font.SysFont('Arial', FONT_TITLE)
-            self.subtitle_font = pygame.font.SysFont('Arial', FONT_LARGE)
+            self.title_font = get_font(FONT_TITLE)
+            self.subtitle_font = get_font(FONT_LARGE)
             button_font = None
 
         # Buttons with custom font
@@ -83,12 +87,14 @@ class TitleScreen(Screen):
         # Subtitle fade-in
         self.subtitle_alpha = 0
         self.subtitle_fade_speed = 2
+        # Own surface (not the shared text cache) since its alpha is changed
+        self.subtitle_text = CachedText(self.subtitle_font, (0, 100, 0))
 
 
     def start_new_game(self):
         """Start a new game (name input then intro)."""
         from moneySmarts.screens.base_screens import NameInputScreen
-        self.game.gui_manager.set_screen(NameInputScreen(self.game, next_screen='intro'))
+        self.game.gui_manager.show(NameInputScreen, next_screen='intro')
 
     def quit_game(self):
         """Quit the game."""
@@ -96,25 +102,21 @@ class TitleScreen(Screen):
 
     def confirm_start_new_game(self):
         if self.game.player is not None:
-            self.show_confirm = True
-            self.confirm_action = self.start_new_game
-            self.confirm_message = "Start a new game? Unsaved progress will be lost. Continue?"
+            self.open_confirm("Start a new game? Unsaved progress will be lost. Continue?",
+                              self.start_new_game)
         else:
             self.start_new_game()
 
     def confirm_quit_game(self):
-        self.show_confirm = True
-        self.confirm_action = self.quit_game
-        self.confirm_message = "Are you sure you want to quit? Unsaved progress will be lost."
+        self.open_confirm("Are you sure you want to quit? Unsaved progress will be lost.",
+                          self.quit_game)
 
     def save_game(self):
         try:
             self.game.save_state()
-            self.confirm_message = "Game saved successfully!"
+            self.open_confirm("Game saved successfully!")
         except Exception as e:
-            self.confirm_message = f"Save failed: {e}"
-        self.show_confirm = True
-        self.confirm_action = None
+            self.open_confirm(f"Save failed: {e}")
 
     def load_game(self):
         import pickle
@@ -122,14 +124,60 @@ class TitleScreen(Screen):
             with open("savegame.dat", "rb") as f:
                 loaded_game = pickle.load(f)
                 self.game.__dict__.update(loaded_game.__dict__)
-            self.confirm_message = "Game loaded successfully!"
+            self.open_confirm("Game loaded successfully!")
         except Exception as e:
-            self.confirm_message = f"Load failed: {e}"
+            self.open_confirm(f"Load failed: {e}")
+
+    def open_confirm(self, message, action=None):
+        """Show the confirm dialog; Yes runs ``action`` (if any) and both buttons close it."""
         self.show_confirm = True
-        self.confirm_action = None
+        self.confirm_action = action
+        self.confirm_message = message
+        self._create_confirm_buttons()
+        self.invalidate()
+
+    def _create_confirm_buttons(self):
+        # Built once per dialog so the pre-rendered surfaces and hover state persist
+        dialog_x = (SCREEN_WIDTH - CONFIRM_DIALOG_SIZE[0]) // 2
+        dialog_y = (SCREEN_HEIGHT - CONFIRM_DIALOG_SIZE[1]) // 2
+        self.confirm_buttons = [
+            Button(dialog_x + 60, dialog_y + 120, 140, 44, "Yes", action=self.confirm_yes),
+            Button(dialog_x + 280, dialog_y + 120, 140, 44, "No", action=self.confirm_no),
+        ]
+
+    def handle_events(self, events):
+        if not self.show_confirm:
+            super().handle_events(events)
+            return
+        # Only the dialog's buttons respond while it is open
+        mouse_pos = pygame.mouse.get_pos()
+        mouse_click = any(event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 for event in events)
+        for button in self.confirm_buttons or ():
+            action = button.update(mouse_pos, mouse_click)
+            if action:
+                action()
+                return
+
+    def needs_animation(self):
+        return True  # the coin rain never stops
+
+    def _heading_area(self):
+        """Area covered by the title and subtitle at the current title_y."""
+        title = render_text(self.title_font, "MONEY SMARTS", True, PRIMARY)
+        subtitle = self.subtitle_text.render("Financial Life Simulator")
+        return title.get_rect(center=(SCREEN_WIDTH // 2, self.title_y)).union(
+            subtitle.get_rect(center=(SCREEN_WIDTH // 2, self.title_y + 60)))
+
+    @staticmethod
+    def _coin_area(coin):
+        size = coin['size'] + 2
+        return pygame.Rect(int(coin['x']) - size, int(coin['y']) - size, size * 2, size * 2)
 
     def update(self):
-        """Update the title animation."""
+        """Update the title animation, reporting the areas it changes."""
+        heading = (self.title_y, self.subtitle_alpha)
+        if heading != (self.title_target_y, 255):
+            self.invalidate(self._heading_area())
         # Move title down to target position
         if self.title_y < self.title_target_y:
             self.title_y += self.title_speed
@@ -141,6 +189,8 @@ class TitleScreen(Screen):
             self.subtitle_alpha += self.subtitle_fade_speed
             if self.subtitle_alpha > 255:
                 self.subtitle_alpha = 255
+        if (self.title_y, self.subtitle_alpha) != heading:
+            self.invalidate(self._heading_area())
 
         # Update coin rain animation
         current_time = pygame.time.get_ticks() / 1000
@@ -155,20 +205,23 @@ class TitleScreen(Screen):
             })
             self.coin_spawn_timer = current_time + self.coin_spawn_rate
         for coin in self.coins[:]:
+            self.invalidate(self._coin_area(coin))
             coin['y'] += coin['speed']
             coin['rotation'] += coin['rotation_speed']
             if coin['y'] > SCREEN_HEIGHT + 50:
                 self.coins.remove(coin)
+            else:
+                self.invalidate(self._coin_area(coin))
 
     def draw(self, surface):
         # Dynamic resize of background to current window size
         if self._background_original:
             sw, sh = surface.get_size()
             if (not self.background_image) or self.background_image.get_width() != sw or self.background_image.get_height() != sh:
-                try:
-                    self.background_image = pygame.transform.smoothscale(self._background_original, (sw, sh))
-                except Exception:
-                    self.background_image = self._background_original
+                # Window sizes change on every resize step: cache in memory only
+                self.background_image = image_manager.load_image(self.background_key, size=(sw, sh),
+                                                                 persist=False) \
+                    or self._background_original
         # ...existing code...
         if self.background_image:
             try:
@@ -186,15 +239,15 @@ class TitleScreen(Screen):
             pygame.draw.circle(surface, GOLD, (int(coin['x']), int(coin['y'])), coin['size'])
             pygame.draw.circle(surface, DARK_GOLD, (int(coin['x']), int(coin['y'])), coin['size'], 1)
             font_size = max(6, int(coin['size'] * 1.2))
-            coin_font = pygame.font.SysFont('Arial', font_size)
-            text = coin_font.render("$", True, DARK_GOLD)
+            coin_font = get_font(font_size)
+            text = render_text(coin_font, "$", True, DARK_GOLD)
             text_rect = text.get_rect(center=(int(coin['x']), int(coin['y'])))
             surface.blit(text, text_rect)
         # Title and subtitle
-        title_surface = self.title_font.render("MONEY SMARTS", True, PRIMARY)
+        title_surface = render_text(self.title_font, "MONEY SMARTS", True, PRIMARY)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, self.title_y))
         surface.blit(title_surface, title_rect)
-        subtitle_surface = self.subtitle_font.render("Financial Life Simulator", True, (0, 100, 0))
+        subtitle_surface = self.subtitle_text.render("Financial Life Simulator")
         subtitle_surface.set_alpha(self.subtitle_alpha)
         subtitle_rect = subtitle_surface.get_rect(center=(SCREEN_WIDTH // 2, self.title_y + 60))
         surface.blit(subtitle_surface, subtitle_rect)
@@ -208,32 +261,31 @@ class TitleScreen(Screen):
             self.draw_confirm_dialog(surface)
 
     def draw_confirm_dialog(self, surface):
-        dialog_width, dialog_height = 480, 200
+        dialog_width, dialog_height = CONFIRM_DIALOG_SIZE
         dialog_x = (SCREEN_WIDTH - dialog_width) // 2
         dialog_y = (SCREEN_HEIGHT - dialog_height) // 2
         pygame.draw.rect(surface, CARD_BG, (dialog_x, dialog_y, dialog_width, dialog_height), border_radius=12)
         pygame.draw.rect(surface, CARD_BORDER, (dialog_x, dialog_y, dialog_width, dialog_height), 2, border_radius=12)
-        font = pygame.font.SysFont('Arial', FONT_MEDIUM)
-        text_surface = font.render(self.confirm_message, True, BLACK)
+        font = get_font(FONT_MEDIUM)
+        text_surface = render_text(font, self.confirm_message, True, BLACK)
         text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
         surface.blit(text_surface, text_rect)
-        yes_button = Button(dialog_x + 60, dialog_y + 120, 140, 44, "Yes", action=self.confirm_yes)
-        no_button = Button(dialog_x + 280, dialog_y + 120, 140, 44, "No", action=self.confirm_no)
-        yes_button.draw(surface)
-        no_button.draw(surface)
-        self.confirm_buttons = [yes_button, no_button]
+        if not self.confirm_buttons:
+            self._create_confirm_buttons()
+        for button in self.confirm_buttons:
+            button.draw(surface)
 
     def confirm_yes(self):
         if self.confirm_action:
             self.confirm_action()
-        self.show_confirm = False
-        self.confirm_action = None
-        self.confirm_message = ""
+        self.confirm_no()
 
     def confirm_no(self):
         self.show_confirm = False
         self.confirm_action = None
         self.confirm_message = ""
+        self.confirm_buttons = None
+        self.invalidate()
 
 class NameInputScreen(Screen):
     play_startup_music = True  # Enable music for this screen
@@ -243,7 +295,8 @@ class NameInputScreen(Screen):
         self.next_screen = next_screen  # 'intro' or 'overworld'
         # Load background image via image_manager
         self.background_image = None
-        self._background_original = image_manager.load_image('NAME_BG')
+        self.background_key = 'NAME_BG'
+        self._background_original = self.load_image(self.background_key)
         if self._background_original:
             self.background_image = self._background_original
         else:
@@ -254,11 +307,11 @@ class NameInputScreen(Screen):
         assets_dir = os.path.join(root_dir, 'assets')
         font_path = os.path.join(assets_dir, PIXEL_FONT)
         try:
-            self.title_font = pygame.font.Font(font_path, FONT_LARGE)
+            self.title_font = load_font(font_path, FONT_LARGE)
             input_font = font_path
             button_font = font_path
         except:
-            self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
+            self.title_font = get_font(FONT_LARGE)
             input_font = None
             button_font = None
         # Text input
@@ -295,33 +348,34 @@ class NameInputScreen(Screen):
         if name:
             from moneySmarts.models import Player
             self.game.player = Player(name)
+            self.game.gui_manager.forget_screens()  # nothing cached from a previous game
             if self.next_screen == 'overworld':
                 from moneySmarts.screens.overworld_screen import OverworldScreen
-                self.game.gui_manager.set_screen(OverworldScreen(self.game))
+                self.game.gui_manager.show(OverworldScreen)
             else:
                 from moneySmarts.screens.base_screens import IntroScreen
-                self.game.gui_manager.set_screen(IntroScreen(self.game))
+                self.game.gui_manager.show(IntroScreen)
 
     def go_back(self):
         """Go back to the title screen."""
         from moneySmarts.screens.base_screens import TitleScreen
-        self.game.gui_manager.set_screen(TitleScreen(self.game))
+        self.game.gui_manager.show(TitleScreen)
 
     def draw(self, surface):
         # Dynamic scaling per current window size
         if self._background_original:
             sw, sh = surface.get_size()
             if (not self.background_image) or self.background_image.get_width() != sw or self.background_image.get_height() != sh:
-                try:
-                    self.background_image = pygame.transform.smoothscale(self._background_original, (sw, sh))
-                except Exception:
-                    self.background_image = self._background_original
+                # Window sizes change on every resize step: cache in memory only
+                self.background_image = image_manager.load_image(self.background_key, size=(sw, sh),
+                                                                 persist=False) \
+                    or self._background_original
         if self.background_image:
             surface.blit(self.background_image, (0, 0))
         else:
             surface.fill(self.bg_color)
         # Title
-        title_surface = self.title_font.render("Enter Your Name", True, BLACK)
+        title_surface = render_text(self.title_font, "Enter Your Name", True, BLACK)
         title_rect = title_surface.get_rect(center=(surface.get_width() // 2, surface.get_height() // 4))
         surface.blit(title_surface, title_rect)
         if self.background_image:
@@ -348,7 +402,7 @@ class IntroScreen(Screen):
     def __init__(self, game):
         super().__init__(game)
         # Background via image_manager
-        self._background_original = image_manager.load_image('INTRO_BG')
+        self._background_original = self.load_image('INTRO_BG')
         self.background_image = self._background_original
         # Get the assets path
         current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -358,12 +412,12 @@ class IntroScreen(Screen):
         
         # Load fonts
         try:
-            self.title_font = pygame.font.Font(font_path, FONT_LARGE)
-            self.text_font = pygame.font.Font(font_path, FONT_MEDIUM)
+            self.title_font = load_font(font_path, FONT_LARGE)
+            self.text_font = load_font(font_path, FONT_MEDIUM)
             button_font = font_path
         except Exception:
-            self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-            self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+            self.title_font = get_font(FONT_LARGE)
+            self.text_font = get_font(FONT_MEDIUM)
             button_font = None
 
         # Buttons with custom font
@@ -394,18 +448,18 @@ class IntroScreen(Screen):
         self.game.player.bank_account = BankAccount()
         self.game.player.bank_account.deposit(50)  # Parents give you $50 to start
         from moneySmarts.screens.base_screens import DebitCardScreen
-        self.game.gui_manager.set_screen(DebitCardScreen(self.game))
+        self.game.gui_manager.show(DebitCardScreen)
 
     def skip_bank_account(self):
         """Skip opening a bank account and continue."""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def draw(self, surface):
         """Draw the intro screen with a modern theme."""
         surface.fill(self.bg_color)
         # Title
-        title_surface = self.title_font.render(f"Welcome, {self.game.player.name}!", True, BLACK)
+        title_surface = render_text(self.title_font, f"Welcome, {self.game.player.name}!", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
         # Card panel for text
@@ -422,7 +476,7 @@ class IntroScreen(Screen):
             "Would you like to open a bank account now?"
         ]
         for i, line in enumerate(intro_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 170 + i * 30))
             surface.blit(text_surface, text_rect)
         # Buttons
@@ -446,14 +500,14 @@ class DebitCardScreen(Screen):
         
         # Load fonts
         try:
-            self.title_font = pygame.font.Font(font_path, FONT_LARGE)
-            self.text_font = pygame.font.Font(font_path, FONT_MEDIUM)
-            self.card_font = pygame.font.Font(font_path, FONT_SMALL)
+            self.title_font = load_font(font_path, FONT_LARGE)
+            self.text_font = load_font(font_path, FONT_MEDIUM)
+            self.card_font = load_font(font_path, FONT_SMALL)
             button_font = font_path
         except Exception:
-            self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-            self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
-            self.card_font = pygame.font.SysFont('Arial', FONT_SMALL)
+            self.title_font = get_font(FONT_LARGE)
+            self.text_font = get_font(FONT_MEDIUM)
+            self.card_font = get_font(FONT_SMALL)
             button_font = None
             
         # Card dimensions
@@ -487,18 +541,18 @@ class DebitCardScreen(Screen):
         from moneySmarts.models import Card
         self.game.player.debit_card = Card("Debit")
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def skip_debit_card(self):
         """Skip getting a debit card and continue."""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def draw(self, surface):
         """Draw the debit card screen with modern theme."""
         surface.fill(self.bg_color)
         # Title
-        title_surface = self.title_font.render("Congratulations!", True, BLACK)
+        title_surface = render_text(self.title_font, "Congratulations!", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
         # Draw card
@@ -508,13 +562,13 @@ class DebitCardScreen(Screen):
         pygame.draw.rect(surface, PRIMARY, card_rect, border_radius=16)
         pygame.draw.rect(surface, PRIMARY_HOVER, card_rect, 3, border_radius=16)
         # Card text
-        card_title = self.text_font.render("DEBIT", True, WHITE)
+        card_title = render_text(self.text_font, "DEBIT", True, WHITE)
         card_title_rect = card_title.get_rect(center=(SCREEN_WIDTH // 2, card_y + 36))
         surface.blit(card_title, card_title_rect)
-        name_text = self.card_font.render(self.game.player.name, True, WHITE)
+        name_text = render_text(self.card_font, self.game.player.name, True, WHITE)
         name_rect = name_text.get_rect(center=(SCREEN_WIDTH // 2, card_y + self.card_height // 2))
         surface.blit(name_text, name_rect)
-        number_text = self.card_font.render("**** **** **** 1234", True, WHITE)
+        number_text = render_text(self.card_font, "**** **** **** 1234", True, WHITE)
         number_rect = number_text.get_rect(center=(SCREEN_WIDTH // 2, card_y + self.card_height - 28))
         surface.blit(number_text, number_rect)
         # Explanation text
@@ -526,7 +580,7 @@ class DebitCardScreen(Screen):
             "A debit card lets you spend directly from checking."
         ]
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 360 + i * 28))
             surface.blit(text_surface, text_rect)
         # Buttons
@@ -544,9 +598,9 @@ class EndGameScreen(Screen):
         self.reason = reason
 
         # Fonts
-        self.title_font = pygame.font.SysFont('Arial', FONT_TITLE)
-        self.subtitle_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_TITLE)
+        self.subtitle_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Calculate final stats
         self.cash = self.game.player.cash
@@ -598,7 +652,7 @@ class EndGameScreen(Screen):
     def draw_text(self, surface, text, x, y, center=False, is_title=False):
         """Helper method to draw text."""
         font = self.title_font if is_title else self.text_font
-        text_surface = font.render(text, True, BLACK)
+        text_surface = render_text(font, text, True, BLACK)
         if center:
             text_rect = text_surface.get_rect(center=(x, y))
         else:
@@ -618,16 +672,16 @@ class EndGameScreen(Screen):
             title = "GAME OVER"
             subtitle = f"Your financial journey has ended after {self.game.current_year} years."
 
-        title_surface = self.title_font.render(title, True, BLUE)
+        title_surface = render_text(self.title_font, title, True, BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 60))
         surface.blit(title_surface, title_rect)
 
-        subtitle_surface = self.subtitle_font.render(subtitle, True, BLACK)
+        subtitle_surface = render_text(self.subtitle_font, subtitle, True, BLACK)
         subtitle_rect = subtitle_surface.get_rect(center=(SCREEN_WIDTH // 2, 110))
         surface.blit(subtitle_surface, subtitle_rect)
 
         # Financial summary
-        summary_title = self.subtitle_font.render("FINAL FINANCIAL SUMMARY", True, BLACK)
+        summary_title = render_text(self.subtitle_font, "FINAL FINANCIAL SUMMARY", True, BLACK)
         summary_rect = summary_title.get_rect(center=(SCREEN_WIDTH // 2, 170))
         surface.blit(summary_title, summary_rect)
 
@@ -642,13 +696,13 @@ class EndGameScreen(Screen):
         ]
 
         for i, item in enumerate(summary_items):
-            text_surface = self.text_font.render(item, True, BLACK)
+            text_surface = render_text(self.text_font, item, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 210 + i * 30))
             surface.blit(text_surface, text_rect)
 
         # Family summary
         if self.game.player.family:
-            family_title = self.subtitle_font.render("FAMILY", True, BLACK)
+            family_title = render_text(self.subtitle_font, "FAMILY", True, BLACK)
             family_rect = family_title.get_rect(center=(SCREEN_WIDTH // 2, 430))
             surface.blit(family_title, family_rect)
 
@@ -659,22 +713,22 @@ class EndGameScreen(Screen):
                 else:
                     text = f"{member['relation']}: {member['name']}, Age {member['age'] + self.game.current_year}"
 
-                text_surface = self.text_font.render(text, True, BLACK)
+                text_surface = render_text(self.text_font, text, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
                 surface.blit(text_surface, text_rect)
                 y_pos += 30
 
         # Financial rating
-        rating_title = self.subtitle_font.render("Financial Rating:", True, BLACK)
+        rating_title = render_text(self.subtitle_font, "Financial Rating:", True, BLACK)
         rating_rect = rating_title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 180))
         surface.blit(rating_title, rating_rect)
 
-        rating_text = self.title_font.render(self.rating, True, self.rating_color)
+        rating_text = render_text(self.title_font, self.rating, True, self.rating_color)
         rating_text_rect = rating_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 140))
         surface.blit(rating_text, rating_text_rect)
 
         # Thank you message
-        thanks_text = self.text_font.render("Thank you for playing MONEY SMARTZ!", True, BLACK)
+        thanks_text = render_text(self.text_font, "Thank you for playing MONEY SMARTZ!", True, BLACK)
         thanks_rect = thanks_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 110))
         surface.blit(thanks_text, thanks_rect)
 
@@ -1,8 +1,8 @@
 import pygame
-import random
 from moneySmarts.constants import *
 from moneySmarts.ui import Screen, Button, TextInput
 from moneySmarts.models import BankAccount, Card
+from moneySmarts.fonts import get_font, render_text
 
 class BankAccountScreen(Screen):
     """
@@ -15,8 +15,8 @@ class BankAccountScreen(Screen):
         print(f"[DEBUG] BankAccountScreen initialized. game: {game}, player: {getattr(game, 'player', None)}")
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Account type selection
         self.selected_account_type = "Checking"
@@ -95,13 +95,13 @@ class BankAccountScreen(Screen):
                 self.game.player.cash -= deposit_amount
                 self.game.player.bank_account.deposit(deposit_amount)
                 from moneySmarts.screens.base_screens import DebitCardScreen
-                self.game.gui_manager.set_screen(DebitCardScreen(self.game))
+                self.game.gui_manager.show(DebitCardScreen)
             else:
                 self.game.player.savings_account = BankAccount("Savings")
                 self.game.player.cash -= deposit_amount
                 self.game.player.savings_account.deposit(deposit_amount)
                 from moneySmarts.screens.game_screen import GameScreen
-                self.game.gui_manager.set_screen(GameScreen(self.game))
+                self.game.gui_manager.show(GameScreen)
         except ValueError:
             # Invalid input, do nothing
             pass
@@ -109,7 +109,7 @@ class BankAccountScreen(Screen):
     def go_back(self):
         """Go back to the game screen."""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def handle_events(self, events):
         """Handle pygame events."""
@@ -127,7 +127,7 @@ class BankAccountScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Open a Bank Account", True, BLACK)
+        title_surface = render_text(self.title_font, "Open a Bank Account", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -142,7 +142,7 @@ class BankAccountScreen(Screen):
         ]
 
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
             surface.blit(text_surface, text_rect)
 
@@ -163,8 +163,8 @@ class BankDetailsScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Transaction history scroll
         self.scroll_position = 0
@@ -210,7 +210,7 @@ class BankDetailsScreen(Screen):
     def go_back(self):
         """Go back to the game screen."""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def draw(self, surface):
         """Draw the bank details screen."""
@@ -218,7 +218,7 @@ class BankDetailsScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Bank Account Details", True, BLACK)
+        title_surface = render_text(self.title_font, "Bank Account Details", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
         surface.blit(title_surface, title_rect)
 
@@ -243,12 +243,12 @@ class BankDetailsScreen(Screen):
             info_lines.append("You have a debit card linked to this account.")
 
         for i, line in enumerate(info_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 100 + i * 30))
             surface.blit(text_surface, text_rect)
 
         # Transaction history
-        history_title = self.title_font.render("Transaction History", True, BLACK)
+        history_title = render_text(self.title_font, "Transaction History", True, BLACK)
         history_rect = history_title.get_rect(center=(SCREEN_WIDTH // 2, 250))
         surface.blit(history_title, history_rect)
 
@@ -278,11 +278,11 @@ class BankDetailsScreen(Screen):
                     text = f"{transaction['type']}: ${transaction['amount']:.2f}"
                     color = BLACK
 
-                text_surface = self.text_font.render(text, True, color)
+                text_surface = render_text(self.text_font, text, True, color)
                 text_rect = text_surface.get_rect(midleft=(120, 300 + i * 30))
                 surface.blit(text_surface, text_rect)
         else:
-            no_transactions = self.text_font.render("No transactions yet.", True, BLACK)
+            no_transactions = render_text(self.text_font, "No transactions yet.", True, BLACK)
             no_transactions_rect = no_transactions.get_rect(center=(SCREEN_WIDTH // 2, 320))
             surface.blit(no_transactions, no_transactions_rect)
 
@@ -300,8 +300,8 @@ class DepositScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Amount input
         self.amount_input = TextInput(
@@ -365,7 +365,7 @@ class DepositScreen(Screen):
     def go_back(self):
         """Go back to the game screen."""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def handle_events(self, events):
         """Handle pygame events."""
@@ -378,7 +378,7 @@ class DepositScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Deposit to Bank", True, BLACK)
+        title_surface = render_text(self.title_font, "Deposit to Bank", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -391,7 +391,7 @@ class DepositScreen(Screen):
         ]
 
         for i, line in enumerate(info_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
             surface.blit(text_surface, text_rect)
 
@@ -400,7 +400,7 @@ class DepositScreen(Screen):
 
         # Draw status message
         if self.status_message:
-            status_surface = self.text_font.render(self.status_message, True, self.status_color)
+            status_surface = render_text(self.text_font, self.status_message, True, self.status_color)
             status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
             surface.blit(status_surface, status_rect)
 
@@ -418,8 +418,8 @@ class WithdrawScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Amount input
         self.amount_input = TextInput(
@@ -483,7 +483,7 @@ class WithdrawScreen(Screen):
     def go_back(self):
         """Go back to the game screen."""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def handle_events(self, events):
         """Handle pygame events."""
@@ -496,7 +496,7 @@ class WithdrawScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Withdraw from Bank", True, BLACK)
+        title_surface = render_text(self.title_font, "Withdraw from Bank", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -509,7 +509,7 @@ class WithdrawScreen(Screen):
         ]
 
         for i, line in enumerate(info_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
             surface.blit(text_surface, text_rect)
 
@@ -518,7 +518,7 @@ class WithdrawScreen(Screen):
 
         # Draw status message
         if self.status_message:
-            status_surface = self.text_font.render(self.status_message, True, self.status_color)
+            status_surface = render_text(self.text_font, self.status_message, True, self.status_color)
             status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
             surface.blit(status_surface, status_rect)
 
@@ -536,8 +536,8 @@ class GetDebitCardScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Buttons
         get_card_button = Button(
@@ -562,12 +562,12 @@ class GetDebitCardScreen(Screen):
         """Get a debit card and go back to the game screen."""
         self.game.player.debit_card = Card("Debit")
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def go_back(self):
         """Go back to the game screen."""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def draw(self, surface):
         """Draw the debit card screen."""
@@ -575,7 +575,7 @@ class GetDebitCardScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Get a Debit Card", True, BLACK)
+        title_surface = render_text(self.title_font, "Get a Debit Card", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -585,15 +585,15 @@ class GetDebitCardScreen(Screen):
         pygame.draw.rect(surface, BLACK, card_rect, 2)  # Border
 
         # Card text
-        card_title = self.text_font.render("DEBIT", True, WHITE)
+        card_title = render_text(self.text_font, "DEBIT", True, WHITE)
         card_title_rect = card_title.get_rect(center=(SCREEN_WIDTH // 2, 180))
         surface.blit(card_title, card_title_rect)
 
-        card_name = self.text_font.render(self.game.player.name, True, WHITE)
+        card_name = render_text(self.text_font, self.game.player.name, True, WHITE)
         card_name_rect = card_name.get_rect(center=(SCREEN_WIDTH // 2, 220))
         surface.blit(card_name, card_name_rect)
 
-        card_number = self.text_font.render("**** **** **** 1234", True, WHITE)
+        card_number = render_text(self.text_font, "**** **** **** 1234", True, WHITE)
         card_number_rect = card_number.get_rect(center=(SCREEN_WIDTH // 2, 260))
         surface.blit(card_number, card_number_rect)
 
@@ -606,7 +606,7 @@ class GetDebitCardScreen(Screen):
         ]
 
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 350 + i * 30))
             surface.blit(text_surface, text_rect)
 
@@ -625,9 +625,9 @@ class CreditCardScreen(Screen):
     
     def __init__(self, game):
         super().__init__(game)
-        self.font = pygame.font.SysFont('Arial', FONT_MEDIUM)
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE, bold=True)
-        self.small_font = pygame.font.SysFont('Arial', FONT_SMALL)
+        self.font = get_font(FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE, bold=True)
+        self.small_font = get_font(FONT_SMALL)
         self.message = ""
         self.message_color = BLACK
         self.approved = False
@@ -649,7 +649,7 @@ class CreditCardScreen(Screen):
 
     def go_back(self):
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def check_eligibility(self):
         # Check if player exists and is eligible for a credit card
@@ -722,7 +722,7 @@ class CreditCardScreen(Screen):
 
     def view_card_details(self):
         from moneySmarts.screens.financial_screens import CreditCardDetailsScreen
-        self.game.gui_manager.set_screen(CreditCardDetailsScreen(self.game))
+        self.game.gui_manager.show(CreditCardDetailsScreen)
 
     def draw(self, surface):
         surface.fill(WHITE)
@@ -731,7 +731,7 @@ class CreditCardScreen(Screen):
         header_rect = pygame.Rect(0, 0, SCREEN_WIDTH, 80)
         pygame.draw.rect(surface, PURPLE, header_rect)
 
-        header_text = self.title_font.render("CREDIT CARD APPLICATION", True, WHITE)
+        header_text = render_text(self.title_font, "CREDIT CARD APPLICATION", True, WHITE)
         header_rect = header_text.get_rect(center=(SCREEN_WIDTH // 2, 40))
         surface.blit(header_text, header_rect)
 
@@ -740,11 +740,11 @@ class CreditCardScreen(Screen):
         
         # Check if player exists before accessing attributes
         if self.game.player:
-            credit_score_text = self.font.render(f"Your Credit Score: {self.game.player.credit_score}", True, BLACK)
+            credit_score_text = render_text(self.font, f"Your Credit Score: {self.game.player.credit_score}", True, BLACK)
             surface.blit(credit_score_text, (50, info_y))
 
             if self.game.player.job:
-                income_text = self.font.render(f"Annual Income: ${self.game.player.salary}", True, BLACK)
+                income_text = render_text(self.font, f"Annual Income: ${self.game.player.salary}", True, BLACK)
                 surface.blit(income_text, (50, info_y + 30))
 
         # Draw message
@@ -762,7 +762,7 @@ class CreditCardScreen(Screen):
             message_lines.append(' '.join(current_line))
 
         for i, line in enumerate(message_lines):
-            message_text = self.font.render(line, True, self.message_color)
+            message_text = render_text(self.font, line, True, self.message_color)
             message_rect = message_text.get_rect(center=(SCREEN_WIDTH // 2, 180 + i * 30))
             surface.blit(message_text, message_rect)
 
@@ -773,19 +773,19 @@ class CreditCardScreen(Screen):
             pygame.draw.rect(surface, BLACK, card_rect, 2)  # Border
 
             # Card text
-            card_title = self.font.render("CREDIT CARD", True, WHITE)
+            card_title = render_text(self.font, "CREDIT CARD", True, WHITE)
             card_title_rect = card_title.get_rect(center=(SCREEN_WIDTH // 2, 280))
             surface.blit(card_title, card_title_rect)
 
-            card_name = self.font.render(self.game.player.name, True, WHITE)
+            card_name = render_text(self.font, self.game.player.name, True, WHITE)
             card_name_rect = card_name.get_rect(center=(SCREEN_WIDTH // 2, 320))
             surface.blit(card_name, card_name_rect)
 
-            card_number = self.font.render("**** **** **** 1234", True, WHITE)
+            card_number = render_text(self.font, "**** **** **** 1234", True, WHITE)
             card_number_rect = card_number.get_rect(center=(SCREEN_WIDTH // 2, 350))
             surface.blit(card_number, card_number_rect)
 
-            limit_text = self.small_font.render(f"Credit Limit: ${self.credit_limit:.2f}", True, WHITE)
+            limit_text = render_text(self.small_font, f"Credit Limit: ${self.credit_limit:.2f}", True, WHITE)
             limit_rect = limit_text.get_rect(center=(SCREEN_WIDTH // 2, 380))
             surface.blit(limit_text, limit_rect)
 
@@ -803,9 +803,9 @@ class CreditCardDetailsScreen(Screen):
         super().__init__(game)
         
         # Title and fonts
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
-        self.small_font = pygame.font.SysFont('Arial', FONT_SMALL)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
+        self.small_font = get_font(FONT_SMALL)
         
         # Transaction history scroll
         self.scroll_position = 0
@@ -859,30 +859,30 @@ class CreditCardDetailsScreen(Screen):
 
     def make_payment(self):
         """Navigate to the payment screen."""
-        self.game.gui_manager.set_screen(PayCreditCardScreen(self.game))
+        self.game.gui_manager.show(PayCreditCardScreen)
 
     def go_back(self):
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def draw(self, surface):
         surface.fill(WHITE)
         
         # Title
-        title_surface = self.title_font.render("Credit Card Details", True, BLACK)
+        title_surface = render_text(self.title_font, "Credit Card Details", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
         surface.blit(title_surface, title_rect)
         
         # Check if player exists and has been initialized
         if not self.game.player:
-            no_player_text = self.text_font.render("Game not started yet.", True, BLACK)
+            no_player_text = render_text(self.text_font, "Game not started yet.", True, BLACK)
             no_player_rect = no_player_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             surface.blit(no_player_text, no_player_rect)
             return
         
         # Check if player has a credit card
         if not self.game.player.credit_card:
-            no_card_text = self.text_font.render("You don't have a credit card yet.", True, BLACK)
+            no_card_text = render_text(self.text_font, "You don't have a credit card yet.", True, BLACK)
             no_card_rect = no_card_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             surface.blit(no_card_text, no_card_rect)
             return
@@ -893,19 +893,19 @@ class CreditCardDetailsScreen(Screen):
         pygame.draw.rect(surface, BLACK, card_rect, 2)  # Border
         
         # Card text
-        card_title = self.text_font.render("CREDIT CARD", True, WHITE)
+        card_title = render_text(self.text_font, "CREDIT CARD", True, WHITE)
         card_title_rect = card_title.get_rect(center=(card_rect.centerx, card_rect.top + 30))
         surface.blit(card_title, card_title_rect)
         
-        card_name = self.text_font.render(self.game.player.name, True, WHITE)
+        card_name = render_text(self.text_font, self.game.player.name, True, WHITE)
         card_name_rect = card_name.get_rect(center=(card_rect.centerx, card_rect.top + 80))
         surface.blit(card_name, card_name_rect)
         
-        card_number = self.text_font.render("**** **** **** 1234", True, WHITE)
+        card_number = render_text(self.text_font, "**** **** **** 1234", True, WHITE)
         card_number_rect = card_number.get_rect(center=(card_rect.centerx, card_rect.top + 120))
         surface.blit(card_number, card_number_rect)
         
-        limit_text = self.small_font.render(f"Credit Limit: ${self.game.player.credit_card.limit:.2f}", True, WHITE)
+        limit_text = render_text(self.small_font, f"Credit Limit: ${self.game.player.credit_card.limit:.2f}", True, WHITE)
         limit_rect = limit_text.get_rect(center=(card_rect.centerx, card_rect.top + 150))
         surface.blit(limit_text, limit_rect)
 
@@ -926,11 +926,11 @@ class CreditCardDetailsScreen(Screen):
         
         for i, line in enumerate(info_lines):
             color = RED if "Balance:" in line and self.game.player.credit_card.balance > 0 else BLACK
-            text_surface = self.text_font.render(line, True, color)
+            text_surface = render_text(self.text_font, line, True, color)
             surface.blit(text_surface, (info_x, info_y + i * 35))
         
         # Transaction history
-        history_title = self.text_font.render("Transaction History:", True, BLACK)
+        history_title = render_text(self.text_font, "Transaction History:", True, BLACK)
         surface.blit(history_title, (50, 300))
         
         # Transaction history area
@@ -956,10 +956,10 @@ class CreditCardDetailsScreen(Screen):
                     text = f"{transaction['type']}: ${transaction['amount']:.2f}"
                     color = BLACK
                 
-                text_surface = self.small_font.render(text, True, color)
+                text_surface = render_text(self.small_font, text, True, color)
                 surface.blit(text_surface, (60, y_pos))
         else:
-            no_transactions = self.text_font.render("No transactions yet.", True, BLACK)
+            no_transactions = render_text(self.text_font, "No transactions yet.", True, BLACK)
             no_transactions_rect = no_transactions.get_rect(center=(history_rect.centerx, history_rect.centery))
             surface.blit(no_transactions, no_transactions_rect)
         
@@ -977,8 +977,8 @@ class PayCreditCardScreen(Screen):
         super().__init__(game)
         
         # Title and fonts
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
         
         # Calculate minimum payment (with null checks)
         if self.game.player and self.game.player.credit_card:
@@ -1107,7 +1107,7 @@ class PayCreditCardScreen(Screen):
 
     def go_back(self):
         from moneySmarts.screens.financial_screens import CreditCardDetailsScreen
-        self.game.gui_manager.set_screen(CreditCardDetailsScreen(self.game))
+        self.game.gui_manager.show(CreditCardDetailsScreen)
 
     def handle_events(self, events):
         """Handle pygame events."""
@@ -1118,19 +1118,19 @@ class PayCreditCardScreen(Screen):
         surface.fill(WHITE)
         
         # Title
-        title_surface = self.title_font.render("Pay Credit Card", True, BLACK)
+        title_surface = render_text(self.title_font, "Pay Credit Card", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
         surface.blit(title_surface, title_rect)
         
         # Check if player exists and has credit card
         if not self.game.player:
-            no_player_text = self.text_font.render("Game not started yet.", True, BLACK)
+            no_player_text = render_text(self.text_font, "Game not started yet.", True, BLACK)
             no_player_rect = no_player_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             surface.blit(no_player_text, no_player_rect)
             return
         
         if not self.game.player.credit_card:
-            no_card_text = self.text_font.render("You don't have a credit card yet.", True, BLACK)
+            no_card_text = render_text(self.text_font, "You don't have a credit card yet.", True, BLACK)
             no_card_rect = no_card_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             surface.blit(no_card_text, no_card_rect)
             return
@@ -1150,12 +1150,12 @@ class PayCreditCardScreen(Screen):
         for i, line in enumerate(balance_info):
             if line:  # Skip empty lines
                 color = RED if "Current Balance:" in line else BLACK
-                text_surface = self.text_font.render(line, True, color)
+                text_surface = render_text(self.text_font, line, True, color)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 100 + i * 30))
                 surface.blit(text_surface, text_rect)
         
         # Custom amount input label
-        custom_label = self.text_font.render("Custom Amount:", True, BLACK)
+        custom_label = render_text(self.text_font, "Custom Amount:", True, BLACK)
         custom_label_rect = custom_label.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
         surface.blit(custom_label, custom_label_rect)
         
@@ -1164,7 +1164,7 @@ class PayCreditCardScreen(Screen):
         
         # Draw status message
         if self.status_message:
-            status_surface = self.text_font.render(self.status_message, True, self.status_color)
+            status_surface = render_text(self.text_font, self.status_message, True, self.status_color)
             status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 120))
             surface.blit(status_surface, status_rect)
 
@@ -1182,9 +1182,9 @@ class LoanDetailsScreen(Screen):
         super().__init__(game)
         
         # Title and fonts
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
-        self.small_font = pygame.font.SysFont('Arial', FONT_SMALL)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
+        self.small_font = get_font(FONT_SMALL)
         
         # Buttons
         back_button = Button(
@@ -1207,29 +1207,29 @@ class LoanDetailsScreen(Screen):
 
     def make_extra_payment(self):
         """Navigate to extra payment screen."""
-        self.game.gui_manager.set_screen(ExtraLoanPaymentScreen(self.game))
+        self.game.gui_manager.show(ExtraLoanPaymentScreen)
 
     def go_back(self):
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def draw(self, surface):
         surface.fill(WHITE)
         
         # Title
-        title_surface = self.title_font.render("Loan Details", True, BLACK)
+        title_surface = render_text(self.title_font, "Loan Details", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
         surface.blit(title_surface, title_rect)
         
         # Check if player exists and has been initialized
         if not self.game.player:
-            no_player_text = self.text_font.render("Game not started yet.", True, BLACK)
+            no_player_text = render_text(self.text_font, "Game not started yet.", True, BLACK)
             no_player_rect = no_player_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             surface.blit(no_player_text, no_player_rect)
             return
         
         if not self.game.player.loans:
-            no_loans_text = self.text_font.render("You don't have any loans.", True, BLACK)
+            no_loans_text = render_text(self.text_font, "You don't have any loans.", True, BLACK)
             no_loans_rect = no_loans_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             surface.blit(no_loans_text, no_loans_rect)
         else:
@@ -1240,7 +1240,7 @@ class LoanDetailsScreen(Screen):
             
             for i, loan in enumerate(self.game.player.loans):
                 # Loan header
-                loan_header = self.text_font.render(f"{loan.loan_type} #{i+1}", True, BLUE)
+                loan_header = render_text(self.text_font, f"{loan.loan_type} #{i+1}", True, BLUE)
                 surface.blit(loan_header, (50, y_pos))
                 y_pos += 40
                 
@@ -1267,7 +1267,7 @@ class LoanDetailsScreen(Screen):
 
                 for detail in loan_details:
                     color = RED if "Current Balance:" in detail else BLACK
-                    detail_surface = self.small_font.render(detail, True, color)
+                    detail_surface = render_text(self.small_font, detail, True, color)
                     surface.blit(detail_surface, (80, y_pos))
                     y_pos += 25
                 
@@ -1277,7 +1277,7 @@ class LoanDetailsScreen(Screen):
             
             # Summary section
             summary_y = SCREEN_HEIGHT - 200
-            summary_title = self.text_font.render("Summary", True, BLUE)
+            summary_title = render_text(self.text_font, "Summary", True, BLUE)
             surface.blit(summary_title, (50, summary_y))
             
             summary_details = [
@@ -1287,7 +1287,7 @@ class LoanDetailsScreen(Screen):
             
             for i, detail in enumerate(summary_details):
                 color = RED if total_remaining_balance > 0 else BLACK
-                detail_surface = self.text_font.render(detail, True, color)
+                detail_surface = render_text(self.text_font, detail, True, color)
                 surface.blit(detail_surface, (50, summary_y + 30 + i * 25))
         
         # Draw buttons
@@ -1304,8 +1304,8 @@ class ExtraLoanPaymentScreen(Screen):
         super().__init__(game)
         
         # Title and fonts
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
         
         # Selected loan index
         self.selected_loan_index = 0
@@ -1406,7 +1406,7 @@ class ExtraLoanPaymentScreen(Screen):
             # Try to pay from cash first
             if self.game.player.cash >= amount:
                 self.game.player.cash -= amount
-                selected_loan.make_payment(amount)
+                selected_loan.make_extra_payment(amount)
                 self.status_message = f"Payment of ${amount:.2f} made successfully from cash."
                 self.status_color = GREEN
                 
@@ -1419,7 +1419,7 @@ class ExtraLoanPaymentScreen(Screen):
             # Try to pay from bank account
             elif self.game.player.bank_account and self.game.player.bank_account.balance >= amount:
                 self.game.player.bank_account.withdraw(amount)
-                selected_loan.make_payment(amount)
+                selected_loan.make_extra_payment(amount)
                 self.status_message = f"Payment of ${amount:.2f} made successfully from bank account."
                 self.status_color = GREEN
                 
@@ -1447,7 +1447,7 @@ class ExtraLoanPaymentScreen(Screen):
 
     def go_back(self):
         from moneySmarts.screens.financial_screens import LoanDetailsScreen
-        self.game.gui_manager.set_screen(LoanDetailsScreen(self.game))
+        self.game.gui_manager.show(LoanDetailsScreen)
 
     def handle_events(self, events):
         """Handle pygame events."""
@@ -1458,25 +1458,25 @@ class ExtraLoanPaymentScreen(Screen):
         surface.fill(WHITE)
         
         # Title
-        title_surface = self.title_font.render("Make Extra Loan Payment", True, BLACK)
+        title_surface = render_text(self.title_font, "Make Extra Loan Payment", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
         surface.blit(title_surface, title_rect)
         
         # Check if player exists
         if not self.game.player:
-            no_player_text = self.text_font.render("Game not started yet.", True, BLACK)
+            no_player_text = render_text(self.text_font, "Game not started yet.", True, BLACK)
             no_player_rect = no_player_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             surface.blit(no_player_text, no_player_rect)
             return
         
         if not self.game.player.loans:
-            no_loans_text = self.text_font.render("You don't have any loans.", True, BLACK)
+            no_loans_text = render_text(self.text_font, "You don't have any loans.", True, BLACK)
             no_loans_rect = no_loans_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             surface.blit(no_loans_text, no_loans_rect)
         else:
             # Loan selection instruction
             if len(self.game.player.loans) > 1:
-                instruction_text = self.text_font.render("Select the loan you want to pay:", True, BLACK)
+                instruction_text = render_text(self.text_font, "Select the loan you want to pay:", True, BLACK)
                 instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, 120))
                 surface.blit(instruction_text, instruction_rect)
             
@@ -1498,12 +1498,12 @@ class ExtraLoanPaymentScreen(Screen):
             for i, line in enumerate(loan_info):
                 if line:  # Skip empty lines
                     color = RED if "Current Balance:" in line else BLACK
-                    text_surface = self.text_font.render(line, True, color)
+                    text_surface = render_text(self.text_font, line, True, color)
                     text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 280 + i * 30))
                     surface.blit(text_surface, text_rect)
             
             # Payment amount input label
-            payment_label = self.text_font.render("Extra Payment Amount:", True, BLACK)
+            payment_label = render_text(self.text_font, "Extra Payment Amount:", True, BLACK)
             payment_label_rect = payment_label.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 70))
             surface.blit(payment_label, payment_label_rect)
             
@@ -1520,7 +1520,7 @@ class ExtraLoanPaymentScreen(Screen):
                         interest_saved = extra_payment * monthly_interest
                         
                         benefit_text = f"Interest saved this month: ${interest_saved:.2f}"
-                        benefit_surface = self.text_font.render(benefit_text, True, GREEN)
+                        benefit_surface = render_text(self.text_font, benefit_text, True, GREEN)
                         benefit_rect = benefit_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 130))
                         surface.blit(benefit_surface, benefit_rect)
                 except ValueError:
@@ -1528,7 +1528,7 @@ class ExtraLoanPaymentScreen(Screen):
         
         # Status message
         if self.status_message:
-            status_surface = self.text_font.render(self.status_message, True, self.status_color)
+            status_surface = render_text(self.text_font, self.status_message, True, self.status_color)
             status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 200))
             surface.blit(status_surface, status_rect)
         
@@ -1546,9 +1546,9 @@ class AssetDetailsScreen(Screen):
         super().__init__(game)
         
         # Title and fonts
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
-        self.small_font = pygame.font.SysFont('Arial', FONT_SMALL)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
+        self.small_font = get_font(FONT_SMALL)
         
         # Buttons
         back_button = Button(
@@ -1563,25 +1563,25 @@ class AssetDetailsScreen(Screen):
 
     def go_back(self):
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def draw(self, surface):
         surface.fill(WHITE)
         
         # Title
-        title_surface = self.title_font.render("Asset Details", True, BLACK)
+        title_surface = render_text(self.title_font, "Asset Details", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
         surface.blit(title_surface, title_rect)
         
         # Check if player exists and has been initialized
         if not self.game.player:
-            no_player_text = self.text_font.render("Game not started yet.", True, BLACK)
+            no_player_text = render_text(self.text_font, "Game not started yet.", True, BLACK)
             no_player_rect = no_player_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             surface.blit(no_player_text, no_player_rect)
             return
         
         if not self.game.player.assets:
-            no_assets_text = self.text_font.render("You don't have any assets yet.", True, BLACK)
+            no_assets_text = render_text(self.text_font, "You don't have any assets yet.", True, BLACK)
             no_assets_rect = no_assets_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             surface.blit(no_assets_text, no_assets_rect)
         else:
@@ -1592,7 +1592,7 @@ class AssetDetailsScreen(Screen):
             
             for i, asset in enumerate(self.game.player.assets):
                 # Asset header with icon
-                asset_header = self.text_font.render(f"{asset.asset_type}: {asset.name}", True, BLUE)
+                asset_header = render_text(self.text_font, f"{asset.asset_type}: {asset.name}", True, BLUE)
                 surface.blit(asset_header, (50, y_pos))
                 y_pos += 40
                 
@@ -1635,7 +1635,7 @@ class AssetDetailsScreen(Screen):
                     else:
                         color = BLACK
                     
-                    detail_surface = self.small_font.render(detail, True, color)
+                    detail_surface = render_text(self.small_font, detail, True, color)
                     surface.blit(detail_surface, (80, y_pos))
                     y_pos += 25
                 
@@ -1645,7 +1645,7 @@ class AssetDetailsScreen(Screen):
             
             # Summary section
             summary_y = SCREEN_HEIGHT - 200
-            summary_title = self.text_font.render("Asset Portfolio Summary", True, BLUE)
+            summary_title = render_text(self.text_font, "Asset Portfolio Summary", True, BLUE)
             surface.blit(summary_title, (50, summary_y))
             
             total_change = total_current_value - total_purchase_value
@@ -1671,7 +1671,7 @@ class AssetDetailsScreen(Screen):
                 else:
                     color = BLACK
                 
-                detail_surface = self.text_font.render(detail, True, color)
+                detail_surface = render_text(self.text_font, detail, True, color)
                 surface.blit(detail_surface, (50, summary_y + 30 + i * 25))
             
             # Portfolio advice
@@ -1685,7 +1685,7 @@ class AssetDetailsScreen(Screen):
                 advice = "📊 Your asset portfolio is stable"
                 advice_color = BLACK
             
-            advice_surface = self.small_font.render(advice, True, advice_color)
+            advice_surface = render_text(self.small_font, advice, True, advice_color)
             surface.blit(advice_surface, (50, summary_y + 120))
         
         # Draw buttons
@@ -1702,8 +1702,8 @@ class JobSearchScreen(Screen):
         super().__init__(game)
 
         # Title and fonts
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Generate job options based on education and experience
         self.job_options = self.generate_job_options()
@@ -1775,7 +1775,7 @@ class JobSearchScreen(Screen):
 
         # Add some randomness to salaries (±10%)
         for job in job_options:
-            job["salary"] = int(job["salary"] * random.uniform(0.9, 1.1))
+            job["salary"] = int(job["salary"] * self.game.rng.uniform(0.9, 1.1))
 
         # Filter out jobs that don't offer at least 5% more than current salary (if employed)
         if self.game.player.job:
@@ -1802,7 +1802,7 @@ class JobSearchScreen(Screen):
         success_chance = min(0.95, base_success_chance)
 
         # Determine if application is successful
-        if random.random() < success_chance:
+        if self.game.rng.random() < success_chance:
             old_job = self.game.player.job
             old_salary = self.game.player.salary
 
@@ -1827,7 +1827,7 @@ class JobSearchScreen(Screen):
     def go_back(self):
         """Go back to the game screen."""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def draw(self, surface):
         """Draw the job search screen."""
@@ -1835,46 +1835,46 @@ class JobSearchScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Job Search", True, BLACK)
+        title_surface = render_text(self.title_font, "Job Search", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
         surface.blit(title_surface, title_rect)
 
         # Check if player exists
         if not self.game.player:
-            no_player_text = self.text_font.render("Game not started yet.", True, BLACK)
+            no_player_text = render_text(self.text_font, "Game not started yet.", True, BLACK)
             no_player_rect = no_player_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             surface.blit(no_player_text, no_player_rect)
             return
 
         # Current job info
         current_job_text = f"Current Job: {self.game.player.job if self.game.player.job else 'Unemployed'}"
-        current_job_surface = self.text_font.render(current_job_text, True, BLACK)
+        current_job_surface = render_text(self.text_font, current_job_text, True, BLACK)
         current_job_rect = current_job_surface.get_rect(center=(SCREEN_WIDTH // 2, 100))
         surface.blit(current_job_surface, current_job_rect)
 
         if self.game.player.job:
             salary_text = f"Current Salary: ${self.game.player.salary}/year"
-            salary_surface = self.text_font.render(salary_text, True, BLACK)
+            salary_surface = render_text(self.text_font, salary_text, True, BLACK)
             salary_rect = salary_surface.get_rect(center=(SCREEN_WIDTH // 2, 130))
             surface.blit(salary_surface, salary_rect)
 
         # Available jobs or no jobs message
         if self.job_options:
-            jobs_title = self.text_font.render("Available Job Opportunities:", True, BLACK)
+            jobs_title = render_text(self.text_font, "Available Job Opportunities:", True, BLACK)
             jobs_title_rect = jobs_title.get_rect(center=(SCREEN_WIDTH // 2, 180))
             surface.blit(jobs_title, jobs_title_rect)
 
-            jobs_subtitle = self.text_font.render("Click on a job to apply", True, BLACK)
+            jobs_subtitle = render_text(self.text_font, "Click on a job to apply", True, BLACK)
             jobs_subtitle_rect = jobs_subtitle.get_rect(center=(SCREEN_WIDTH // 2, 210))
             surface.blit(jobs_subtitle, jobs_subtitle_rect)
         else:
             no_jobs_text = "No better job opportunities available at this time."
-            no_jobs_surface = self.text_font.render(no_jobs_text, True, BLACK)
+            no_jobs_surface = render_text(self.text_font, no_jobs_text, True, BLACK)
             no_jobs_rect = no_jobs_surface.get_rect(center=(SCREEN_WIDTH // 2, 200))
             surface.blit(no_jobs_surface, no_jobs_rect)
 
             advice_text = "Keep building your skills and try again later!"
-            advice_surface = self.text_font.render(advice_text, True, BLACK)
+            advice_surface = render_text(self.text_font, advice_text, True, BLACK)
             advice_rect = advice_surface.get_rect(center=(SCREEN_WIDTH // 2, 230))
             surface.blit(advice_surface, advice_rect)
 
@@ -1895,7 +1895,7 @@ class JobSearchScreen(Screen):
                 lines.append(' '.join(current_line))
 
             for i, line in enumerate(lines):
-                status_surface = self.text_font.render(line, True, self.status_color)
+                status_surface = render_text(self.text_font, line, True, self.status_color)
                 status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 150 + i * 30))
                 surface.blit(status_surface, status_rect)
 
@@ -1910,8 +1910,8 @@ class SavingsDetailsScreen(Screen):
     play_startup_music = False
     def __init__(self, game):
         super().__init__(game)
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
         self.scroll_position = 0
         self.max_visible_transactions = 10
         back_button = Button(
@@ -1924,10 +1924,10 @@ class SavingsDetailsScreen(Screen):
         self.buttons = [back_button]
     def go_back(self):
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
     def draw(self, surface):
         surface.fill(WHITE)
-        title_surface = self.title_font.render("Savings Account Details", True, BLACK)
+        title_surface = render_text(self.title_font, "Savings Account Details", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
         surface.blit(title_surface, title_rect)
         account = self.game.player.savings_account
@@ -1937,10 +1937,10 @@ class SavingsDetailsScreen(Screen):
             f"Projected Annual Interest: ${account.balance * account.interest_rate:.2f}"
         ]
         for i, line in enumerate(info_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 100 + i * 30))
             surface.blit(text_surface, text_rect)
-        history_title = self.title_font.render("Transaction History", True, BLACK)
+        history_title = render_text(self.title_font, "Transaction History", True, BLACK)
         history_rect = history_title.get_rect(center=(SCREEN_WIDTH // 2, 250))
         surface.blit(history_title, history_rect)
         if account.transaction_history:
@@ -1963,11 +1963,11 @@ class SavingsDetailsScreen(Screen):
                 else:
                     text = f"{transaction['type']}: ${transaction['amount']:.2f}"
                     color = BLACK
-                text_surface = self.text_font.render(text, True, color)
+                text_surface = render_text(self.text_font, text, True, color)
                 text_rect = text_surface.get_rect(midleft=(120, 300 + i * 30))
                 surface.blit(text_surface, text_rect)
         else:
-            no_transactions = self.text_font.render("No transactions yet.", True, BLACK)
+            no_transactions = render_text(self.text_font, "No transactions yet.", True, BLACK)
             no_transactions_rect = no_transactions.get_rect(center=(SCREEN_WIDTH // 2, 320))
             surface.blit(no_transactions, no_transactions_rect)
         for button in self.buttons:
@@ -1980,8 +1980,8 @@ class DepositToSavingsScreen(Screen):
     play_startup_music = False
     def __init__(self, game):
         super().__init__(game)
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
         self.amount_input = TextInput(
             SCREEN_WIDTH // 2 - 150,
             SCREEN_HEIGHT // 2,
@@ -2030,7 +2030,7 @@ class DepositToSavingsScreen(Screen):
 
     def go_back(self):
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def handle_events(self, events):
         super().handle_events(events)
@@ -2038,7 +2038,7 @@ class DepositToSavingsScreen(Screen):
 
     def draw(self, surface):
         surface.fill(WHITE)
-        title_surface = self.title_font.render("Deposit to Savings", True, BLACK)
+        title_surface = render_text(self.title_font, "Deposit to Savings", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
         info_lines = [
@@ -2048,12 +2048,12 @@ class DepositToSavingsScreen(Screen):
             "How much would you like to deposit?"
         ]
         for i, line in enumerate(info_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
             surface.blit(text_surface, text_rect)
         self.amount_input.draw(surface)
         if self.status_message:
-            status_surface = self.text_font.render(self.status_message, True, self.status_color)
+            status_surface = render_text(self.text_font, self.status_message, True, self.status_color)
             status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
             surface.blit(status_surface, status_rect)
         for button in self.buttons:
@@ -2066,8 +2066,8 @@ class WithdrawFromSavingsScreen(Screen):
     play_startup_music = False
     def __init__(self, game):
         super().__init__(game)
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
         self.amount_input = TextInput(
             SCREEN_WIDTH // 2 - 150,
             SCREEN_HEIGHT // 2,
@@ -2113,13 +2113,13 @@ class WithdrawFromSavingsScreen(Screen):
             self.status_color = RED
     def go_back(self):
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
     def handle_events(self, events):
         super().handle_events(events)
         self.amount_input.update(events)
     def draw(self, surface):
         surface.fill(WHITE)
-        title_surface = self.title_font.render("Withdraw from Savings", True, BLACK)
+        title_surface = render_text(self.title_font, "Withdraw from Savings", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
         info_lines = [
@@ -2129,12 +2129,12 @@ class WithdrawFromSavingsScreen(Screen):
             "How much would you like to withdraw?"
         ]
         for i, line in enumerate(info_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
             surface.blit(text_surface, text_rect)
         self.amount_input.draw(surface)
         if self.status_message:
-            status_surface = self.text_font.render(self.status_message, True, self.status_color)
+            status_surface = render_text(self.text_font, self.status_message, True, self.status_color)
             status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
             surface.blit(status_surface, status_rect)
         for button in self.buttons:
@@ -1,6 +1,7 @@
 import pygame
 from moneySmarts.constants import *
 from moneySmarts.ui import Screen, Button
+from moneySmarts.fonts import load_font, render_text
 
 class GameOverScreen(Screen):
     def __init__(self, game, reason=None):
@@ -28,8 +29,8 @@ class GameOverScreen(Screen):
 
     def draw(self, surface):
         surface.fill((30, 30, 30))
-        font = pygame.font.Font(None, 48)
-        text = font.render(self.reason, True, (255, 0, 0))
+        font = load_font(None, 48)
+        text = render_text(font, self.reason, True, (255, 0, 0))
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
         surface.blit(text, rect)
         for btn in self.buttons:
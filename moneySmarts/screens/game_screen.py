@@ -1,14 +1,15 @@
 import pygame
-import random
 from moneySmarts.constants import *
 from moneySmarts.ui import Screen, Button
 from moneySmarts.utils import compute_net_worth
+from moneySmarts.fonts import CachedText, get_font, render_text
+from moneySmarts.event_manager import BALANCE_CHANGED
 
 
 def draw_text(surface, text, x, y, is_title=False):
     """Helper method to draw text."""
-    font = pygame.font.SysFont('Arial', FONT_LARGE if is_title else FONT_MEDIUM)
-    text_surface = font.render(text, True, BLACK)
+    font = get_font(FONT_LARGE if is_title else FONT_MEDIUM)
+    text_surface = render_text(font, text, True, BLACK)
     surface.blit(text_surface, (x, y))
 
 
@@ -17,6 +18,7 @@ class GameScreen(Screen):
     The main game screen that shows the player's status and allows them to take actions.
     """
     play_startup_music = False  # Disable music for this screen
+    reusable = True  # Kept by GUIManager.show; on_enter refreshes the buttons
     
     def __init__(self, game):
         super().__init__(game)
@@ -34,11 +36,35 @@ class GameScreen(Screen):
         self.show_quit_confirm = False
         self.quit_yes_btn = None
         self.quit_no_btn = None
+        # Changes at most once a month, so keep it out of the shared text cache
+        self.net_worth_text = CachedText(get_font(FONT_LARGE))
+        self.subscriptions.subscribe(BALANCE_CHANGED, self.on_balance_changed, weak=True)
+
+    def on_balance_changed(self, player):
+        """The balances shown here changed (delivered once per month, not per payment)."""
+        self.invalidate()
+
+    def _button_state(self):
+        """What create_buttons depends on, to tell whether they are stale."""
+        player = self.game.player
+        if not player:
+            return None
+        return (id(player), player.age >= 16, player.age >= 18, bool(player.job),
+                player.credit_card is not None,
+                bool(player.credit_card and player.credit_card.balance > 0),
+                bool(player.loans), bool(player.assets))
+
+    def on_enter(self):
+        """Rebuild the buttons only if the player's situation changed while away."""
+        self._cancel_quit()
+        if self._button_state() != self.button_state:
+            self.create_buttons()
 
     def create_buttons(self):
         """Create the buttons for the game screen."""
         # Clear existing buttons
         self.buttons = []
+        self.button_state = self._button_state()
         continue_button = Button(
             SCREEN_WIDTH - 220, SCREEN_HEIGHT - 60, 200, 50,
             "Continue to Next Month", action=self.continue_to_next_month)
@@ -73,7 +99,7 @@ class GameScreen(Screen):
             btns.append(Button(x_base + 220, y_base, 200, 50, "View Assets", action=self.view_assets))
         if not self.game.player.job and self.game.player.age >= 16:
             btns.append(Button(x_base + 220, y_base + y_step, 200, 50, "Look for a Job", action=self.look_for_job))
-        elif self.game.player.job and random.random() < 0.1:
+        elif self.game.player.job and self.game.rng.random() < 0.1:
             btns.append(Button(x_base + 220, y_base + y_step, 200, 50, "Look for a Better Job", action=self.look_for_job))
         # --- System Control Buttons ---
         self.buttons.extend([
@@ -92,8 +118,8 @@ class GameScreen(Screen):
         self.utility_skip_btn = Button(SCREEN_WIDTH//2+20, SCREEN_HEIGHT//2+40, 100, 50, "Skip", action=self.skip_utility_bill)
 
     def trigger_utility_popup(self):
-        self.current_utility_bill = random.choice(self.utility_bills)
-        self.utility_bill_amount = random.randint(self.current_utility_bill["min"], self.current_utility_bill["max"])
+        self.current_utility_bill = self.game.rng.choice(self.utility_bills)
+        self.utility_bill_amount = self.game.rng.randint(self.current_utility_bill["min"], self.current_utility_bill["max"])
         self.utility_popup_message = f"{self.current_utility_bill['name']} bill due: ${self.utility_bill_amount}. Pay now?"
         self.create_utility_popup_buttons()
         self.show_utility_popup = True
@@ -106,7 +132,7 @@ class GameScreen(Screen):
 
     def skip_utility_bill(self):
         # Utility shutoff chance if skipped
-        if random.random() < 0.5:  # 50% chance
+        if self.game.rng.random() < 0.5:  # 50% chance
             self.game.end_game_gui("Your utilities were shut off due to non-payment. Game Over.")
         self.show_utility_popup = False
         self.create_buttons()
@@ -135,7 +161,7 @@ class GameScreen(Screen):
             reason = "Congratulations! You reached retirement age."
         if reason:
             from moneySmarts.screens.game_over_screen import GameOverScreen
-            self.game.gui_manager.set_screen(GameOverScreen(self.game, reason=reason))
+            self.game.gui_manager.show(GameOverScreen, reason=reason)
             return True
         return False
 
@@ -145,26 +171,11 @@ class GameScreen(Screen):
         if not self.game.player:
             return
             
-        # Increment month
-        self.game.current_month += 1
-        if self.game.current_month > 12:
-            self.game.current_month = 1
-            self.game.current_year += 1
-            self.game.player.age += 1
-            
-            # Apply interest to savings
-            if self.game.player.bank_account and self.game.player.bank_account.account_type == "Savings":
-                self.game.player.bank_account.apply_interest()
-            
-            # Age assets
-            for asset in self.game.player.assets:
-                asset.age_asset()
-        
-        # Process monthly finances
-        self.game.process_monthly_finances()
-        
+        # Calendar, yearly interest and aging, monthly finances and the history row
+        self.game.advance_month()
+
         # Random events
-        if random.random() < 0.3:  # 30% chance of an event each month
+        if self.game.rng.random() < 0.3:  # 30% chance of an event each month
             self.game.trigger_random_event()
             # Don't proceed further until event is handled
             return
@@ -186,67 +197,67 @@ class GameScreen(Screen):
     def open_bank_account(self):
         """Open a bank account screen."""
         from moneySmarts.screens.financial_screens import BankAccountScreen
-        self.game.gui_manager.set_screen(BankAccountScreen(self.game))
+        self.game.gui_manager.show(BankAccountScreen)
 
     def view_bank_account(self):
         """View bank account details."""
         from moneySmarts.screens.financial_screens import BankDetailsScreen
-        self.game.gui_manager.set_screen(BankDetailsScreen(self.game))
+        self.game.gui_manager.show(BankDetailsScreen)
 
     def deposit_to_bank(self):
         """Deposit money to bank account."""
         from moneySmarts.screens.financial_screens import DepositScreen
-        self.game.gui_manager.set_screen(DepositScreen(self.game))
+        self.game.gui_manager.show(DepositScreen)
 
     def withdraw_from_bank(self):
         """Withdraw money from bank account."""
         from moneySmarts.screens.financial_screens import WithdrawScreen
-        self.game.gui_manager.set_screen(WithdrawScreen(self.game))
+        self.game.gui_manager.show(WithdrawScreen)
 
     def get_debit_card(self):
         """Get a debit card."""
         from moneySmarts.screens.financial_screens import GetDebitCardScreen
-        self.game.gui_manager.set_screen(GetDebitCardScreen(self.game))
+        self.game.gui_manager.show(GetDebitCardScreen)
 
     def apply_for_credit_card(self):
         """Apply for a credit card."""
         from moneySmarts.screens.financial_screens import CreditCardScreen
-        self.game.gui_manager.set_screen(CreditCardScreen(self.game))
+        self.game.gui_manager.show(CreditCardScreen)
 
     def view_credit_card(self):
         """View credit card details."""
         from moneySmarts.screens.financial_screens import CreditCardDetailsScreen
-        self.game.gui_manager.set_screen(CreditCardDetailsScreen(self.game))
+        self.game.gui_manager.show(CreditCardDetailsScreen)
 
     def pay_credit_card(self):
         """Make a payment on the credit card."""
         from moneySmarts.screens.financial_screens import PayCreditCardScreen
-        self.game.gui_manager.set_screen(PayCreditCardScreen(self.game))
+        self.game.gui_manager.show(PayCreditCardScreen)
 
     def view_loans(self):
         """View loan details."""
         from moneySmarts.screens.financial_screens import LoanDetailsScreen
-        self.game.gui_manager.set_screen(LoanDetailsScreen(self.game))
+        self.game.gui_manager.show(LoanDetailsScreen)
 
     def make_extra_loan_payment(self):
         """Make an extra payment on a loan."""
         from moneySmarts.screens.financial_screens import ExtraLoanPaymentScreen
-        self.game.gui_manager.set_screen(ExtraLoanPaymentScreen(self.game))
+        self.game.gui_manager.show(ExtraLoanPaymentScreen)
 
     def view_assets(self):
         """View asset details."""
         from moneySmarts.screens.financial_screens import AssetDetailsScreen
-        self.game.gui_manager.set_screen(AssetDetailsScreen(self.game))
+        self.game.gui_manager.show(AssetDetailsScreen)
 
     def look_for_job(self):
         """Look for a job or a better job."""
         from moneySmarts.screens.financial_screens import JobSearchScreen
-        self.game.gui_manager.set_screen(JobSearchScreen(self.game))
+        self.game.gui_manager.show(JobSearchScreen)
 
     def open_shop(self):
         """Open the shop screen."""
         from moneySmarts.screens.shop_screen import ShopScreen
-        self.game.gui_manager.set_screen(ShopScreen(self.game))
+        self.game.gui_manager.show(ShopScreen)
 
     def pause_game(self):
         """Pause the game (stops updates, disables actions)."""
@@ -298,14 +309,14 @@ class GameScreen(Screen):
         pygame.draw.rect(surface, BLUE, (0, 0, SCREEN_WIDTH, 80))
 
         # Title
-        title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        title_surface = title_font.render(f"MONTH: {self.game.current_month}/YEAR: {self.game.current_year + 2023}", True, WHITE)
+        title_font = get_font(FONT_LARGE)
+        title_surface = render_text(title_font, f"MONTH: {self.game.current_month}/YEAR: {self.game.current_year + 2023}", True, WHITE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 25))
         surface.blit(title_surface, title_rect)
 
         # Check if player exists before drawing player info
         if not self.game.player:
-            no_player_text = title_font.render("Please start a new game", True, WHITE)
+            no_player_text = render_text(title_font, "Please start a new game", True, WHITE)
             no_player_rect = no_player_text.get_rect(center=(SCREEN_WIDTH // 2, 55))
             surface.blit(no_player_text, no_player_rect)
             
@@ -314,12 +325,12 @@ class GameScreen(Screen):
                 button.draw(surface)
             return
 
-        age_surface = title_font.render(f"AGE: {self.game.player.age}", True, WHITE)
+        age_surface = render_text(title_font, f"AGE: {self.game.player.age}", True, WHITE)
         age_rect = age_surface.get_rect(center=(SCREEN_WIDTH // 2, 55))
         surface.blit(age_surface, age_rect)
 
         # Player info section
-        info_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        info_font = get_font(FONT_MEDIUM)
 
         # Name and education
         draw_text(surface, f"Name: {self.game.player.name}", 20, 100)
@@ -373,9 +384,7 @@ class GameScreen(Screen):
         # Calculate and display net worth
         net_worth = compute_net_worth(self.game.player)
         net_worth_color = GREEN if net_worth >= 0 else RED
-        net_worth_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        net_worth_text = f"NET WORTH: ${net_worth:.2f}"
-        net_worth_surface = net_worth_font.render(net_worth_text, True, net_worth_color)
+        net_worth_surface = self.net_worth_text.render(f"NET WORTH: ${net_worth:.2f}", net_worth_color)
         net_worth_rect = net_worth_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 330))
         surface.blit(net_worth_surface, net_worth_rect)
 
@@ -386,8 +395,8 @@ class GameScreen(Screen):
         # Draw utility bill popup if needed
         if self.show_utility_popup:
             pygame.draw.rect(surface, LIGHT_GRAY, (SCREEN_WIDTH//2-200, SCREEN_HEIGHT//2-100, 400, 200))
-            font = pygame.font.SysFont('Arial', FONT_MEDIUM)
-            msg_surface = font.render(self.utility_popup_message, True, BLACK)
+            font = get_font(FONT_MEDIUM)
+            msg_surface = render_text(font, self.utility_popup_message, True, BLACK)
             msg_rect = msg_surface.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2-30))
             surface.blit(msg_surface, msg_rect)
             self.utility_pay_btn.draw(surface)
@@ -406,9 +415,9 @@ class GameScreen(Screen):
             box_y = (SCREEN_HEIGHT - box_h) // 2
             pygame.draw.rect(surface, LIGHT_GRAY, (box_x, box_y, box_w, box_h), border_radius=12)
             pygame.draw.rect(surface, DARK_GRAY, (box_x, box_y, box_w, box_h), 3, border_radius=12)
-            font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+            font = get_font(FONT_MEDIUM)
             msg = "Are you sure you want to quit?"
-            msg_surface = font.render(msg, True, BLACK)
+            msg_surface = render_text(font, msg, True, BLACK)
             msg_rect = msg_surface.get_rect(center=(SCREEN_WIDTH//2, box_y + 60))
             surface.blit(msg_surface, msg_rect)
             # Buttons
@@ -457,33 +466,33 @@ class GameScreen(Screen):
 
     def open_banking_menu(self):
         from moneySmarts.screens.bank_screen import BankScreen
-        self.game.gui_manager.set_screen(BankScreen(self.game))
+        self.game.gui_manager.show(BankScreen)
 
     def open_savings_account(self):
         """Open a savings account screen."""
         from moneySmarts.screens.financial_screens import BankAccountScreen
-        self.game.gui_manager.set_screen(BankAccountScreen(self.game))
+        self.game.gui_manager.show(BankAccountScreen)
 
     def view_savings_account(self):
         """View savings account details."""
         from moneySmarts.screens.financial_screens import SavingsDetailsScreen
-        self.game.gui_manager.set_screen(SavingsDetailsScreen(self.game))
+        self.game.gui_manager.show(SavingsDetailsScreen)
 
     def deposit_to_savings(self):
         """Deposit money to savings account."""
         from moneySmarts.screens.financial_screens import DepositToSavingsScreen
-        self.game.gui_manager.set_screen(DepositToSavingsScreen(self.game))
+        self.game.gui_manager.show(DepositToSavingsScreen)
 
     def withdraw_from_savings(self):
         """Withdraw money from savings account."""
         from moneySmarts.screens.financial_screens import WithdrawFromSavingsScreen
-        self.game.gui_manager.set_screen(WithdrawFromSavingsScreen(self.game))
+        self.game.gui_manager.show(WithdrawFromSavingsScreen)
 
     def open_inventory(self):
         from moneySmarts.screens.inventory_screen import InventoryScreen
-        self.game.gui_manager.set_screen(InventoryScreen(self.game))
+        self.game.gui_manager.show(InventoryScreen)
 
     def open_overworld(self):
         """Switch to the overworld exploration screen."""
         from moneySmarts.screens.overworld_screen import OverworldScreen
-        self.game.gui_manager.set_screen(OverworldScreen(self.game))
+        self.game.gui_manager.show(OverworldScreen)
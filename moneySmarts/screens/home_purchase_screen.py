@@ -2,6 +2,7 @@ import pygame
 import os
 from moneySmarts.constants import *
 from moneySmarts.ui import Screen, Button
+from moneySmarts.fonts import get_font, render_text
 
 HOME_OPTIONS = [
     {"name": "Starter Home", "price": 3000, "desc": "A cozy starter home. Affordable and simple."},
@@ -59,7 +60,7 @@ class HomePurchaseScreen(Screen):
         from moneySmarts.screens.shop_screen import ShopScreen
         self.selected_home = None
         self.message = ""
-        self.game.gui_manager.set_screen(ShopScreen(self.game))
+        self.game.gui_manager.show(ShopScreen)
 
     def draw_house_placeholder(self, surface, x, y):
         # Draw a simple house placeholder at (x, y)
@@ -77,28 +78,28 @@ class HomePurchaseScreen(Screen):
 
     def draw(self, surface):
         surface.fill(BG_TOP)
-        font = pygame.font.SysFont('Arial', FONT_LARGE)
-        title = font.render("Choose Your Home", True, PRIMARY)
+        font = get_font(FONT_LARGE)
+        title = render_text(font, "Choose Your Home", True, PRIMARY)
         surface.blit(title, (80, 60))
-        font_small = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        font_small = get_font(FONT_MEDIUM)
         y = 150
         for idx, home in enumerate(HOME_OPTIONS):
             # Draw placeholder house
             self.draw_house_placeholder(surface, 30, y - 20)
-            desc = font_small.render(home['desc'], True, BLACK)
+            desc = render_text(font_small, home['desc'], True, BLACK)
             surface.blit(desc, (500, y+20))
             y += 90
         for btn in self.buttons:
             btn.draw(surface)
         self.buy_btn.draw(surface)
         self.back_btn.draw(surface)
-        msg_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        msg_font = get_font(FONT_MEDIUM)
         # Show message as popup if not enough funds
         if self.message == "Not enough cash.":
             popup_rect = pygame.Rect(250, 250, 520, 160)
             pygame.draw.rect(surface, (255, 240, 240), popup_rect, border_radius=12)
             pygame.draw.rect(surface, DANGER, popup_rect, 3, border_radius=12)
-            msg = msg_font.render(self.message, True, DANGER)
+            msg = render_text(msg_font, self.message, True, DANGER)
             surface.blit(msg, (popup_rect.x + 40, popup_rect.y + 40))
             # Draw OK button centered at bottom of popup
             ok_btn_width, ok_btn_height = 140, 40
@@ -106,12 +107,12 @@ class HomePurchaseScreen(Screen):
             ok_btn_y = popup_rect.y + popup_rect.height - ok_btn_height - 20
             ok_btn_rect = pygame.Rect(ok_btn_x, ok_btn_y, ok_btn_width, ok_btn_height)
             pygame.draw.rect(surface, SUCCESS, ok_btn_rect, border_radius=8)
-            ok_text = msg_font.render("OK", True, WHITE)
+            ok_text = render_text(msg_font, "OK", True, WHITE)
             surface.blit(ok_text, (ok_btn_rect.x + 45, ok_btn_rect.y + 5))
             self.ok_btn_rect = ok_btn_rect
             return  # Prevent drawing other popups/buttons
         else:
-            msg = msg_font.render(self.message, True, DANGER if "Not" in self.message else SUCCESS)
+            msg = render_text(msg_font, self.message, True, DANGER if "Not" in self.message else SUCCESS)
             surface.blit(msg, (80, 420))
         # Draw popup if needed
         if self.show_popup:
@@ -120,7 +121,7 @@ class HomePurchaseScreen(Screen):
             pygame.draw.rect(surface, ACCENT, popup_rect, 3, border_radius=12)
             lines = self.popup_text.split('\n')
             for i, line in enumerate(lines):
-                line_surf = msg_font.render(line, True, BLACK)
+                line_surf = render_text(msg_font, line, True, BLACK)
                 surface.blit(line_surf, (popup_rect.x + 30, popup_rect.y + 30 + i * 35))
             # Draw OK button centered at bottom of popup
             ok_btn_width, ok_btn_height = 140, 40
@@ -128,7 +129,7 @@ class HomePurchaseScreen(Screen):
             ok_btn_y = popup_rect.y + popup_rect.height - ok_btn_height - 20
             ok_btn_rect = pygame.Rect(ok_btn_x, ok_btn_y, ok_btn_width, ok_btn_height)
             pygame.draw.rect(surface, SUCCESS, ok_btn_rect, border_radius=8)
-            ok_text = msg_font.render("OK", True, WHITE)
+            ok_text = render_text(msg_font, "OK", True, WHITE)
             surface.blit(ok_text, (ok_btn_rect.x + 45, ok_btn_rect.y + 5))
             self.ok_btn_rect = ok_btn_rect
         else:
@@ -1,6 +1,7 @@
 import pygame
 from moneySmarts.ui import Screen, Button
 from moneySmarts.constants import *
+from moneySmarts.fonts import get_font, render_text
 
 class InventoryScreen(Screen):
     """
@@ -25,7 +26,7 @@ class InventoryScreen(Screen):
         Return to the main game screen.
         """
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def draw(self, surface):
         """
@@ -34,18 +35,18 @@ class InventoryScreen(Screen):
             surface: The pygame surface to draw on.
         """
         surface.fill((245, 245, 255))
-        font = pygame.font.SysFont('Arial', 32)
-        title = font.render("Inventory", True, BLUE)
+        font = get_font(32)
+        title = render_text(font, "Inventory", True, BLUE)
         surface.blit(title, (40, 100))
         y = 160
-        font_small = pygame.font.SysFont('Arial', 24)
+        font_small = get_font(24)
         if not self.game.player.assets:
-            surface.blit(font_small.render("No items purchased yet.", True, BLACK), (40, y))
+            surface.blit(render_text(font_small, "No items purchased yet.", True, BLACK), (40, y))
         else:
             for asset in self.game.player.assets:
                 # Show asset name, type, value, and condition for realism
                 asset_text = f"{asset.name} ({asset.asset_type}) - ${asset.current_value:.2f} - {asset.condition}"
-                surface.blit(font_small.render(asset_text, True, BLACK), (40, y))
+                surface.blit(render_text(font_small, asset_text, True, BLACK), (40, y))
                 y += 40
         self.back_btn.draw(surface)
 
@@ -1,10 +1,12 @@
 import pygame
-import random
 import os
 from pygame.locals import *
 from moneySmarts.constants import *
 from moneySmarts.ui import Screen, Button, TextInput
 from moneySmarts.models import Loan, Asset, Card
+from moneySmarts.fonts import get_font, render_text
+from moneySmarts.image_manager import image_manager
+from moneySmarts.world_assets import building_index
 
 BROWN = (139, 69, 19)
 
@@ -17,8 +19,8 @@ class HighSchoolGraduationScreen(Screen):
 
         # Title
         self.recurring_bill_message = None
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Buttons
         college_button = Button(
@@ -79,7 +81,7 @@ class HighSchoolGraduationScreen(Screen):
 
         # Return to game screen
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def go_to_trade_school(self):
         """Choose to go to trade school."""
@@ -100,7 +102,7 @@ class HighSchoolGraduationScreen(Screen):
 
         # Return to game screen
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def start_working(self):
         """Choose to start working full-time."""
@@ -109,14 +111,14 @@ class HighSchoolGraduationScreen(Screen):
 
         # Go to job search screen
         from moneySmarts.screens.financial_screens import JobSearchScreen
-        self.game.gui_manager.set_screen(JobSearchScreen(self.game))
+        self.game.gui_manager.show(JobSearchScreen)
 
     def draw(self, surface):
         """Draw the high school graduation screen with modern UI."""
         surface.fill(BG_TOP)
 
         # Title
-        title_surface = self.title_font.render("HIGH SCHOOL GRADUATION", True, PRIMARY)
+        title_surface = render_text(self.title_font, "HIGH SCHOOL GRADUATION", True, PRIMARY)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -152,7 +154,7 @@ class HighSchoolGraduationScreen(Screen):
         ]
 
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 300 + i * 30))
             surface.blit(text_surface, text_rect)
 
@@ -165,7 +167,7 @@ class HighSchoolGraduationScreen(Screen):
             popup_rect = pygame.Rect(SCREEN_WIDTH // 2 - 220, SCREEN_HEIGHT // 2 - 100, 440, 180)
             pygame.draw.rect(surface, CARD_BG, popup_rect, border_radius=12)
             pygame.draw.rect(surface, CARD_BORDER, popup_rect, 2, border_radius=12)
-            msg_surface = self.text_font.render(self.recurring_bill_message, True, BLACK)
+            msg_surface = render_text(self.text_font, self.recurring_bill_message, True, BLACK)
             msg_rect = msg_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             surface.blit(msg_surface, msg_rect)
             self.recurring_bill_btn.draw(surface)
@@ -206,8 +208,8 @@ class CollegeGraduationScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Buttons
         continue_button = Button(
@@ -230,7 +232,7 @@ class CollegeGraduationScreen(Screen):
 
         # Go to job search screen
         from moneySmarts.screens.financial_screens import JobSearchScreen
-        self.game.gui_manager.set_screen(JobSearchScreen(self.game))
+        self.game.gui_manager.show(JobSearchScreen)
 
     def draw(self, surface):
         """Draw the college graduation screen."""
@@ -238,7 +240,7 @@ class CollegeGraduationScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("COLLEGE GRADUATION", True, BLUE)
+        title_surface = render_text(self.title_font, "COLLEGE GRADUATION", True, BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -273,7 +275,7 @@ class CollegeGraduationScreen(Screen):
         ]
 
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 250 + i * 30))
             surface.blit(text_surface, text_rect)
 
@@ -289,8 +291,8 @@ class CarPurchaseScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Car options
         self.car_options = [
@@ -454,12 +456,12 @@ class CarPurchaseScreen(Screen):
     def skip_purchase(self):
         """Skip car purchase."""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def confirm_purchase(self):
         """Confirm purchase and return to game."""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def draw(self, surface):
         """Draw the car purchase screen."""
@@ -467,7 +469,7 @@ class CarPurchaseScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("CAR PURCHASE OPPORTUNITY", True, BLUE)
+        title_surface = render_text(self.title_font, "CAR PURCHASE OPPORTUNITY", True, BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -481,7 +483,7 @@ class CarPurchaseScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -494,7 +496,7 @@ class CarPurchaseScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -518,7 +520,7 @@ class CarPurchaseScreen(Screen):
                 ])
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -540,10 +542,10 @@ class CarPurchaseScreen(Screen):
             popup_rect = pygame.Rect(SCREEN_WIDTH // 2 - 220, SCREEN_HEIGHT // 2 - 100, 440, 180)
             pygame.draw.rect(surface, (220, 50, 50), popup_rect, border_radius=12)
             pygame.draw.rect(surface, (0, 0, 0), popup_rect, 3, border_radius=12)
-            font = pygame.font.SysFont('Arial', 28, bold=True)
+            font = get_font(28, bold=True)
             lines = self.insufficient_funds_message.split('\n')
             for i, line in enumerate(lines):
-                text_surf = font.render(line, True, (255, 255, 255))
+                text_surf = render_text(font, line, True, (255, 255, 255))
                 surface.blit(text_surf, (popup_rect.x + 30, popup_rect.y + 30 + i * 38))
             if self.insufficient_funds_btn:
                 self.insufficient_funds_btn.draw(surface)
@@ -556,8 +558,8 @@ class HousingScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # House options
         self.house_options = [
@@ -582,6 +584,11 @@ class HousingScreen(Screen):
         # Create house selection buttons
         self.create_house_buttons()
 
+    def on_enter(self):
+        """Pick up building art added or edited since the last visit (the lookups
+        made while drawing never touch the disk)."""
+        building_index.refresh()
+
     def create_house_buttons(self):
         """Create buttons for house selection."""
         self.buttons = []
@@ -730,12 +737,12 @@ class HousingScreen(Screen):
     def skip_purchase(self):
         """Skip house purchase."""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def confirm_purchase(self):
         """Confirm purchase and return to game."""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def draw_building_image(self, surface, building_name, image_type='exterior', position=None, size=(200, 150)):
         """
@@ -815,7 +822,7 @@ class HousingScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("HOUSE PURCHASE OPPORTUNITY", True, BLUE)
+        title_surface = render_text(self.title_font, "HOUSE PURCHASE OPPORTUNITY", True, BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -829,7 +836,7 @@ class HousingScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -840,7 +847,7 @@ class HousingScreen(Screen):
                 self.draw_building_image(surface, self._preview_house['name'], 'exterior',
                                        preview_position, preview_size)
 
-                preview_label = self.text_font.render(f"Preview: {self._preview_house['name']}", True, BLACK)
+                preview_label = render_text(self.text_font, f"Preview: {self._preview_house['name']}", True, BLACK)
                 preview_rect = preview_label.get_rect(center=(SCREEN_WIDTH // 2, 620))
                 surface.blit(preview_label, preview_rect)
 
@@ -856,7 +863,7 @@ class HousingScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -878,7 +885,7 @@ class HousingScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -894,11 +901,11 @@ class HousingScreen(Screen):
                                    interior_position, image_size)
 
             # Add labels for the images
-            exterior_label = self.text_font.render("Exterior", True, BLACK)
+            exterior_label = render_text(self.text_font, "Exterior", True, BLACK)
             exterior_rect = exterior_label.get_rect(center=(SCREEN_WIDTH // 4, 570))
             surface.blit(exterior_label, exterior_rect)
 
-            interior_label = self.text_font.render("Interior", True, BLACK)
+            interior_label = render_text(self.text_font, "Interior", True, BLACK)
             interior_rect = interior_label.get_rect(center=(3 * SCREEN_WIDTH // 4, 570))
             surface.blit(interior_label, interior_rect)
 
@@ -917,7 +924,7 @@ class HousingScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -933,23 +940,23 @@ class FamilyPlanningScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # State (0 = initial, 1 = spouse added, 2 = children question, 3 = confirmation)
         self.state = 0
 
         # Spouse info
-        self.spouse_age = self.game.player.age - random.randint(-3, 3)  # Spouse age is close to player age
-        self.spouse_has_job = random.random() < 0.7  # 70% chance of spouse having a job
+        self.spouse_age = self.game.player.age - self.game.rng.randint(-3, 3)  # Spouse age is close to player age
+        self.spouse_has_job = self.game.rng.random() < 0.7  # 70% chance of spouse having a job
 
         if self.spouse_has_job:
-            self.spouse_income = int(self.game.player.salary * random.uniform(0.5, 1.5))  # Spouse income relative to player
+            self.spouse_income = int(self.game.player.salary * self.game.rng.uniform(0.5, 1.5))  # Spouse income relative to player
         else:
             self.spouse_income = 0
 
         # Children info
-        self.num_children = random.randint(1, 3)  # Random number of children
+        self.num_children = self.game.rng.randint(1, 3)  # Random number of children
 
         # Create buttons
         self.create_buttons()
@@ -1044,12 +1051,12 @@ class FamilyPlanningScreen(Screen):
     def skip_family(self):
         """Skip family planning for now."""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def continue_to_game(self):
         """Continue to game after family planning."""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def draw(self, surface):
         """Draw the family planning screen."""
@@ -1057,7 +1064,7 @@ class FamilyPlanningScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("FAMILY PLANNING", True, BLUE)
+        title_surface = render_text(self.title_font, "FAMILY PLANNING", True, BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -1071,7 +1078,7 @@ class FamilyPlanningScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -1100,7 +1107,7 @@ class FamilyPlanningScreen(Screen):
             ])
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -1118,7 +1125,7 @@ class FamilyPlanningScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -1139,7 +1146,7 @@ class FamilyPlanningScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -2,6 +2,7 @@ import pygame
 from pygame.locals import *
 from moneySmarts.constants import *
 from moneySmarts.ui import Screen, Button
+from moneySmarts.fonts import get_font, render_text
 
 class RandomEventScreen(Screen):
     """Screen displayed when a random event occurs during gameplay."""
@@ -9,8 +10,8 @@ class RandomEventScreen(Screen):
         super().__init__(game)
         self.event = event
         self.cash_effect = cash_effect
-        self.font = pygame.font.SysFont('Arial', FONT_MEDIUM)
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE, bold=True)
+        self.font = get_font(FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE, bold=True)
         # Effect already applied in Game.trigger_random_event; prepare messages only
         if cash_effect > 0:
             self.result_message = f"You received ${cash_effect}!"
@@ -34,9 +35,10 @@ class RandomEventScreen(Screen):
         self.buttons = [continue_button]
     
     def continue_game(self):
-        """Return to the game screen."""
-        from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        """Return to the screen the event interrupted (normally the game screen)."""
+        if self.game.gui_manager.pop() is None:
+            from moneySmarts.screens.game_screen import GameScreen
+            self.game.gui_manager.show(GameScreen)
     
     def draw(self, surface):
         """Draw the random event screen."""
@@ -47,23 +49,23 @@ class RandomEventScreen(Screen):
         event_color = GREEN if self.cash_effect > 0 else RED
         pygame.draw.rect(surface, event_color, header_rect)
         
-        header_text = self.title_font.render(f"LIFE EVENT: {self.event['name']}", True, WHITE)
+        header_text = render_text(self.title_font, f"LIFE EVENT: {self.event['name']}", True, WHITE)
         header_rect = header_text.get_rect(center=(SCREEN_WIDTH // 2, 40))
         surface.blit(header_text, header_rect)
         
         # Draw event description
-        desc_text = self.font.render(self.event['description'], True, BLACK)
+        desc_text = render_text(self.font, self.event['description'], True, BLACK)
         desc_rect = desc_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
         surface.blit(desc_text, desc_rect)
         
         # Draw result
-        result_text = self.font.render(self.result_message, True, BLACK)
+        result_text = render_text(self.font, self.result_message, True, BLACK)
         result_rect = result_text.get_rect(center=(SCREEN_WIDTH // 2, 220))
         surface.blit(result_text, result_rect)
         
         # Draw payment message if applicable
         if self.payment_message:
-            payment_text = self.font.render(self.payment_message, True, BLACK)
+            payment_text = render_text(self.font, self.payment_message, True, BLACK)
             payment_rect = payment_text.get_rect(center=(SCREEN_WIDTH // 2, 270))
             surface.blit(payment_text, payment_rect)
         
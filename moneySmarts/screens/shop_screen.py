@@ -2,6 +2,7 @@ import pygame
 
 from moneySmarts.constants import *
 from moneySmarts.ui import Screen, Button
+from moneySmarts.fonts import get_font, render_text
 
 # Define the shop items with prices and descriptions
 # Using constants imported from moneySmarts.constants
@@ -19,25 +20,36 @@ SHOP_ITEMS = [
 ]
 
 class ShopScreen(Screen):
+    reusable = True  # The item list never changes; only popup state is reset
+
     def __init__(self, game):
         super().__init__(game)
-        self.ok_btn_rect = None
         self.popup_back_btn = None
         self.pay_credit_btn = None
         self.pay_bank_btn = None
         self.main_back_btn = None
         self.pay_cash_btn = None
+        self.buttons = []
+        self.create_buttons()
+        self.create_payment_buttons()
+        self.reset()
+
+    def reset(self):
+        """Close every popup and clear the selection."""
+        self.ok_btn_rect = None
         self.selected_item = None
         self.message = ""
         self.show_payment_popup = False
         self.show_confirmation_popup = False
         self.confirmation_text = ""
-        self.buttons = []
-        self.create_buttons()
-        self.create_payment_buttons()
         self.show_insufficient_popup = False
         self.insufficient_text = ""
         self.insufficient_ok_btn = None
+        self.show_inventory = False
+        self.inventory_popup_btn = None
+
+    def on_enter(self):
+        self.reset()
 
     def create_buttons(self):
         self.buttons = []
@@ -65,13 +77,13 @@ class ShopScreen(Screen):
         # Only show a payment popup for items that are not Home or Vehicle
         if self.selected_item['name'] == "Home":
             from moneySmarts.screens.home_purchase_screen import HomePurchaseScreen
-            self.game.gui_manager.set_screen(HomePurchaseScreen(self.game))
+            self.game.gui_manager.show(HomePurchaseScreen)
             self.selected_item = None
             self.show_payment_popup = False
             return
         if self.selected_item['name'] == "Vehicle":
             from moneySmarts.screens.vehicle_purchase_screen import VehiclePurchaseScreen
-            self.game.gui_manager.set_screen(VehiclePurchaseScreen(self.game))
+            self.game.gui_manager.show(VehiclePurchaseScreen)
             self.selected_item = None
             self.show_payment_popup = False
             return
@@ -79,11 +91,7 @@ class ShopScreen(Screen):
         self.show_payment_popup = True
 
     def close_popup(self):
-        self.show_payment_popup = False
-        self.selected_item = None
-        self.message = ""
-        # Redraw screen to ensure popup is gone
-        self.game.gui_manager.set_screen(ShopScreen(self.game))
+        self.reset()
 
     def show_insufficient_funds_popup(self, item_name, required, available):
         self.insufficient_text = (
@@ -100,12 +108,9 @@ class ShopScreen(Screen):
         if hasattr(self.game, 'is_game_over') and self.game.is_game_over:
             # Transition to GameOverScreen instead of freezing
             from moneySmarts.screens.game_over_screen import GameOverScreen
-            self.game.gui_manager.set_screen(GameOverScreen(self.game, reason="Game Over: You cannot make purchases due to unpaid bills."))
+            self.game.gui_manager.show(GameOverScreen, reason="Game Over: You cannot make purchases due to unpaid bills.")
             return
-        self.show_insufficient_popup = False
-        self.insufficient_text = ""
-        self.insufficient_ok_btn = None
-        self.game.gui_manager.set_screen(ShopScreen(self.game))
+        self.reset()
 
     def pay_cash(self):
         if not self.selected_item:
@@ -189,7 +194,7 @@ class ShopScreen(Screen):
         self.selected_item = None
         self.message = ""
         from moneySmarts.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.show(GameScreen)
 
     def show_inventory_popup(self):
         self.show_inventory = True
@@ -212,10 +217,7 @@ class ShopScreen(Screen):
             for event in events:
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     if self.ok_btn_rect.collidepoint(mouse_pos):
-                        self.show_confirmation_popup = False
-                        self.confirmation_text = ""
-                        self.selected_item = None
-                        self.game.gui_manager.set_screen(ShopScreen(self.game))
+                        self.reset()
                         return
         elif self.show_insufficient_popup and self.insufficient_ok_btn:
             for event in events:
@@ -249,17 +251,17 @@ class ShopScreen(Screen):
 
     def draw(self, surface):
         surface.fill(BG_TOP)
-        title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        title = title_font.render("Shop", True, PRIMARY)
+        title_font = get_font(FONT_LARGE)
+        title = render_text(title_font, "Shop", True, PRIMARY)
         surface.blit(title, (60, 40))
         # Items panel
         panel = pygame.Rect(360, 120, SCREEN_WIDTH - 420, SCREEN_HEIGHT - 180)
         pygame.draw.rect(surface, CARD_BG, panel, border_radius=12)
         pygame.draw.rect(surface, CARD_BORDER, panel, 2, border_radius=12)
-        desc_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        desc_font = get_font(FONT_MEDIUM)
         y = 140
         for idx, item in enumerate(SHOP_ITEMS):
-            desc = desc_font.render(item['desc'], True, BLACK)
+            desc = render_text(desc_font, item['desc'], True, BLACK)
             surface.blit(desc, (380, y+10))
             y += 60
         for btn in self.buttons:
@@ -267,13 +269,13 @@ class ShopScreen(Screen):
                 btn.draw(surface)
         if self.main_back_btn:
             self.main_back_btn.draw(surface)
-        msg_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        msg_font = get_font(FONT_MEDIUM)
         # Show message as popup if not enough funds
         if self.message and ("Not enough" in self.message or "low" in self.message):
             popup_rect = pygame.Rect(250, 250, 520, 160)
             pygame.draw.rect(surface, (255, 240, 240), popup_rect, border_radius=12)
             pygame.draw.rect(surface, DANGER, popup_rect, 3, border_radius=12)
-            msg = msg_font.render(self.message, True, DANGER)
+            msg = render_text(msg_font, self.message, True, DANGER)
             surface.blit(msg, (popup_rect.x + 40, popup_rect.y + 40))
             # Draw OK button centered at bottom of popup
             ok_btn_width, ok_btn_height = 140, 40
@@ -281,16 +283,16 @@ class ShopScreen(Screen):
             ok_btn_y = popup_rect.y + popup_rect.height - ok_btn_height - 20
             ok_btn_rect = pygame.Rect(ok_btn_x, ok_btn_y, ok_btn_width, ok_btn_height)
             pygame.draw.rect(surface, SUCCESS, ok_btn_rect, border_radius=8)
-            ok_text = msg_font.render("OK", True, WHITE)
+            ok_text = render_text(msg_font, "OK", True, WHITE)
             surface.blit(ok_text, (ok_btn_rect.x + 45, ok_btn_rect.y + 5))
             self.ok_btn_rect = ok_btn_rect
             return  # Prevent drawing other popups/buttons
         else:
-            msg = msg_font.render(self.message, True, DANGER if "Not" in self.message else SUCCESS)
+            msg = render_text(msg_font, self.message, True, DANGER if "Not" in self.message else SUCCESS)
             surface.blit(msg, (60, SCREEN_HEIGHT - 60))
         if self.selected_item:
-            sel_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
-            sel_msg = sel_font.render(f"Selected: {self.selected_item['name']}", True, BLACK)
+            sel_font = get_font(FONT_MEDIUM)
+            sel_msg = render_text(sel_font, f"Selected: {self.selected_item['name']}", True, BLACK)
             surface.blit(sel_msg, (60, SCREEN_HEIGHT - 120))
         # Draw the payment popup if needed
         if self.show_payment_popup and self.selected_item:
@@ -299,8 +301,8 @@ class ShopScreen(Screen):
             popup_rect = pygame.Rect(popup_x, popup_y, 320, 300)
             pygame.draw.rect(surface, CARD_BG, popup_rect, border_radius=12)
             pygame.draw.rect(surface, CARD_BORDER, popup_rect, 2, border_radius=12)
-            popup_font = pygame.font.SysFont('Arial', FONT_LARGE)
-            popup_title = popup_font.render("Choose Payment", True, PRIMARY)
+            popup_font = get_font(FONT_LARGE)
+            popup_title = render_text(popup_font, "Choose Payment", True, PRIMARY)
             surface.blit(popup_title, (popup_x + 20, popup_y + 10))
             for btn in [self.pay_cash_btn, self.pay_bank_btn, self.pay_credit_btn, self.popup_back_btn]:
                 if btn:
@@ -310,26 +312,26 @@ class ShopScreen(Screen):
             inv_rect = pygame.Rect(SCREEN_WIDTH // 2 - 220, SCREEN_HEIGHT // 2 - 160, 440, 320)
             pygame.draw.rect(surface, CARD_BG, inv_rect, border_radius=12)
             pygame.draw.rect(surface, CARD_BORDER, inv_rect, 2, border_radius=12)
-            title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-            title_surface = title_font.render("Inventory", True, PRIMARY)
+            title_font = get_font(FONT_LARGE)
+            title_surface = render_text(title_font, "Inventory", True, PRIMARY)
             title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 120))
             surface.blit(title_surface, title_rect)
             items = self.game.player.inventory if hasattr(self.game.player, 'inventory') else []
-            item_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+            item_font = get_font(FONT_MEDIUM)
             for i, item in enumerate(items):
-                item_surface = item_font.render(f"- {item}", True, BLACK)
+                item_surface = render_text(item_font, f"- {item}", True, BLACK)
                 item_rect = item_surface.get_rect(left=SCREEN_WIDTH // 2 - 200, top=SCREEN_HEIGHT // 2 - 90 + i * 28)
                 surface.blit(item_surface, item_rect)
             self.inventory_popup_btn.draw(surface)
         # Draw confirmation popup if needed
         if self.show_confirmation_popup:
-            msg_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+            msg_font = get_font(FONT_MEDIUM)
             popup_rect = pygame.Rect(200, 180, 500, 280)
             pygame.draw.rect(surface, (245, 255, 240), popup_rect, border_radius=12)
             pygame.draw.rect(surface, ACCENT, popup_rect, 3, border_radius=12)
             lines = self.confirmation_text.split('\n')
             for i, line in enumerate(lines):
-                line_surf = msg_font.render(line, True, BLACK)
+                line_surf = render_text(msg_font, line, True, BLACK)
                 surface.blit(line_surf, (popup_rect.x + 30, popup_rect.y + 30 + i * 35))
             # Draw OK button centered at bottom of popup
             ok_btn_width, ok_btn_height = 140, 40
@@ -337,7 +339,7 @@ class ShopScreen(Screen):
             ok_btn_y = popup_rect.y + popup_rect.height - ok_btn_height - 20
             ok_btn_rect = pygame.Rect(ok_btn_x, ok_btn_y, ok_btn_width, ok_btn_height)
             pygame.draw.rect(surface, SUCCESS, ok_btn_rect, border_radius=8)
-            ok_text = msg_font.render("OK", True, WHITE)
+            ok_text = render_text(msg_font, "OK", True, WHITE)
             surface.blit(ok_text, (ok_btn_rect.x + 45, ok_btn_rect.y + 5))
             self.ok_btn_rect = ok_btn_rect
             return  # Prevent drawing other popups/buttons
@@ -348,10 +350,10 @@ class ShopScreen(Screen):
             popup_rect = pygame.Rect(SCREEN_WIDTH // 2 - 220, SCREEN_HEIGHT // 2 - 100, 440, 180)
             pygame.draw.rect(surface, (255, 240, 240), popup_rect, border_radius=12)
             pygame.draw.rect(surface, DANGER, popup_rect, 3, border_radius=12)
-            font = pygame.font.SysFont('Arial', 24, bold=True)
+            font = get_font(24, bold=True)
             lines = self.insufficient_text.split('\n')
             for i, line in enumerate(lines):
-                text_surf = font.render(line, True, DANGER)
+                text_surf = render_text(font, line, True, DANGER)
                 surface.blit(text_surf, (popup_rect.x + 30, popup_rect.y + 26 + i * 32))
             if self.insufficient_ok_btn:
                 self.insufficient_ok_btn.draw(surface)
@@ -361,9 +363,5 @@ class ShopScreen(Screen):
         if (self.show_confirmation_popup or (self.message and ("Not enough" in self.message))) and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mouse_pos = pygame.mouse.get_pos()
             if self.ok_btn_rect and self.ok_btn_rect.collidepoint(mouse_pos):
-                self.show_confirmation_popup = False
-                self.confirmation_text = ""
-                self.selected_item = None
-                self.message = ""
-                self.game.gui_manager.set_screen(ShopScreen(self.game))
+                self.reset()
                 return
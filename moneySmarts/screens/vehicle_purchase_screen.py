@@ -2,6 +2,7 @@ import os
 import pygame
 from moneySmarts.constants import *
 from moneySmarts.ui import Screen, Button
+from moneySmarts.fonts import get_font, render_text
 
 VEHICLE_OPTIONS = [
     {"name": "Used Car", "price": 1200, "desc": "Reliable but basic transportation."},
@@ -139,7 +140,7 @@ class VehiclePurchaseScreen(Screen):
         from moneySmarts.screens.shop_screen import ShopScreen
         self.selected_vehicle = None
         self.message = ""
-        self.game.gui_manager.set_screen(ShopScreen(self.game))
+        self.game.gui_manager.show(ShopScreen)
 
     def draw_vehicle_placeholder(self, surface, x, y, w=200, h=100, color=PRIMARY):
         # Draw a simple vehicle placeholder
@@ -152,16 +153,16 @@ class VehiclePurchaseScreen(Screen):
 
     def draw(self, surface):
         surface.fill(BG_TOP)
-        font = pygame.font.SysFont('Arial', FONT_LARGE)
-        title = font.render("Choose Your Vehicle", True, PRIMARY)
+        font = get_font(FONT_LARGE)
+        title = render_text(font, "Choose Your Vehicle", True, PRIMARY)
         surface.blit(title, (80, 60))
-        font_small = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        font_small = get_font(FONT_MEDIUM)
         y = 150
         colors = [PRIMARY, ACCENT, BLUE]
         for idx, vehicle in enumerate(VEHICLE_OPTIONS):
             # Draw vehicle placeholder
             self.draw_vehicle_placeholder(surface, 30, y - 20, color=colors[idx % len(colors)])
-            desc = font_small.render(vehicle['desc'], True, BLACK)
+            desc = render_text(font_small, vehicle['desc'], True, BLACK)
             surface.blit(desc, (500, y+20))
             y += 90
         for btn in self.buttons:
@@ -171,8 +172,8 @@ class VehiclePurchaseScreen(Screen):
         self.buy_credit_btn.draw(surface)
         self.finance_btn.draw(surface)
         self.back_btn.draw(surface)
-        msg_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
-        msg = msg_font.render(self.message, True, DANGER if "Not" in self.message or "low" in self.message else SUCCESS)
+        msg_font = get_font(FONT_MEDIUM)
+        msg = render_text(msg_font, self.message, True, DANGER if "Not" in self.message or "low" in self.message else SUCCESS)
         surface.blit(msg, (80, 480))
         # Draw popup if needed
         if self.show_popup:
@@ -181,12 +182,12 @@ class VehiclePurchaseScreen(Screen):
             pygame.draw.rect(surface, ACCENT, popup_rect, 3, border_radius=12)
             lines = self.popup_text.split('\n')
             for i, line in enumerate(lines):
-                line_surf = msg_font.render(line, True, BLACK)
+                line_surf = render_text(msg_font, line, True, BLACK)
                 surface.blit(line_surf, (popup_rect.x + 30, popup_rect.y + 30 + i * 35))
             # Draw OK button
             ok_btn_rect = pygame.Rect(popup_rect.x + 180, popup_rect.y + 160, 140, 40)
             pygame.draw.rect(surface, SUCCESS, ok_btn_rect, border_radius=8)
-            ok_text = msg_font.render("OK", True, WHITE)
+            ok_text = render_text(msg_font, "OK", True, WHITE)
             surface.blit(ok_text, (ok_btn_rect.x + 45, ok_btn_rect.y + 5))
             self.ok_btn_rect = ok_btn_rect
         else:
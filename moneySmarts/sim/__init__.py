@@ -0,0 +1,43 @@
+"""
+Headless simulation tools for cohort and what-if studies.
+
+Runs complete ``Game`` lifetimes without pygame or console interaction.
+Life-stage decisions come from a ``Policy`` and text output goes to an
+``EventSink``. Run ``python -m moneySmarts.sim --help`` for the batch CLI.
+``run_monte_carlo`` shards lifetimes across worker processes with per-lifetime
+RNG streams, and ``Cohort`` applies the monthly finance rules to many players
+at once with numpy.
+"""
+from moneySmarts.sim.engine import (
+    EventSink,
+    LifetimeResult,
+    Policy,
+    RandomPolicy,
+    RecordingSink,
+    SimGame,
+    run_batch,
+    run_lifetime,
+    summarize,
+)
+from moneySmarts.sim.runner import derive_seed, run_monte_carlo
+
+# Vectorized cohort engine needs numpy (``pip install moneySmarts[sim]``)
+try:
+    from moneySmarts.sim.cohort import Cohort
+except ImportError:  # pragma: no cover
+    Cohort = None  # type: ignore
+
+__all__ = [
+    'Cohort',
+    'EventSink',
+    'LifetimeResult',
+    'Policy',
+    'RandomPolicy',
+    'RecordingSink',
+    'SimGame',
+    'derive_seed',
+    'run_batch',
+    'run_lifetime',
+    'run_monte_carlo',
+    'summarize',
+]
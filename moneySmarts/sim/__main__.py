@@ -0,0 +1,5 @@
+import sys
+
+from moneySmarts.sim.cli import main
+
+sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Command line entry point for batch lifetime simulation.
+
+Example:
+    python -m moneySmarts.sim --lives 10000 --seed 42 --workers 0 --out report.json --csv lives.csv
+    python -m moneySmarts.sim --lives 1000000 --workers 0 --npz results/ --no-report
+"""
+import argparse
+import json
+import logging
+import sys
+import time
+
+from moneySmarts.sim.engine import POLICIES
+from moneySmarts.sim.export import CsvExporter, NpzExporter
+from moneySmarts.sim.runner import iter_lifetimes, merge_report
+
+logger = logging.getLogger(__name__)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="moneysmarts-sim",
+        description="Simulate many Money Smartz lifetimes headlessly and write summary results.")
+    parser.add_argument("--lives", type=int, default=1000, help="number of lifetimes to simulate")
+    parser.add_argument("--seed", type=int, default=0, help="master seed; every lifetime derives its own streams from it")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (0 = one per CPU)")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="default", help="decision policy")
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    parser.add_argument("--csv", help="also write one CSV row per lifetime to this file")
+    parser.add_argument("--monthly-csv", help="also write one CSV row per simulated month to this file")
+    parser.add_argument("--npz", metavar="DIR", help="also write columnar .npz shards (per lifetime and per month) here")
+    parser.add_argument("--no-report", action="store_true",
+                        help="skip the JSON report so memory stays bounded for very large exports")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    exporters = []
+    if args.csv or args.monthly_csv:
+        exporters.append(CsvExporter(args.csv, args.monthly_csv))
+    if args.npz:
+        exporters.append(NpzExporter(args.npz))
+    with_history = bool(args.monthly_csv or args.npz)
+    pairs = []
+    start = time.perf_counter()
+    try:
+        lifetimes = iter_lifetimes(args.lives, args.seed, args.workers or None, args.policy,
+                                   with_history=with_history)
+        for index, (result, by_age, *monthly) in enumerate(lifetimes):
+            if not args.no_report:
+                pairs.append((result, by_age))
+            for exporter in exporters:
+                exporter.add(index, result, *monthly)
+    finally:
+        for exporter in exporters:
+            exporter.close()
+    elapsed = time.perf_counter() - start
+    if args.no_report:
+        print(f"Exported {args.lives} lifetimes in {elapsed:.1f}s", file=sys.stderr)
+        return 0
+    report = merge_report(pairs, args.seed, args.policy)
+    report['elapsed_seconds'] = elapsed
+    report['lifetimes_per_minute'] = args.lives / elapsed * 60 if elapsed else 0.0
+    text = json.dumps(report, indent=2)
+    if args.out:
+        try:
+            with open(args.out, 'w') as f:
+                f.write(text)
+        except OSError as e:
+            logger.error(f"Failed to write simulation report: {e}")
+            return 1
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+"""
+Vectorized cohort simulator (requires numpy).
+
+Stores N players as NumPy columns (struct-of-arrays) and applies the same
+monthly rules as ``Game.process_monthly_finances`` / ``Game.advance_month``
+to every player at once. Each payment follows the scalar waterfall exactly
+(cash -> bank -> credit, otherwise a credit-score penalty), column by column
+for loans and bills, so results match the scalar ``Game`` path.
+
+Balances (cash, bank, savings, card, loans) are int64 cents, rounded the way
+``moneySmarts.money`` rounds, so they match the scalar models to the cent.
+Asset and investment values stay float64 dollars, as in the models.
+"""
+import numpy as np
+
+from moneySmarts.config_manager import Config
+
+CASH, BANK, CREDIT = "cash", "bank", "credit"
+
+
+def cents(dollars):
+    """Vectorized ``money.to_cents`` (round half to even)."""
+    return np.rint(np.multiply(dollars, 100)).astype(np.int64)
+
+# Quest rewards paid by QuestManager.check_all, in check order
+QUEST_REWARDS = (
+    ("open_bank", 25),
+    ("get_job", 50),
+    ("buy_vehicle", 75),
+    ("buy_home", 100),
+    ("networth_100k", 500),
+)
+
+
+class Cohort:
+    """
+    N players stored column-wise.
+
+    Per-player columns: cash, salary/employed, checking (``bank``), savings,
+    credit card balance/limit, credit score, age, family size, car/house values.
+    Per-player matrices (padded, with an ``*_active`` mask): loan balance, rate and
+    payment; recurring bills; utility bills; investments and their returns.
+    The calendar (month/year) is shared by the whole cohort.
+    """
+    def __init__(self, n, max_loans=4, max_bills=4, max_utilities=3, max_investments=2):
+        self.n = n
+        self.current_month = 1
+        self.current_year = 0
+        utilities = Config.get("utility_bills", [
+            {"name": "Electricity", "amount": 60},
+            {"name": "Water", "amount": 30},
+            {"name": "Internet", "amount": 50}
+        ])
+        max_utilities = max(max_utilities, len(utilities))
+
+        f64 = lambda *shape: np.zeros(shape, dtype=np.float64)
+        i64 = lambda *shape: np.zeros(shape, dtype=np.int64)
+        flags = lambda *shape: np.zeros(shape, dtype=bool)
+        self.age = np.full(n, 16, dtype=np.int64)
+        self.cash = np.full(n, cents(Config.get("starting_cash", 100)))
+        self.employed = flags(n)
+        self.salary = f64(n)
+        self.has_bank = flags(n)
+        self.bank_is_savings = flags(n)
+        self.bank = i64(n)
+        self.savings = i64(n)
+        self.has_card = flags(n)
+        self.card_balance = i64(n)
+        self.card_limit = i64(n)
+        self.credit_score = np.full(n, int(Config.get("starting_credit_score", 650)), dtype=np.int64)
+        self.family_size = np.zeros(n, dtype=np.int64)
+        self.car_value = f64(n)
+        self.house_value = f64(n)
+        self.has_car = flags(n)
+        self.has_house = flags(n)
+        self.missed_payments = np.zeros(n, dtype=np.int64)
+
+        self.loan_balance = i64(n, max_loans)
+        self.loan_rate = f64(n, max_loans)
+        self.loan_payment = i64(n, max_loans)
+        self.loan_active = flags(n, max_loans)
+
+        self.bill_amount = i64(n, max_bills)
+        self.bill_bank_or_credit = flags(n, max_bills)
+        self.bill_active = flags(n, max_bills)
+
+        self.utility_amount = i64(n, max_utilities)
+        self.utility_active = flags(n, max_utilities)
+        for j, util in enumerate(utilities):
+            self.utility_amount[:, j] = cents(util['amount'])
+            self.utility_active[:, j] = True
+
+        self.investment_amount = f64(n, max_investments)
+        self.investment_return = f64(n, max_investments)
+        self.investment_active = flags(n, max_investments)
+
+        self.quest_done = flags(n, len(QUEST_REWARDS))
+
+        self.base_living = Config.get("base_living_expenses", 1000)
+        self.homeowner_expenses = Config.get("homeowner_expenses", 500)
+        self.car_expenses = Config.get("car_expenses", 200)
+        self.family_expenses = Config.get("family_expenses_per_member", 500)
+        self.inflation = Config.get("inflation_rate", 0.02)
+
+    # ---------------- Construction ----------------
+    @classmethod
+    def from_players(cls, players, current_month=1, current_year=0):
+        """Build a cohort holding a snapshot of existing ``Player`` objects."""
+        players = list(players)
+        n = len(players)
+        c = cls(
+            n,
+            max_loans=max([len(p.loans) for p in players] + [1]),
+            max_bills=max([len(p.recurring_bills) for p in players] + [1]),
+            max_utilities=max([len(p.utility_bills) for p in players] + [1]),
+            max_investments=max([len(p.investments) for p in players] + [1]),
+        )
+        c.current_month = current_month
+        c.current_year = current_year
+        c.utility_amount[:] = 0.0
+        c.utility_active[:] = False
+        for i, p in enumerate(players):
+            c.age[i] = p.age
+            c.cash[i] = cents(p.cash)
+            c.employed[i] = bool(p.job)
+            c.salary[i] = p.salary
+            if p.bank_account:
+                c.has_bank[i] = True
+                c.bank_is_savings[i] = p.bank_account.account_type == "Savings"
+                c.bank[i] = cents(p.bank_account.balance)
+            if p.savings_account:
+                c.savings[i] = cents(p.savings_account.balance)
+            if p.credit_card:
+                c.has_card[i] = True
+                c.card_balance[i] = cents(p.credit_card.balance)
+                c.card_limit[i] = cents(p.credit_card.limit)
+            c.credit_score[i] = p.credit_score
+            c.family_size[i] = len(p.family)
+            for a in p.assets:
+                if a.asset_type == "Car":
+                    c.has_car[i] = True
+                    c.car_value[i] += a.current_value
+                elif a.asset_type == "House":
+                    c.has_house[i] = True
+                    c.house_value[i] += a.current_value
+            for j, loan in enumerate(p.loans):
+                c.loan_balance[i, j] = cents(loan.current_balance)
+                c.loan_rate[i, j] = loan.interest_rate
+                c.loan_payment[i, j] = cents(loan.monthly_payment)
+                c.loan_active[i, j] = True
+            for j, bill in enumerate(p.recurring_bills):
+                c.bill_amount[i, j] = cents(bill['amount'])
+                c.bill_bank_or_credit[i, j] = bill.get('source') == 'bank_or_credit'
+                c.bill_active[i, j] = True
+            for j, util in enumerate(p.utility_bills):
+                c.utility_amount[i, j] = cents(util['amount'])
+                c.utility_active[i, j] = True
+            for j, inv in enumerate(p.investments):
+                c.investment_amount[i, j] = inv.amount
+                c.investment_return[i, j] = inv.expected_annual_return
+                c.investment_active[i, j] = True
+        return c
+
+    # ---------------- Waterfall ----------------
+    def _pay(self, amount, due, sources):
+        """Pay ``amount`` for players in ``due`` from the first source that covers it.
+        Returns the mask of players who could not pay."""
+        unpaid = due.copy()
+        for source in sources:
+            if source == CASH:
+                ok = unpaid & (self.cash >= amount)
+                np.subtract(self.cash, amount, out=self.cash, where=ok)
+            elif source == BANK:
+                ok = unpaid & self.has_bank & (self.bank >= amount)
+                np.subtract(self.bank, amount, out=self.bank, where=ok)
+            else:
+                ok = unpaid & self.has_card & (self.card_balance + amount <= self.card_limit)
+                np.add(self.card_balance, amount, out=self.card_balance, where=ok)
+            unpaid &= ~ok
+        return unpaid
+
+    def _penalize(self, unpaid, points):
+        self.credit_score -= unpaid * points
+        self.missed_payments += unpaid
+
+    def process_monthly_finances(self):
+        """Vectorized ``Game.process_monthly_finances`` for every player."""
+        # Income (80% auto-deposited when the player banks)
+        monthly_income = cents(self.salary / 12)
+        earning = self.employed
+        np.add(self.cash, monthly_income, out=self.cash, where=earning)
+        auto = cents(monthly_income / 100 * 0.8)
+        depositing = earning & self.has_bank
+        np.add(self.bank, auto, out=self.bank, where=depositing)
+        np.subtract(self.cash, auto, out=self.cash, where=depositing)
+
+        # Loans, in list order
+        for j in range(self.loan_balance.shape[1]):
+            pay = self.loan_payment[:, j]
+            due = self.loan_active[:, j]
+            unpaid = self._pay(pay, due, (CASH, BANK, CREDIT))
+            self._apply_loan_payment(j, due & ~unpaid)
+            self._penalize(unpaid, 30)
+
+        # Credit card minimum
+        due = self.has_card & (self.card_balance > 0)
+        min_pay = cents(np.maximum(25, self.card_balance / 100 * 0.05))
+        unpaid = self._pay(min_pay, due, (CASH, BANK))
+        # Card.pay only succeeds when the payment does not exceed the balance
+        applied = due & ~unpaid & (min_pay <= self.card_balance)
+        np.subtract(self.card_balance, min_pay, out=self.card_balance, where=applied)
+        self._penalize(unpaid, 50)
+
+        # Living expenses
+        living = (self.base_living
+                  + self.has_house * self.homeowner_expenses
+                  + self.has_car * self.car_expenses
+                  + self.family_size * self.family_expenses)
+        living = cents(living * ((1 + self.inflation) ** self.current_year))
+        unpaid = self._pay(living, np.ones(self.n, dtype=bool), (CASH, BANK, CREDIT))
+        self._penalize(unpaid, 20)
+
+        # Recurring bills: bank/credit first when allowed, then cash
+        for j in range(self.bill_amount.shape[1]):
+            amt = self.bill_amount[:, j]
+            due = self.bill_active[:, j]
+            unpaid = self._pay(amt, due & self.bill_bank_or_credit[:, j], (BANK, CREDIT))
+            unpaid |= due & ~self.bill_bank_or_credit[:, j]
+            unpaid = self._pay(amt, unpaid, (CASH,))
+            self._penalize(unpaid, 10)
+
+        # Utilities
+        for j in range(self.utility_amount.shape[1]):
+            unpaid = self._pay(self.utility_amount[:, j], self.utility_active[:, j], (BANK, CREDIT, CASH))
+            self._penalize(unpaid, 5)
+
+        self._check_quests()
+
+    def _apply_loan_payment(self, j, paid):
+        """Vectorized ``Loan.make_payment(monthly_payment)`` for the players in ``paid``."""
+        bal = self.loan_balance[:, j]
+        amount = self.loan_payment[:, j]
+        interest = np.rint(bal * (self.loan_rate[:, j] / 12)).astype(np.int64)
+        principal = np.where(amount <= interest, 0, np.minimum(amount - interest, bal))
+        np.subtract(bal, principal, out=bal, where=paid)
+
+    def _check_quests(self):
+        """Pay first-time quest rewards in ``QuestManager`` order."""
+        conditions = (
+            lambda: self.has_bank,
+            lambda: self.employed,
+            lambda: self.has_car,
+            lambda: self.has_house,
+            lambda: self.net_worth() >= 100000,
+        )
+        for q, ((_, reward), condition) in enumerate(zip(QUEST_REWARDS, conditions)):
+            pending = ~self.quest_done[:, q]
+            if not pending.any():
+                continue
+            newly = pending & condition()
+            self.quest_done[:, q] |= newly
+            self.cash += newly * (reward * 100)
+
+    # ---------------- Calendar ----------------
+    def advance_month(self, rng=None):
+        """Vectorized ``Game.advance_month``: calendar, yearly aging, investment returns, finances.
+
+        House appreciation is drawn from ``rng`` (a ``numpy.random.Generator``), one
+        draw per player per year.
+        """
+        self.current_month += 1
+        if self.current_month > 12:
+            self.current_month = 1
+            self.current_year += 1
+            self.age += 1
+            interest = self.has_bank & self.bank_is_savings & (self.bank > 0)
+            np.add(self.bank, np.rint(self.bank * 0.01).astype(np.int64), out=self.bank, where=interest)
+            self.car_value *= 0.85
+            if self.has_house.any():
+                rng = rng if rng is not None else np.random.default_rng()
+                appreciation = rng.uniform(-0.05, 0.1, self.n)
+                self.house_value *= 1 + appreciation * self.has_house
+        growth = self.investment_amount * (self.investment_return / 12)
+        np.add(self.investment_amount, growth, out=self.investment_amount, where=self.investment_active)
+        self.process_monthly_finances()
+
+    def run(self, months, rng=None):
+        """Advance every player ``months`` months."""
+        for _ in range(months):
+            self.advance_month(rng)
+
+    # ---------------- Aggregates ----------------
+    def loan_debt(self):
+        """Per-player loan balance in cents."""
+        return (self.loan_balance * self.loan_active).sum(axis=1)
+
+    def net_worth(self):
+        """Per-player net worth in dollars, matching ``utils.compute_net_worth``."""
+        checking = np.where(self.has_bank & ~self.bank_is_savings, self.bank, 0)
+        investments = (self.investment_amount * self.investment_active).sum(axis=1)
+        card = np.where(self.has_card, self.card_balance, 0)
+        balances = self.cash + checking + self.savings - card - self.loan_debt()
+        return balances / 100 + investments + self.car_value + self.house_value
+
+
+__all__ = ["Cohort"]
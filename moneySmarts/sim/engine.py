@@ -0,0 +1,302 @@
+"""
+Headless lifetime simulation engine.
+
+Drives a real ``Game`` month by month without pygame, console output or
+``input()``: text output goes to an ``EventSink`` and every life-stage decision
+(``Game.choose``) is answered by a ``Policy``.
+"""
+import random
+import statistics
+from dataclasses import asdict, dataclass
+
+from moneySmarts.config_manager import Config
+from moneySmarts.game import Game
+from moneySmarts.models import Player
+from moneySmarts.utils import compute_net_worth
+
+
+class EventSink:
+    """
+    Receives the side effects a headless game would otherwise print.
+    The base class discards everything; subclass it to log or collect.
+    """
+    def message(self, text):
+        """A line of text-mode output."""
+
+    def random_event(self, event, effect):
+        """A random event was applied with the given cash effect."""
+
+    def decision(self, decision, choice):
+        """The policy answered a life-stage decision."""
+
+
+class RecordingSink(EventSink):
+    """Sink that keeps every random event and decision (and optionally messages) in memory."""
+    def __init__(self, keep_messages=False):
+        self.keep_messages = keep_messages
+        self.messages = []
+        self.events = []
+        self.decisions = []
+
+    def message(self, text):
+        if self.keep_messages:
+            self.messages.append(text)
+
+    def random_event(self, event, effect):
+        self.events.append((event['name'], effect))
+
+    def decision(self, decision, choice):
+        self.decisions.append((decision, choice))
+
+
+class Policy:
+    """
+    Answers the decisions a player makes in ``Game.choose``.
+
+    Each decision name maps to a method ``<decision>(game, options)`` returning one
+    of ``options``; unknown decisions take the first option. ``on_month`` runs after
+    every simulated month for policies that act between life events.
+    """
+    def choose(self, decision, game, options):
+        handler = getattr(self, decision, None)
+        if handler is None:
+            return options[0]
+        return handler(game, options)
+
+    def on_month(self, game):
+        pass
+
+    def open_bank_account(self, game, options):
+        return "Yes"
+
+    def debit_card(self, game, options):
+        return "Yes"
+
+    def education(self, game, options):
+        return options[0]  # College
+
+    def job(self, game, options):
+        return max(options, key=lambda job: job['salary'])
+
+    def buy_car(self, game, options):
+        return "Yes"
+
+    def car(self, game, options):
+        return min(options, key=lambda car: car['value'])
+
+    def car_payment(self, game, options):
+        return options[0]  # Cash, falls back to a loan if short
+
+    def buy_house(self, game, options):
+        return "Yes"
+
+    def house(self, game, options):
+        return min(options, key=lambda house: house['value'])
+
+    def down_payment(self, game, options):
+        return options[0]
+
+    def start_family(self, game, options):
+        return "Yes"
+
+    def have_children(self, game, options):
+        return "Yes"
+
+
+class RandomPolicy(Policy):
+    """Policy that picks uniformly among the offered options using its own RNG."""
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def choose(self, decision, game, options):
+        return self.rng.choice(options)
+
+
+# Named policy factories (seed -> Policy) usable from the CLI and worker processes
+POLICIES = {
+    'default': lambda seed: Policy(),
+    'random': lambda seed: RandomPolicy(seed),
+}
+
+
+class SimGame(Game):
+    """
+    ``Game`` with all console side effects routed to a sink and all decisions
+    routed to a policy, so whole lifetimes can run unattended.
+    """
+    def __init__(self, policy=None, sink=None, rng=None, track_net_worth=False,
+                 record_history=False):
+        super().__init__(rng=rng, record_history=record_history)
+        self.policy = policy if policy is not None else Policy()
+        self.sink = sink if sink is not None else EventSink()
+        self.months = 0
+        self.random_events = 0
+        self.retirement_age = Config.get("retirement_age", 65)
+        # Net worth at each birthday (index 0 = starting age) when tracking is on
+        self.track_net_worth = track_net_worth
+        self.net_worth_by_age = []
+
+    # --- Console I/O hooks ---
+    def notify(self, message=""):
+        self.sink.message(message)
+
+    def clear(self):
+        pass
+
+    def pause(self, prompt=""):
+        pass
+
+    def choose(self, decision, prompt, options, labels=None):
+        choice = self.policy.choose(decision, self, options)
+        self.sink.decision(decision, choice)
+        return choice
+
+    def show_random_event(self, event, effect):
+        self.random_events += 1
+        self.sink.random_event(event, effect)
+
+    # --- Driving ---
+    def start(self, name="Sim"):
+        """Create the player and make the opening account decisions."""
+        self.player = Player(name)
+        self.open_starter_accounts()
+        if self.track_net_worth:
+            self.net_worth_by_age.append(compute_net_worth(self.player))
+
+    def step(self):
+        """Simulate one month. Returns False once the lifetime is over."""
+        self.simulate_month()
+        self.policy.on_month(self)
+        self.months += 1
+        if self.track_net_worth and self.current_month == 1:
+            self.net_worth_by_age.append(compute_net_worth(self.player))
+        if self.player.age >= self.retirement_age:
+            self.game_over = True
+        return not self.game_over
+
+    def run(self, max_months=None):
+        """Run until retirement (or ``max_months``) and return the ``LifetimeResult``."""
+        if self.player is None:
+            self.start()
+        while not self.game_over and (max_months is None or self.months < max_months):
+            self.step()
+        return LifetimeResult.from_game(self)
+
+
+@dataclass
+class LifetimeResult:
+    """Summary of one simulated lifetime."""
+    seed: object
+    months: int
+    age: int
+    education: str
+    job: str
+    salary: float
+    cash: float
+    bank_balance: float
+    credit_card_balance: float
+    loan_balance: float
+    asset_value: float
+    investments: float
+    credit_score: int
+    net_worth: float
+    random_events: int
+    quests_completed: int
+    owns_car: bool
+    owns_house: bool
+    family_size: int
+
+    @classmethod
+    def from_game(cls, game, seed=None):
+        p = game.player
+        return cls(
+            seed=seed,
+            months=game.months,
+            age=p.age,
+            education=p.education,
+            job=p.job or "",
+            salary=p.salary,
+            cash=p.cash,
+            bank_balance=p.bank_account.balance if p.bank_account else 0.0,
+            credit_card_balance=p.credit_card.balance if p.credit_card else 0.0,
+            loan_balance=sum(loan.current_balance for loan in p.loans),
+            asset_value=sum(a.current_value for a in p.assets),
+            investments=sum(inv.amount for inv in p.investments),
+            credit_score=p.credit_score,
+            net_worth=compute_net_worth(p),
+            random_events=game.random_events,
+            quests_completed=len(game.quests.completed_quests()),
+            owns_car=any(a.asset_type == "Car" for a in p.assets),
+            owns_house=any(a.asset_type == "House" for a in p.assets),
+            family_size=len(p.family),
+        )
+
+    def as_dict(self):
+        return asdict(self)
+
+
+def run_lifetime(seed=None, policy=None, sink=None, max_months=None):
+    """
+    Simulate one 16-to-retirement lifetime.
+
+    The game gets its own ``random.Random(seed)`` stream, so a given seed always
+    reproduces the same life regardless of what else uses the random module.
+    """
+    game = SimGame(policy=policy, sink=sink, rng=random.Random(seed))
+    result = game.run(max_months=max_months)
+    result.seed = seed
+    return result
+
+
+def run_batch(count, seed=0, policy_factory=Policy, sink=None):
+    """Simulate ``count`` lifetimes with seeds ``seed .. seed+count-1``."""
+    return [run_lifetime(seed + i, policy=policy_factory(), sink=sink) for i in range(count)]
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def summarize(results):
+    """Aggregate lifetime results into a JSON-serializable summary dict."""
+    n = len(results)
+    if not n:
+        return {'lifetimes': 0}
+    worths = sorted(r.net_worth for r in results)
+    return {
+        'lifetimes': n,
+        'net_worth': {
+            'mean': statistics.fmean(worths),
+            'p10': percentile(worths, 10),
+            'p50': percentile(worths, 50),
+            'p90': percentile(worths, 90),
+            'min': worths[0],
+            'max': worths[-1],
+        },
+        'mean_credit_score': statistics.fmean(r.credit_score for r in results),
+        'mean_loan_balance': statistics.fmean(r.loan_balance for r in results),
+        'share_negative_net_worth': sum(1 for w in worths if w < 0) / n,
+        'share_car_owners': sum(r.owns_car for r in results) / n,
+        'share_home_owners': sum(r.owns_house for r in results) / n,
+        'share_with_family': sum(1 for r in results if r.family_size) / n,
+        'education': {edu: sum(1 for r in results if r.education == edu) / n
+                      for edu in sorted({r.education for r in results})},
+    }
+
+
+__all__ = [
+    'POLICIES',
+    'EventSink',
+    'LifetimeResult',
+    'Policy',
+    'RandomPolicy',
+    'RecordingSink',
+    'SimGame',
+    'run_batch',
+    'run_lifetime',
+    'summarize',
+]
@@ -0,0 +1,192 @@
+"""
+Streaming export of simulated lifetimes.
+
+Both exporters take one lifetime at a time through ``add(index, result, history)``
+(a ``LifetimeResult`` and the game's ``TimeSeries``) and write it out as they go,
+so memory stays bounded however many lifetimes are exported.
+
+``NpzExporter`` writes columnar ``.npz`` shards (one ``.npy`` array per column):
+``lifetimes-NNNNN.npz`` with one row per lifetime and ``monthly-NNNNN.npz`` with
+one row per simulated month. ``CsvExporter`` streams the same records as CSV for
+spreadsheet users.
+"""
+import csv
+import glob
+import logging
+import os
+from contextlib import ExitStack
+
+from moneySmarts.sim.engine import LifetimeResult
+from moneySmarts.sim.runner import iter_lifetimes
+from moneySmarts.timeseries import COLUMNS
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Per-lifetime columns: "lifetime" (its index) plus every LifetimeResult field
+LIFETIME_DTYPES = {
+    'lifetime': 'i8', 'seed': 'u8', 'months': 'i4', 'age': 'i2', 'education': 'U32',
+    'job': 'U32', 'salary': 'f8', 'cash': 'f8', 'bank_balance': 'f8',
+    'credit_card_balance': 'f8', 'loan_balance': 'f8', 'asset_value': 'f8',
+    'investments': 'f8', 'credit_score': 'i4', 'net_worth': 'f8', 'random_events': 'i4',
+    'quests_completed': 'i2', 'owns_car': '?', 'owns_house': '?', 'family_size': 'i2',
+}
+# Per-month columns: "lifetime" plus every TimeSeries column
+MONTHLY_DTYPES = {'lifetime': 'i8', **{name: code for name, code in COLUMNS}}
+LIFETIME_FIELDS = ('lifetime', *LifetimeResult.__dataclass_fields__)
+MONTHLY_FIELDS = tuple(MONTHLY_DTYPES)
+
+
+class _Chunk:
+    """Preallocated column buffers that are written out as a shard when full."""
+    def __init__(self, directory, prefix, dtypes, rows, compress):
+        self.directory = directory
+        self.prefix = prefix
+        self.columns = {name: np.empty(rows, dtype=dtype) for name, dtype in dtypes.items()}
+        self.rows = rows
+        self.filled = 0
+        self.shards = 0
+        self.save = np.savez_compressed if compress else np.savez
+
+    def room(self):
+        return self.rows - self.filled
+
+    def flush(self):
+        """Write the filled rows as the next shard."""
+        if not self.filled:
+            return
+        path = os.path.join(self.directory, f"{self.prefix}-{self.shards:05d}.npz")
+        try:
+            self.save(path, **{name: col[:self.filled] for name, col in self.columns.items()})
+        except OSError as e:
+            logger.error(f"Failed to write export shard {path}: {e}")
+            raise
+        self.shards += 1
+        self.filled = 0
+
+
+class NpzExporter:
+    """
+    Streams lifetimes into columnar ``.npz`` shards under ``directory``.
+
+    At most ``lifetimes_per_shard`` lifetime rows and ``months_per_shard`` monthly
+    rows are buffered; a full buffer is written as the next shard.
+    """
+    def __init__(self, directory, lifetimes_per_shard=50_000, months_per_shard=1 << 18,
+                 compress=False):
+        if np is None:
+            raise ImportError("NpzExporter needs numpy (pip install moneySmarts[sim])")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.lifetimes = _Chunk(directory, "lifetimes", LIFETIME_DTYPES, lifetimes_per_shard, compress)
+        self.monthly = _Chunk(directory, "monthly", MONTHLY_DTYPES, months_per_shard, compress)
+
+    def add(self, index, result, history=None):
+        """Buffer one lifetime's result row and (if given) its monthly rows."""
+        chunk = self.lifetimes
+        row = chunk.filled
+        chunk.columns['lifetime'][row] = index
+        for name, value in result.as_dict().items():
+            chunk.columns[name][row] = 0 if value is None else value
+        chunk.filled += 1
+        if chunk.room() == 0:
+            chunk.flush()
+        if history is not None:
+            self._add_history(index, history)
+
+    def _add_history(self, index, history):
+        chunk = self.monthly
+        series = history.as_arrays()
+        start, total = 0, len(history)
+        while start < total:
+            take = min(chunk.room(), total - start)
+            rows = slice(chunk.filled, chunk.filled + take)
+            chunk.columns['lifetime'][rows] = index
+            for name, values in series.items():
+                chunk.columns[name][rows] = values[start:start + take]
+            chunk.filled += take
+            start += take
+            if chunk.room() == 0:
+                chunk.flush()
+
+    def close(self):
+        """Write whatever is still buffered."""
+        self.lifetimes.flush()
+        self.monthly.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CsvExporter:
+    """
+    Streams lifetimes as CSV: one row per lifetime to ``lifetimes_path`` and, when
+    ``monthly_path`` is given, one row per simulated month to it.
+    """
+    def __init__(self, lifetimes_path=None, monthly_path=None):
+        self.lifetimes = self.monthly = None
+        with ExitStack() as files:  # closes what was opened if a later open fails
+            if lifetimes_path is not None:
+                self.lifetimes = csv.writer(files.enter_context(open(lifetimes_path, 'w', newline='')))
+                self.lifetimes.writerow(LIFETIME_FIELDS)
+            if monthly_path is not None:
+                self.monthly = csv.writer(files.enter_context(open(monthly_path, 'w', newline='')))
+                self.monthly.writerow(MONTHLY_FIELDS)
+            self._files = files.pop_all()
+
+    def add(self, index, result, history=None):
+        if self.lifetimes is not None:
+            self.lifetimes.writerow((index, *result.as_dict().values()))
+        if self.monthly is not None and history is not None:
+            self.monthly.writerows((index, *row) for row in history.rows())
+
+    def close(self):
+        self._files.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_shards(directory, kind="lifetimes"):
+    """Yield each ``kind`` ("lifetimes" or "monthly") shard under ``directory`` as a
+    dict of column arrays, in write order."""
+    for path in sorted(glob.glob(os.path.join(directory, f"{kind}-*.npz"))):
+        with np.load(path) as shard:
+            yield {name: shard[name] for name in shard.files}
+
+
+def export_monte_carlo(lives, exporters, master_seed=0, workers=None, policy="default",
+                       chunk_size=None):
+    """Simulate ``lives`` lifetimes (as ``run_monte_carlo`` does) and stream each one to
+    every exporter as it arrives, then close them. Returns the number exported."""
+    count = 0
+    try:
+        for result, _, history in iter_lifetimes(lives, master_seed, workers, policy, chunk_size,
+                                                 with_history=True):
+            for exporter in exporters:
+                exporter.add(count, result, history)
+            count += 1
+    finally:
+        for exporter in exporters:
+            exporter.close()
+    return count
+
+
+__all__ = [
+    'LIFETIME_FIELDS',
+    'MONTHLY_FIELDS',
+    'CsvExporter',
+    'NpzExporter',
+    'export_monte_carlo',
+    'iter_shards',
+]
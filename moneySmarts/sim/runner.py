@@ -0,0 +1,135 @@
+"""
+Process-pool Monte Carlo runner.
+
+Shards lifetimes across a ``ProcessPoolExecutor``. Every lifetime gets its own
+``random.Random`` streams (one for the game, one for the policy) derived from
+the master seed and the lifetime's index. The worker that runs a lifetime plays
+no part in the derivation, so the merged report is bit-for-bit identical for
+any worker count or shard size.
+"""
+import hashlib
+import os
+import random
+import statistics
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from moneySmarts.sim.engine import POLICIES, SimGame, percentile, summarize
+
+PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+MAX_CHUNK = 256      # Lifetimes per shard (results are a few KB each)
+HISTORY_CHUNK = 16   # Lifetimes per shard when each carries its monthly TimeSeries
+SHARDS_PER_WORKER = 2  # Shards in flight (running or waiting to be merged) per worker
+
+
+def derive_seed(master_seed, index, stream="game"):
+    """64-bit seed for one lifetime's named stream, stable across processes and platforms."""
+    digest = hashlib.sha256(f"{master_seed}:{index}:{stream}".encode()).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def iter_shard(master_seed, start, stop, policy="default", with_history=False):
+    """Simulate lifetimes ``start..stop-1``, yielding each as it finishes: a
+    ``(LifetimeResult, net_worth_by_age)`` pair, or a ``(LifetimeResult,
+    net_worth_by_age, TimeSeries)`` triple with ``with_history``."""
+    make_policy = POLICIES[policy]
+    for index in range(start, stop):
+        game_seed = derive_seed(master_seed, index, "game")
+        game = SimGame(policy=make_policy(derive_seed(master_seed, index, "policy")),
+                       rng=random.Random(game_seed), track_net_worth=True,
+                       record_history=with_history)
+        result = game.run()
+        result.seed = game_seed
+        # The game sits in reference cycles (quests, event callbacks) until a full GC
+        # pass; freeing its player now keeps those dead games small
+        game.player = None
+        if with_history:
+            yield result, game.net_worth_by_age, game.history
+        else:
+            yield result, game.net_worth_by_age
+
+
+def simulate_shard(master_seed, start, stop, policy="default", with_history=False):
+    """``iter_shard`` as a list, in index order; runs inside worker processes."""
+    return list(iter_shard(master_seed, start, stop, policy, with_history))
+
+
+def shard_bounds(lives, workers, chunk_size=None, with_history=False):
+    """Split ``range(lives)`` into contiguous ``(start, stop)`` shards.
+
+    By default there are ~8 shards per worker for load balance, capped at
+    ``MAX_CHUNK`` lifetimes (``HISTORY_CHUNK`` with histories) so a shard's
+    results stay small however many lifetimes are run.
+    """
+    if chunk_size is None:
+        cap = HISTORY_CHUNK if with_history else MAX_CHUNK
+        chunk_size = min(cap, max(1, -(-lives // (workers * 8))))
+    return [(start, min(start + chunk_size, lives)) for start in range(0, lives, chunk_size)]
+
+
+def iter_lifetimes(lives, master_seed=0, workers=None, policy="default", chunk_size=None,
+                   with_history=False):
+    """Yield ``(LifetimeResult, net_worth_by_age)`` for every lifetime, in index order
+    (plus the game's monthly ``TimeSeries`` as a third item with ``with_history``).
+
+    ``workers=1`` runs in-process, one lifetime at a time. Otherwise shards go to a
+    process pool with at most ``SHARDS_PER_WORKER`` shards per worker in flight, so
+    finished results never pile up faster than the caller consumes them.
+    """
+    workers = workers or os.cpu_count() or 1
+    bounds = shard_bounds(lives, workers, chunk_size, with_history)
+    if workers == 1:
+        for start, stop in bounds:
+            yield from iter_shard(master_seed, start, stop, policy, with_history)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for start, stop in bounds:
+            if len(pending) == workers * SHARDS_PER_WORKER:
+                yield from pending.popleft().result()
+            pending.append(pool.submit(simulate_shard, master_seed, start, stop, policy,
+                                       with_history))
+        while pending:
+            yield from pending.popleft().result()
+
+
+def net_worth_percentiles_by_age(histories, start_age=16):
+    """Per-age net worth distribution from per-lifetime birthday snapshots."""
+    by_age = {}
+    longest = max((len(h) for h in histories), default=0)
+    for offset in range(longest):
+        values = sorted(h[offset] for h in histories if len(h) > offset)
+        stats = {f"p{q}": percentile(values, q) for q in PERCENTILES}
+        stats['mean'] = statistics.fmean(values)
+        stats['count'] = len(values)
+        by_age[start_age + offset] = stats
+    return by_age
+
+
+def merge_report(pairs, master_seed=0, policy="default"):
+    """Merge lifetime results into one distribution report (JSON-serializable)."""
+    results = [result for result, _ in pairs]
+    return {
+        'master_seed': master_seed,
+        'policy': policy,
+        'summary': summarize(results),
+        'net_worth_by_age': net_worth_percentiles_by_age([history for _, history in pairs]),
+    }
+
+
+def run_monte_carlo(lives, master_seed=0, workers=None, policy="default", chunk_size=None):
+    """Simulate ``lives`` lifetimes across ``workers`` processes and return the merged report."""
+    pairs = list(iter_lifetimes(lives, master_seed, workers, policy, chunk_size))
+    return merge_report(pairs, master_seed, policy)
+
+
+__all__ = [
+    'derive_seed',
+    'iter_lifetimes',
+    'iter_shard',
+    'merge_report',
+    'net_worth_percentiles_by_age',
+    'run_monte_carlo',
+    'shard_bounds',
+    'simulate_shard',
+]
@@ -0,0 +1,137 @@
+"""
+Monthly time series of a game's finances.
+
+``TimeSeries`` keeps one typed ``array`` column per field, preallocated for a
+whole lifetime (``LIFETIME_MONTHS``). Runs longer than the capacity wrap around
+and keep the most recent months (a ring buffer), so memory never grows. With
+numpy installed, ``view``/``series`` expose the columns as zero-copy arrays for
+plotting and export.
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+LIFETIME_MONTHS = 600  # 16 to retirement at 65 is 588 months
+
+# (name, array typecode); money columns are dollars
+COLUMNS = (
+    ("month", "q"),
+    ("age", "h"),
+    ("cash", "d"),
+    ("checking", "d"),
+    ("savings", "d"),
+    ("investments", "d"),
+    ("assets", "d"),
+    ("debt", "d"),
+    ("net_worth", "d"),
+    ("credit_score", "i"),
+)
+COLUMN_NAMES = tuple(name for name, _ in COLUMNS)
+
+def snapshot(game):
+    """
+    One row of ``COLUMNS`` for the game's current state. The money columns are the
+    components of ``utils.compute_net_worth``: net worth = cash + checking + savings
+    + investments + assets - debt (credit card and loans).
+    """
+    player = game.player
+    bank = player.bank_account
+    checking = bank.balance if bank and bank.account_type != "Savings" else 0.0
+    savings = player.savings_account.balance if player.savings_account else 0.0
+    investments = sum(inv.amount for inv in player.investments)
+    assets = sum(asset.current_value for asset in player.assets)
+    debt = player.credit_card.balance if player.credit_card else 0.0
+    debt += sum(getattr(loan, "current_balance", 0.0) for loan in player.loans)
+    return (game.current_year * 12 + game.current_month - 1, player.age, player.cash, checking,
+            savings, investments, assets, debt, player.net_worth, player.credit_score)
+
+class TimeSeries:
+    """
+    Fixed-capacity columnar store of monthly rows (see ``COLUMNS``).
+
+    Attributes:
+        capacity (int): Rows kept; older rows are overwritten once it is exceeded.
+        count (int): Rows recorded in total (may exceed ``capacity``).
+        columns (dict): Column name -> preallocated ``array`` in storage order.
+    """
+    def __init__(self, capacity=LIFETIME_MONTHS):
+        self.capacity = capacity
+        self.count = 0
+        self.columns = {name: array(code, bytes(array(code).itemsize * capacity))
+                        for name, code in COLUMNS}
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    @property
+    def wrapped(self):
+        """True once old rows have been overwritten."""
+        return self.count > self.capacity
+
+    def append(self, row):
+        """Store one row of values in ``COLUMNS`` order."""
+        i = self.count % self.capacity
+        (month, age, cash, checking, savings, investments, assets, debt, net_worth,
+         credit_score) = row
+        c = self.columns
+        c["month"][i] = month
+        c["age"][i] = age
+        c["cash"][i] = cash
+        c["checking"][i] = checking
+        c["savings"][i] = savings
+        c["investments"][i] = investments
+        c["assets"][i] = assets
+        c["debt"][i] = debt
+        c["net_worth"][i] = net_worth
+        c["credit_score"][i] = credit_score
+        self.count += 1
+
+    def record(self, game):
+        """Store the game's current state as a row."""
+        self.append(snapshot(game))
+
+    def _order(self):
+        """Storage index ranges holding the kept rows, oldest first."""
+        if not self.wrapped:
+            return ((0, self.count),)
+        head = self.count % self.capacity
+        return ((head, self.capacity), (0, head))
+
+    def column(self, name):
+        """Kept values of one column, oldest first, as a list."""
+        data = self.columns[name]
+        return [v for start, stop in self._order() for v in data[start:stop]]
+
+    def rows(self):
+        """Iterate over kept rows (tuples in ``COLUMNS`` order), oldest first."""
+        columns = list(self.columns.values())
+        for start, stop in self._order():
+            for i in range(start, stop):
+                yield tuple(column[i] for column in columns)
+
+    def view(self, name):
+        """Read-only numpy view of a whole column buffer in storage order (no copy)."""
+        if np is None:
+            raise ImportError("TimeSeries views need numpy (pip install moneySmarts[sim])")
+        data = self.columns[name]
+        out = np.frombuffer(data, dtype=data.typecode)
+        out.flags.writeable = False
+        return out
+
+    def series(self, name):
+        """Kept values of one column, oldest first, as a numpy array. A zero-copy
+        view until the buffer wraps; a copy in chronological order after that."""
+        out = self.view(name)
+        if not self.wrapped:
+            return out[:self.count]
+        head = self.count % self.capacity
+        return np.concatenate((out[head:], out[:head]))
+
+    def as_arrays(self):
+        """Every column as ``series``: name -> numpy array."""
+        return {name: self.series(name) for name in COLUMN_NAMES}
+
+__all__ = ["COLUMNS", "COLUMN_NAMES", "LIFETIME_MONTHS", "TimeSeries", "snapshot"]
@@ -3,60 +3,153 @@ import os
 from pygame.locals import *
 from moneySmarts.constants import *
 from moneySmarts.sound_manager import SoundManager
-from moneySmarts.event_manager import EventBus
+from moneySmarts.event_manager import EventBus, RANDOM_EVENT
+from moneySmarts.fonts import get_font, load_font, render_text
+from moneySmarts.config_manager import Config
+from moneySmarts.image_manager import image_manager
 
 # --- Drawing helpers for modern UI ---
-def draw_vertical_gradient(surface, rect, top_color, bottom_color):
-    x, y, w, h = rect
-    if h <= 0:
-        return
+# Rendered gradients keyed by (size, top_color, bottom_color)
+GRADIENT_CACHE = {}
+
+def gradient_surface(size, top_color, bottom_color):
+    """Surface of ``size`` filled with a vertical gradient, rendered once and cached.
+    Built as a 1-pixel-wide strip stretched sideways to the full width."""
+    key = (tuple(size), tuple(top_color), tuple(bottom_color))
+    cached = GRADIENT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    w, h = size
+    strip = pygame.Surface((1, h))
     for i in range(h):
         ratio = i / max(1, h - 1)
         r = int(top_color[0] + (bottom_color[0] - top_color[0]) * ratio)
         g = int(top_color[1] + (bottom_color[1] - top_color[1]) * ratio)
         b = int(top_color[2] + (bottom_color[2] - top_color[2]) * ratio)
-        pygame.draw.line(surface, (r, g, b), (x, y + i), (x + w - 1, y + i))
+        strip.set_at((0, i), (r, g, b))
+    gradient = pygame.transform.scale(strip, (w, h))
+    if pygame.display.get_surface() is not None:
+        gradient = gradient.convert()  # Match the display format for fast blits
+    GRADIENT_CACHE[key] = gradient
+    return gradient
+
+def clear_gradient_cache():
+    """Drop cached gradients (their sizes are stale after a window resize)."""
+    GRADIENT_CACHE.clear()
+
+def draw_vertical_gradient(surface, rect, top_color, bottom_color):
+    x, y, w, h = rect
+    if h <= 0 or w <= 0:
+        return
+    surface.blit(gradient_surface((w, h), top_color, bottom_color), (x, y))
 
 def draw_rounded_rect(surface, color, rect, radius=10, width=0):
     pygame.draw.rect(surface, color, rect, width, border_radius=radius)
 
+# --- Dirty-rectangle tracking ---
+class DirtyRegions:
+    """
+    Screen areas that changed since the last frame. GUIManager redraws and
+    updates only these; with nothing dirty the frame is skipped.
+    """
+    def __init__(self):
+        self.full = True
+        self.rects = []
+
+    def add(self, rect=None):
+        """Mark ``rect`` as changed, or the whole screen when ``rect`` is None."""
+        if rect is None:
+            self.full = True
+            self.rects = []
+        elif not self.full:
+            self.rects.append(pygame.Rect(rect))
+
+    def take(self):
+        """Return (whole_screen, rects) and start the next frame clean."""
+        full, rects = self.full, self.rects
+        self.full, self.rects = False, []
+        return full, rects
+
+    def __bool__(self):
+        return self.full or bool(self.rects)
+
+dirty_regions = DirtyRegions()
+
+def invalidate(rect=None):
+    """Shortcut for ``dirty_regions.add``."""
+    dirty_regions.add(rect)
+
+# Attributes baked into a Button's cached surfaces
+BUTTON_STYLE = ('text', 'color', 'hover_color', 'text_color', 'font')
+
 class Button:
     """
     A button UI element that can be clicked to trigger an action.
+
+    The normal and hover states are pre-rendered and re-baked only when the
+    text, colors, font or size change, so drawing is a single blit.
     """
     def __init__(self, x, y, width, height, text, color=PRIMARY, hover_color=PRIMARY_HOVER,
                  text_color=PRIMARY_TEXT, font_size=FONT_MEDIUM, font_name=None, action=None):
+        self._surfaces = None
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.color = color
         self.hover_color = hover_color
         self.text_color = text_color
-        # Use custom font if available
-        try:
-            if font_name:
-                self.font = pygame.font.Font(font_name, font_size)
-            else:
-                self.font = pygame.font.SysFont('Arial', font_size)
-        except:
-            self.font = pygame.font.SysFont('Arial', font_size)
+        # Use custom font if available (shared through the font cache)
+        self.font = load_font(font_name, font_size) if font_name else get_font(font_size)
         self.action = action
         self.hovered = False
 
-    def draw(self, surface):
-        """Draw the button on the given surface with modern styling."""
-        color = self.hover_color if self.hovered else self.color
+    def __setattr__(self, name, value):
+        if name in BUTTON_STYLE:
+            if self.__dict__.get('_surfaces') is not None:
+                invalidate()  # the new label may cover a different area
+            self.__dict__['_surfaces'] = None
+        elif name == 'hovered' and value != self.__dict__.get('hovered', value):
+            invalidate(self.area)
+        object.__setattr__(self, name, value)
+
+    @property
+    def area(self):
+        """Screen area covered when drawn: body, shadow and any label overhang."""
+        if self._surfaces is None or self._surfaces[3] != self.rect.size:
+            self._bake()
+        normal, _, offset, _ = self._surfaces
+        return normal.get_rect(topleft=self.rect.move(offset).topleft)
+
+    def _render(self, color):
+        """Bake one state: shadow, body and label. Returns (surface, offset from rect)."""
         # Validate color
         if not (isinstance(color, tuple) and len(color) in (3, 4) and all(isinstance(c, int) and 0 <= c <= 255 for c in color)):
             color = PRIMARY
-        # Shadow
-        shadow_rect = self.rect.move(0, 2)
-        draw_rounded_rect(surface, (0, 0, 0, 0), shadow_rect, radius=10)  # noop for alpha; keep API
-        # Button body
-        draw_rounded_rect(surface, color, self.rect, radius=10)
-        # Text
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        body = pygame.Rect((0, 0), self.rect.size)
+        shadow = body.move(0, 2)
+        text_surface = render_text(self.font, self.text, True, self.text_color)
+        text_rect = text_surface.get_rect(center=body.center)
+        bounds = body.union(shadow).union(text_rect)  # a long label may overhang the body
+        shift = (-bounds.x, -bounds.y)
+        baked = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        # The screen has no per-pixel alpha, so the shadow has always shown as black
+        draw_rounded_rect(baked, (0, 0, 0), shadow.move(shift), radius=10)
+        draw_rounded_rect(baked, color, body.move(shift), radius=10)
+        baked.blit(text_surface, text_rect.move(shift))
+        if pygame.display.get_surface() is not None:
+            baked = baked.convert_alpha()
+        return baked, bounds.topleft
+
+    def _bake(self):
+        normal, offset = self._render(self.color)
+        hover, _ = self._render(self.hover_color)
+        self._surfaces = (normal, hover, offset, self.rect.size)
+
+    def draw(self, surface):
+        """Draw the button on the given surface with modern styling."""
+        if self._surfaces is None or self._surfaces[3] != self.rect.size:
+            self._bake()
+        normal, hover, offset, _ = self._surfaces
+        surface.blit(hover if self.hovered else normal, self.rect.move(offset))
 
     def update(self, mouse_pos, mouse_click):
         """
@@ -74,14 +167,8 @@ class TextInput:
                  initial_text="", font_name=None):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = initial_text
-        # Use custom font if available
-        try:
-            if font_name:
-                self.font = pygame.font.Font(font_name, font_size)
-            else:
-                self.font = pygame.font.SysFont('Arial', font_size)
-        except:
-            self.font = pygame.font.SysFont('Arial', font_size)
+        # Use custom font if available (shared through the font cache)
+        self.font = load_font(font_name, font_size) if font_name else get_font(font_size)
         self.active = False
         self.max_length = max_length
 
@@ -91,7 +178,7 @@ class TextInput:
         border_color = ACCENT if self.active else CARD_BORDER
         draw_rounded_rect(surface, bg_color, self.rect, radius=8)
         pygame.draw.rect(surface, border_color, self.rect, 2, border_radius=8)
-        text_surface = self.font.render(self.text, True, BLACK)
+        text_surface = render_text(self.font, self.text, True, BLACK)
         text_rect = text_surface.get_rect(midleft=(self.rect.left + 10, self.rect.centery))
         surface.blit(text_surface, text_rect)
 
@@ -134,22 +221,41 @@ def load_sfx(name):
 class Screen:
     """
     Base class for all screens in the game.
+
+    In dirty-rectangle mode the GUIManager only redraws after input (other than
+    mouse motion), button hover changes or areas reported with ``invalidate``;
+    screens that change on their own must report what they change in ``update``.
+    Without input the loop sleeps unless ``needs_animation`` says otherwise.
+
+    Images loaded through ``load_image`` are pinned in the image cache while the
+    screen is current, so the memory budget never evicts what is on screen.
     """
         
     play_startup_music = False  # Class attribute to control music
+    redraw_every_frame = False  # Opt out of dirty-rectangle rendering
+    reusable = False  # GUIManager.show keeps one instance and re-enters it
 
     def __init__(self, game):
         self.game = game
         self.buttons = []
         self.next_screen = None
+        self.images = []  # (path_or_key, size) pinned while the screen is current
 
-        # Subscribe to random events for UI notification
-        EventBus.subscribe("random_event", self.on_random_event)
+        # Subscribe to random events for UI notification. Weak, and scoped to the
+        # screen so GUIManager can drop them once the screen is discarded
+        self.subscriptions = EventBus.scope()
+        self.subscriptions.subscribe(RANDOM_EVENT, self.on_random_event, weak=True)
         
+    def load_image(self, path_or_key, size=None):
+        """``image_manager.load_image``, pinned while this screen is current."""
+        image = image_manager.load_image(path_or_key, size=size)
+        if image is not None:
+            self.images.append((path_or_key, size))
+        return image
+
     def on_random_event(self, event, effect, player):
         """Handle random events published by the event system (override in subclasses for custom UI)."""
         # Example: print/log or update UI elements
-        pass
 
     def handle_events(self, events):
         """Handle pygame events for this screen."""
@@ -168,7 +274,25 @@ class Screen:
 
     def update(self):
         """Update the screen state."""
-        pass
+
+    def on_enter(self):
+        """Called each time the screen becomes current; reusable screens refresh
+        whatever changed while they were away."""
+
+    def on_exit(self):
+        """Called when another screen replaces or covers this one."""
+
+    def close(self):
+        """Release the screen's event subscriptions; it will not be shown again."""
+        self.subscriptions.close()
+
+    def needs_animation(self):
+        """Whether ``update`` must run at full frame rate even without input."""
+        return self.redraw_every_frame
+
+    def invalidate(self, rect=None):
+        """Report ``rect`` (default: the whole screen) as changed for the next frame."""
+        invalidate(rect)
 
     def draw(self, surface):
         """Draw the screen on the given surface with gradient background."""
@@ -186,7 +310,12 @@ class GUIManager:
         pygame.display.set_caption("Money Smartz: Financial Life Simulator")
         self.clock = pygame.time.Clock()
         self.current_screen = None
+        # Screens below the current one (push/pop) and cached reusable screens by class
+        self.stack = []
+        self.screens = {}
         self.running = True
+        # Redraw only changed areas and skip idle frames (see Screen)
+        self.dirty_rects = Config.get("dirty_rects", True)
         
         # Initialize sound manager
         self.sound_manager = SoundManager()
@@ -208,28 +337,103 @@ class GUIManager:
         else:
             print(f"Warning: Sound file not found at {startup_song_path}")
 
+    def show(self, screen_cls, *args, **kwargs):
+        """
+        Switch to a ``screen_cls`` screen. Reusable screens opened without extra
+        arguments come from the registry (built on first use); others are built
+        fresh as before. Returns the screen.
+        """
+        if screen_cls.reusable and not args and not kwargs:
+            screen = self.screens.get(screen_cls)
+            if screen is None:
+                screen = self.screens[screen_cls] = screen_cls(self.game)
+        else:
+            screen = screen_cls(self.game, *args, **kwargs)
+        self.set_screen(screen)
+        return screen
+
+    def forget_screens(self):
+        """Drop cached screens and the stack (e.g. when a new game starts)."""
+        dropped = [*self.screens.values(), *self.stack]
+        self.screens.clear()
+        self.stack.clear()
+        for screen in dropped:
+            self._release(screen)
+
     def set_screen(self, screen):
-        """Set the current screen to be displayed."""
+        """Set the current screen to be displayed, replacing the current one."""
+        previous = self.current_screen
+        self._leave()
+        self._enter(screen)
+        self._release(previous)
+
+    def push(self, screen):
+        """Show ``screen`` on top of the current one, which ``pop`` returns to."""
+        current = self.current_screen
+        self._leave()
+        if current is not None:
+            self.stack.append(current)
+        self._enter(screen)
+
+    def pop(self):
+        """Close the current screen and return to the one below it. Returns that
+        screen, or None (changing nothing) when there is none."""
+        if not self.stack:
+            return None
+        previous = self.current_screen
+        self._leave()
+        screen = self.stack.pop()
+        self._enter(screen)
+        self._release(previous)
+        return screen
+
+    def _release(self, screen):
+        """Close ``screen`` unless it is still current, cached or on the stack."""
+        if (screen is None or screen is self.current_screen or screen in self.stack
+                or self.screens.get(type(screen)) is screen):
+            return
+        screen.close()
+
+    def _leave(self):
+        if self.current_screen is not None:
+            self.current_screen.on_exit()
+            for path_or_key, size in self.current_screen.images:
+                image_manager.unpin(path_or_key, size)
+
+    def _enter(self, screen):
         self.current_screen = screen
+        for path_or_key, size in screen.images:
+            image_manager.pin(path_or_key, size)
+        invalidate()
         print(f"[DEBUG] set_screen called: switched to {type(screen).__name__}")
-        # Call on_enter if present
-        if hasattr(screen, 'on_enter') and callable(screen.on_enter):
-            screen.on_enter()
+        screen.on_enter()
         # Handle music based on screen's play_startup_music attribute
         if getattr(screen, 'play_startup_music', False):
             self.sound_manager.play_music('startup_song')
         else:
             self.sound_manager.stop_music()
             
+    def is_idle(self, events):
+        """True when nothing needs the next frame soon: no input this frame, no
+        animating screen, no reported damage left to draw and no images preloading."""
+        screen = self.current_screen
+        return not (events or dirty_regions or EventBus.has_pending() or image_manager.preloading()
+                    or (screen and screen.needs_animation()))
+
     def run(self):
         """Run the main game loop."""
+        pending = []
         while self.running and not self.game.game_over:
-            events = pygame.event.get()
+            events = pending + pygame.event.get()
+            pending = []
             for event in events:
+                if event.type != MOUSEMOTION:
+                    invalidate()  # clicks and keys may change anything on screen
                 if event.type == QUIT:
                     self.running = False
                 elif event.type == pygame.VIDEORESIZE:
                     self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+                    clear_gradient_cache()
                     # Store screen dimensions locally instead of modifying global constants
                     self.screen_width = event.w
                     self.screen_height = event.h
@@ -241,7 +445,43 @@ class GUIManager:
             if self.current_screen:
                 self.current_screen.handle_events(events)
                 self.current_screen.update()
-                self.current_screen.draw(self.screen)
-            pygame.display.flip()
-            self.clock.tick(FPS)
+                image_manager.pump_preload()  # preloaded images, with their progress events
+                EventBus.dispatch_pending()  # events posted this frame, before drawing
+                if self.dirty_rects and not self.current_screen.redraw_every_frame:
+                    self.draw_dirty()
+                else:
+                    dirty_regions.take()
+                    self.current_screen.draw(self.screen)
+                    pygame.display.flip()
+            else:
+                pygame.display.flip()
+            if self.is_idle(events):
+                # Block until input arrives (handled at once) or the timeout lets update() poll
+                event = pygame.event.wait(IDLE_WAIT_MS)
+                if event.type != NOEVENT:
+                    pending.append(event)
+                self.clock.tick()  # the wait was not frame time
+            else:
+                self.clock.tick(FPS)
         pygame.quit()
+
+    def draw_dirty(self):
+        """Redraw the current screen where it changed; returns the updated rects."""
+        full, rects = dirty_regions.take()
+        if full:
+            self.current_screen.draw(self.screen)
+            pygame.display.flip()
+            return [self.screen.get_rect()]
+        bounds = self.screen.get_rect()
+        rects = [r.clip(bounds) for r in rects]
+        rects = [r for r in rects if r.width and r.height]
+        if not rects:
+            return []
+        # Draw calls outside the clip are cheap no-ops
+        self.screen.set_clip(rects[0].unionall(rects[1:]))
+        try:
+            self.current_screen.draw(self.screen)
+        finally:
+            self.screen.set_clip(None)
+        pygame.display.update(rects)
+        return rects
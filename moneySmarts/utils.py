@@ -47,40 +47,16 @@ def log_and_raise(exception, message):
     raise exception(message)
 
 def compute_net_worth(player):
-    """Compute player's net worth.
-    Components:
-      + cash
-      + checking (bank_account if type != Savings)
-      + savings_account (if present)
-      + investments (sum of investment.amount)
-      + asset current values
-      - credit card balance
-      - loan current balances
-    Returns float.
-    Safe against missing attributes.
+    """Player's net worth, summed from its balances when read (``Player.net_worth``).
+    Objects without one fall back to the full ``recompute_net_worth`` walk.
     """
     if not player:
         return 0.0
-    cash = getattr(player, 'cash', 0.0) or 0.0
-    checking = 0.0
-    if getattr(player, 'bank_account', None) and player.bank_account.account_type != 'Savings':
-        checking = player.bank_account.balance
-    savings = getattr(getattr(player, 'savings_account', None), 'balance', 0.0) or 0.0
-    investments_total = 0.0
-    for inv in getattr(player, 'investments', []) or []:
-        investments_total += getattr(inv, 'amount', 0.0) or 0.0
-    asset_value = 0.0
-    for asset in getattr(player, 'assets', []) or []:
-        asset_value += getattr(asset, 'current_value', 0.0) or 0.0
-    credit_debt = 0.0
-    if getattr(player, 'credit_card', None):
-        credit_debt = player.credit_card.balance
-    loan_debt = 0.0
-    for loan in getattr(player, 'loans', []) or []:
-        loan_debt += getattr(loan, 'current_balance', 0.0) or 0.0
-    return cash + checking + savings + investments_total + asset_value - credit_debt - loan_debt
-def compute_net_worth(player):
-    """Compute player's net worth.
+    worth = getattr(player, 'net_worth', None)
+    return recompute_net_worth(player) if worth is None else worth
+
+def recompute_net_worth(player):
+    """Compute player's net worth from scratch.
     Components:
       + cash
       + checking (bank_account if type != Savings)
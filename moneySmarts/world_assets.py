@@ -8,13 +8,18 @@ Naming conventions supported:
 Fallback: rectangle placeholder if exterior missing.
 Special display name mapping & type detection for known functional buildings
 (bank, shop, jobcenter, school, housing).
+
+discover_buildings() scans the directories on every call; lookups by name go
+through the building_index singleton instead, which scans once and answers
+from hash tables until invalidate() or refresh() notices a change on disk.
 """
 from __future__ import annotations
+
 import os
 import re
 from dataclasses import dataclass
-from typing import List, Optional
-from moneySmarts.images import IMAGES_DIR, get_image_path
+
+from moneySmarts.images import IMAGES_DIR
 
 SPECIAL_TITLES = {
     'bank': 'Bank',
@@ -29,14 +34,14 @@ SPECIAL_TITLES = {
     'home': 'Home'
 }
 
-SPECIAL_TYPES = set(['bank','shop','jobcenter','school','housing','home'])
+SPECIAL_TYPES = {'bank','shop','jobcenter','school','housing','home'}
 
 @dataclass
 class BuildingDef:
     key: str
     display_name: str
-    exterior_path: Optional[str]
-    interior_path: Optional[str]
+    exterior_path: str | None
+    interior_path: str | None
     btype: str = 'generic'  # bank/shop/jobcenter/school/housing/home/generic
 
     @property
@@ -64,13 +69,15 @@ def _classify(key_norm: str) -> str:
     if 'home' in key_norm or 'house' in key_norm or 'condo' in key_norm: return 'home'
     return 'generic'
 
-def discover_buildings() -> List[BuildingDef]:
-    buildings: List[BuildingDef] = []
+def _asset_dirs(root: str) -> tuple[str, str, str, str]:
+    """Exterior (buildings/, misc) then interior (buildings/, misc) directories."""
+    return (os.path.join(root, 'buildings', 'exteriors'), os.path.join(root, 'exteriors'),
+            os.path.join(root, 'buildings', 'interiors'), os.path.join(root, 'interiors'))
+
+def discover_buildings(root: str = IMAGES_DIR) -> list[BuildingDef]:
+    buildings: list[BuildingDef] = []
     # Directories
-    ex_bld_dir = os.path.join(IMAGES_DIR, 'buildings', 'exteriors')
-    ex_misc_dir = os.path.join(IMAGES_DIR, 'exteriors')
-    int_bld_dir = os.path.join(IMAGES_DIR, 'buildings', 'interiors')
-    int_misc_dir = os.path.join(IMAGES_DIR, 'interiors')
+    ex_bld_dir, ex_misc_dir, int_bld_dir, int_misc_dir = _asset_dirs(root)
 
     # Gather exteriors (both dirs)
     exterior_files = []
@@ -98,10 +105,8 @@ def discover_buildings() -> List[BuildingDef]:
             # Derive logical key
             key = base
             for suffix in ('_interior_hd','_interior_mobile','_interior'):
-                if key.endswith('.png'):
-                    key = key[:-4]
-                if key.endswith(suffix):
-                    key = key[:-len(suffix)]
+                key = key.removesuffix('.png')
+                key = key.removesuffix(suffix)
             norm_key = _norm(key)
             rank = 0 if '_hd' in low else (1 if '_mobile' in low else 2)
             best = interior_candidates.get(norm_key)
@@ -152,4 +157,100 @@ def discover_buildings() -> List[BuildingDef]:
     buildings.sort(key=lambda b: (priority.get(b.btype, 8), b.display_name.lower()))
     return buildings
 
-__all__ = ['BuildingDef','discover_buildings']
+def _mtime(path: str) -> float | None:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+class BuildingIndex:
+    """Building defs from one discover_buildings() scan, with hash lookups by name.
+
+    find() tries the exact key, then the normalized display name, then the
+    substring match get_building_image has always used; the result of each name
+    is remembered, so repeated lookups (every frame) cost one dict access and
+    never touch the filesystem. The scan happens on first use and again after
+    invalidate(), or after refresh() sees a changed directory or image mtime.
+    """
+    def __init__(self, root: str = IMAGES_DIR):
+        self.root = root
+        self.generation = 0  # bumped by every rebuild; lets callers drop derived caches
+        self._buildings: list[BuildingDef] | None = None
+        self._mtimes: dict[str, float | None] = {}
+
+    def _build(self):
+        buildings = discover_buildings(self.root)
+        self._buildings = buildings
+        self._by_key = {}
+        self._by_name = {}
+        for b in buildings:
+            self._by_key.setdefault(b.key, b)
+            self._by_name.setdefault(_norm(b.display_name), b)
+        self._fuzzy = tuple((b.key.lower(), b.display_name.lower(), b) for b in buildings)
+        self._fallback = {
+            'exterior': next((b for b in buildings if b.exterior_path), None),
+            'interior': next((b for b in buildings if b.interior_path), None),
+        }
+        self._matches: dict[str, BuildingDef | None] = {}
+        self._mtimes = self._snapshot()
+        self.generation += 1
+
+    def _snapshot(self) -> dict[str, float | None]:
+        # Directory mtimes catch added/removed files, file mtimes catch edits
+        paths = list(_asset_dirs(self.root))
+        for b in self._buildings or ():
+            paths.extend(p for p in (b.exterior_path, b.interior_path) if p)
+        return {p: _mtime(p) for p in paths}
+
+    @property
+    def buildings(self) -> list[BuildingDef]:
+        if self._buildings is None:
+            self._build()
+        return self._buildings
+
+    def invalidate(self):
+        """Forget the scan; the next lookup rescans the directories."""
+        self._buildings = None
+        self.generation += 1  # derived caches must not outlive the scan either
+
+    def refresh(self) -> bool:
+        """Rescan if any asset directory or indexed image changed since the last
+        scan. Costs a stat per file, so call it on screen changes, not per frame.
+        Returns True when the index was rebuilt."""
+        if self._buildings is not None and self._snapshot() == self._mtimes:
+            return False
+        self._build()
+        return True
+
+    def _match(self, name: str) -> BuildingDef | None:
+        b = self._by_key.get(_norm(name)) or self._by_name.get(_norm(name))
+        if b is not None:
+            return b
+        norm = name.lower().replace(' ', '')
+        lower = name.lower()
+        for keyn, display, b in self._fuzzy:
+            if keyn in norm or norm in keyn or lower in display:
+                return b
+        return None
+
+    def find(self, name: str) -> BuildingDef | None:
+        """Building matching ``name`` (exact key, display name, then substring)."""
+        if self._buildings is None:
+            self._build()
+        try:
+            return self._matches[name]
+        except KeyError:
+            b = self._matches[name] = self._match(name)
+            return b
+
+    def image_path(self, name: str, image_type: str = 'exterior') -> str | None:
+        """Path of the ``image_type`` ('exterior' | 'interior') image for ``name``;
+        without a match, the first building that has one."""
+        b = self.find(name) or self._fallback.get(image_type)
+        if b is None:
+            return None
+        return b.exterior_path if image_type == 'exterior' else b.interior_path
+
+building_index = BuildingIndex()
+
+__all__ = ['BuildingDef', 'BuildingIndex', 'building_index', 'discover_buildings']
@@ -3,7 +3,7 @@ from setuptools import setup
 setup(
     name='moneySmarts',
     version='1.0',
-    packages=['moneySmarts', 'moneySmarts.screens'],
+    packages=['moneySmarts', 'moneySmarts.screens', 'moneySmarts.sim'],
     url='',
     license='',
     author='nicks',
@@ -0,0 +1,19 @@
+import importlib
+
+import pytest
+
+from moneySmarts.config_manager import Config
+
+
+@pytest.fixture(autouse=True)
+def isolated_image_disk_cache(tmp_path, monkeypatch):
+    """Keep decoded images out of the developer's ~/.cache: disk caches made
+    during a test, the image_manager singleton's included, live in tmp_path."""
+    cache_dir = str(tmp_path / "image-cache")
+    monkeypatch.setitem(Config.config, "image_disk_cache_dir", cache_dir)
+    try:
+        images = importlib.import_module("moneySmarts.image_manager")
+    except ImportError:  # no pygame, so nothing can write the cache
+        return
+    if images.image_manager.disk_cache is not None:
+        monkeypatch.setattr(images.image_manager, "disk_cache", images.DiskImageCache(cache_dir))
@@ -0,0 +1,135 @@
+import gc
+import os
+import random
+import threading
+import time
+
+import pytest
+
+from moneySmarts.event_manager import EventManager
+
+
+class Listener:
+    def __init__(self):
+        self.seen = []
+
+    def on_event(self, **kwargs):
+        self.seen.append(kwargs)
+
+
+def test_weak_subscription_ends_with_its_owner():
+    bus = EventManager()
+    listener = Listener()
+    bus.subscribe("tick", listener.on_event, weak=True)
+    bus.publish("tick", n=1)
+    assert listener.seen == [{"n": 1}]
+    assert bus.subscriber_count("tick") == 1
+    del listener
+    gc.collect()
+    assert bus.subscriber_count() == {}
+    bus.publish("tick", n=2)  # nothing left to call
+
+
+def test_scopes_and_context_subscriptions_unsubscribe():
+    bus = EventManager()
+    listener = Listener()
+    with bus.scope() as scope:
+        scope.subscribe("a", listener.on_event)
+        scope.subscribe("b", listener.on_event, weak=True)
+        assert bus.subscriber_count() == {"a": 1, "b": 1}
+    assert bus.subscriber_count() == {}
+    with bus.subscription("a", listener.on_event):
+        bus.publish("a", n=1)
+    bus.publish("a", n=2)
+    assert listener.seen == [{"n": 1}]
+    bus.unsubscribe("a", listener.on_event)  # already gone: no error
+
+
+def test_navigation_keeps_screen_subscribers_flat():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame = pytest.importorskip("pygame")
+    from moneySmarts.event_manager import EventBus
+    from moneySmarts.game import Game
+    from moneySmarts.models import Player
+    from moneySmarts.screens.financial_screens import BankDetailsScreen
+    from moneySmarts.screens.game_screen import GameScreen
+    from moneySmarts.ui import GUIManager
+    pygame.init()
+    game = Game()
+    game.player = Player("Ann")
+    manager = game.gui_manager = GUIManager(game)
+    before = EventBus.subscriber_count("random_event")
+    for _ in range(50):
+        manager.show(GameScreen)
+        manager.show(BankDetailsScreen)
+    # The cached game screen and the current bank screen
+    assert EventBus.subscriber_count("random_event") == before + 2
+    manager.forget_screens()
+    pygame.quit()
+
+
+def test_priorities_queues_and_coalescing():
+    bus = EventManager()
+    calls = []
+    bus.subscribe("e", lambda **kw: calls.append(("low", kw)))
+    bus.subscribe("e", lambda **kw: calls.append(("high", kw)), priority=10)
+    bus.publish("e", n=1)
+    assert [name for name, _ in calls] == ["high", "low"]
+    calls.clear()
+    bus.coalesce("e")
+    bus.post("e", n=1)
+    bus.post("e", n=2)
+    bus.post("unheard", n=3)  # nobody listens: dropped
+    assert calls == [] and bus.has_pending()
+    assert bus.dispatch_pending() == 1
+    assert calls == [("high", {"n": 2}), ("low", {"n": 2})]
+    calls.clear()
+    with bus.batch():
+        bus.publish("e", n=3)
+        bus.publish("e", n=4)
+        assert calls == []
+    assert calls == [("high", {"n": 4}), ("low", {"n": 4})]
+
+
+def test_monthly_balance_changes_arrive_once():
+    from moneySmarts.event_manager import BALANCE_CHANGED, EventBus
+    from moneySmarts.sim import SimGame
+    game = SimGame(rng=random.Random(3))
+    game.start()
+    game.run(max_months=24)
+    seen = []
+    with EventBus.subscription(BALANCE_CHANGED, lambda player: seen.append(player)):
+        game.process_monthly_finances()
+    assert seen == [game.player]
+
+
+@pytest.mark.parametrize("policy, expected", [
+    ("drop_oldest", [0, 3, 4]),  # 0 was already being handled
+    ("coalesce", [0, 4]),
+    ("block", [0, 1, 2]),  # the publisher gave up on 3 and 4 after its timeout
+])
+def test_async_channel_backpressure(policy, expected):
+    bus = EventManager()
+    release = threading.Event()
+    seen = []
+
+    def slow(n):
+        release.wait(5)
+        seen.append(n)
+
+    with bus.channel(maxsize=2, policy=policy, block_timeout=0.01) as channel:
+        channel.subscribe("tick", slow)
+        bus.publish("tick", n=0)
+        deadline = time.monotonic() + 5
+        while channel.pending() and time.monotonic() < deadline:
+            time.sleep(0.001)  # wait until the worker holds event 0
+        started = time.monotonic()
+        for n in range(1, 5):
+            bus.publish("tick", n=n)
+        assert time.monotonic() - started < 1  # publishing never waits for the listener
+        release.set()
+        assert channel.flush(5)
+    assert seen == expected
+    assert channel.delivered == len(expected) and channel.dropped == 4 - (len(expected) - 1)
+    assert bus.subscriber_count() == {}
@@ -0,0 +1,52 @@
+import csv
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from moneySmarts.sim.cli import main
+from moneySmarts.sim.export import (
+    LIFETIME_FIELDS,
+    MONTHLY_FIELDS,
+    CsvExporter,
+    NpzExporter,
+    export_monte_carlo,
+    iter_shards,
+)
+from moneySmarts.sim.runner import iter_lifetimes
+
+
+def test_npz_shards_hold_every_lifetime_and_month(tmp_path):
+    lifetimes = list(iter_lifetimes(5, master_seed=2, workers=1, with_history=True))
+    exporter = NpzExporter(tmp_path, lifetimes_per_shard=2, months_per_shard=1000)
+    assert export_monte_carlo(5, [exporter], master_seed=2, workers=1) == 5
+    shards = list(iter_shards(tmp_path, "lifetimes"))
+    assert [len(s["lifetime"]) for s in shards] == [2, 2, 1]
+    worths = np.concatenate([s["net_worth"] for s in shards])
+    np.testing.assert_array_equal(worths, [result.net_worth for result, _, _ in lifetimes])
+    monthly = list(iter_shards(tmp_path, "monthly"))
+    assert len(monthly) > 1 and all(len(s["lifetime"]) <= 1000 for s in monthly)
+    cash = np.concatenate([s["cash"] for s in monthly])
+    np.testing.assert_array_equal(cash, np.concatenate([h.series("cash") for _, _, h in lifetimes]))
+    assert set(monthly[0]) == set(MONTHLY_FIELDS)
+
+
+def test_csv_exporter_streams_rows(tmp_path):
+    lives, months = tmp_path / "lives.csv", tmp_path / "months.csv"
+    with CsvExporter(lives, months) as exporter:
+        for index, (result, _, history) in enumerate(iter_lifetimes(2, workers=1, with_history=True)):
+            exporter.add(index, result, history)
+    with open(lives, newline="") as f:
+        rows = list(csv.reader(f))
+    assert tuple(rows[0]) == LIFETIME_FIELDS and len(rows) == 3
+    with open(months, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 2 * 588 and rows[-1]["lifetime"] == "1"
+
+
+def test_cli_exports_without_report(tmp_path, capsys):
+    assert main(["--lives", "2", "--npz", str(tmp_path / "out"), "--monthly-csv",
+                 str(tmp_path / "m.csv"), "--no-report"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out == "" and captured.err.startswith("Exported 2 lifetimes")
+    assert len(next(iter_shards(tmp_path / "out", "monthly"))["month"]) == 2 * 588
@@ -1,8 +1,9 @@
 import random
 import types
+import pytest
 from moneySmarts.game import Game
-from moneySmarts.models import Player, BankAccount, Investment, Loan, Asset
-from moneySmarts.utils import compute_net_worth
+from moneySmarts.models import Player, BankAccount, Card, Investment, Loan, Asset
+from moneySmarts.utils import compute_net_worth, recompute_net_worth
 
 
 def make_player(name="Tester"):
@@ -67,3 +68,32 @@ def test_compute_net_worth_includes_savings_and_investments():
     # Expected: cash(1000) + checking(500) + savings(200) + inv(1000) + asset(5000) - loan balance (~ < 6000) = > 1700
     assert nw > 1700
 
+
+
+def test_net_worth_follows_mutators():
+    p = make_player()
+    p.bank_account = BankAccount("Checking")
+    p.bank_account.deposit(500)
+    p.credit_card = Card("Credit", limit=1000)
+    p.credit_card.charge(120.55)
+    p.invest("Stock", 300, 0.07)
+    p.investments[0].apply_monthly_return()
+    car = Asset("Car", "Used Car", 5000)
+    p.assets.append(car)
+    car.age_asset()
+    loan = Loan("Auto", 6000, 0.05, 5)
+    p.loans.append(loan)
+    loan.make_payment(loan.monthly_payment)
+    assert p.net_worth == pytest.approx(recompute_net_worth(p))
+    game = Game(rng=random.Random(0))
+    game.player = p
+    p.job, p.salary = "Clerk", 30000
+    p.recurring_bills.append({"name": "Gym", "amount": 40, "source": "bank_or_credit"})
+    for _ in range(3):
+        game.process_monthly_finances()
+    assert p.net_worth == pytest.approx(recompute_net_worth(p))
+    p.loans.remove(loan)
+    p.assets[0] = Asset("House", "Condo", 90000)
+    p.bank_account = BankAccount("Savings")  # a savings-type primary account does not count
+    assert p.net_worth == pytest.approx(recompute_net_worth(p))
+
@@ -0,0 +1,177 @@
+import importlib
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from moneySmarts.image_manager import STATIC, WATCH, DiskImageCache, ImageManager
+from moneySmarts.world_assets import BuildingIndex
+
+
+def _touch(path, mtime=None):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b'')
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_building_index_lookups_stay_off_the_disk(tmp_path, monkeypatch):
+    root = str(tmp_path)
+    _touch(os.path.join(root, 'buildings', 'exteriors', 'bank.png'))
+    _touch(os.path.join(root, 'buildings', 'interiors', 'bank_interior_hd.png'))
+    _touch(os.path.join(root, 'exteriors', 'starter_home.png'))
+    index = BuildingIndex(root)
+    assert index.find('Bank').key == 'bank'
+    assert index.find('Small Starter Home').key == 'starterhome'  # substring match
+    assert index.image_path('Bank', 'interior').endswith('bank_interior_hd.png')
+    assert index.image_path('Spaceport', 'interior').endswith('bank_interior_hd.png')  # fallback
+
+    def no_disk(*args):
+        raise AssertionError("filesystem access during lookup")
+    monkeypatch.setattr(os, 'listdir', no_disk)
+    monkeypatch.setattr(os, 'stat', no_disk)
+    assert index.find('Small Starter Home').key == 'starterhome'
+    assert index.image_path('Bank') is index.image_path('Bank')
+    monkeypatch.undo()
+
+    assert not index.refresh()
+    generation = index.generation
+    _touch(os.path.join(root, 'exteriors', 'school.png'), mtime=1)
+    os.utime(os.path.join(root, 'exteriors'), (2, 2))
+    assert index.refresh() and index.generation == generation + 1
+    assert index.find('School').exterior_path.endswith('school.png')
+    generation = index.generation
+    index.invalidate()
+    assert index.generation > generation  # ImageManager drops its building memo
+    assert index.find('bank').display_name == 'Bank'
+
+    bank = os.path.join(root, 'buildings', 'exteriors', 'bank.png')
+    _save_png(bank, (0, 0, 255), 3)
+    # The package re-exports the image_manager singleton under the module's name
+    monkeypatch.setattr(importlib.import_module('moneySmarts.image_manager'), 'building_index', index)
+    manager = ImageManager(mode=STATIC, disk_cache=False)
+    assert manager.get_building_image('Bank') is not None
+    os.remove(bank)
+    index.invalidate()
+    assert index.image_path('Bank') is None and manager.get_building_image('Bank') is None
+
+
+def _save_png(path, color, mtime):
+    surf = pygame.Surface((4, 4))
+    surf.fill(color)
+    pygame.image.save(surf, path)
+    os.utime(path, (mtime, mtime))
+
+
+def test_stat_free_hits_and_watcher_reload(tmp_path, monkeypatch):
+    path = str(tmp_path / 'coin.png')
+    _save_png(path, (255, 0, 0), 1)
+    static = ImageManager(mode=STATIC, disk_cache=False)
+    first = static.load_image(path)
+    assert first is not None
+
+    def no_disk(*args):
+        raise AssertionError("filesystem access on a cache hit")
+    monkeypatch.setattr(os, 'stat', no_disk)
+    monkeypatch.setattr(os.path, 'exists', no_disk)
+    assert static.load_image(path) is first
+    monkeypatch.undo()
+
+    watched = ImageManager(mode=WATCH, watch_interval=0.01, disk_cache=False)
+    old = watched.load_image(path)
+    _save_png(path, (0, 0, 255), 2)
+    for _ in range(500):  # the watcher polls every 10 ms
+        if watched._changed:
+            break
+        pygame.time.wait(10)
+    watched.stop_watching()
+    new = watched.load_image(path)
+    assert new is not old and new.get_at((0, 0))[:3] == (0, 0, 255)
+    assert static.load_image(path) is first  # static mode keeps what it loaded
+
+
+def test_lru_stays_within_budget_and_keeps_pins(tmp_path):
+    paths = []
+    for n in range(4):
+        path = str(tmp_path / f'tile{n}.png')
+        _save_png(path, (n, 0, 0), 1)
+        paths.append(path)
+    manager = ImageManager(mode=STATIC, budget_bytes=1, disk_cache=False)
+    one = manager.load_image(paths[0]).get_bytesize() * 16
+    manager = ImageManager(mode=STATIC, budget_bytes=2 * one, disk_cache=False)
+    manager.load_image(paths[0])
+    manager.pin(paths[0])
+    manager.load_image(paths[1])
+    manager.load_image(paths[2])  # evicts tile1; tile0 is pinned
+    assert manager.cache_stats()['bytes'] == 2 * one
+    manager.load_image(paths[2])
+    manager.unpin(paths[0])
+    manager.load_image(paths[3])  # tile0 is now the least recently used
+    assert [os.path.basename(k) for k in manager._cache] == ['tile2.png', 'tile3.png']
+    assert set(manager._hits) == {(paths[2], None), (paths[3], None)}  # only evicted aliases go
+    stats = manager.cache_stats()
+    assert stats['evictions'] == 2 and stats['evicted_bytes'] == 2 * one
+    assert stats['bytes'] <= stats['budget'] and stats['pinned'] == 0
+
+
+def test_preload_decodes_on_workers_and_reports_progress(tmp_path):
+    from moneySmarts.event_manager import PRELOAD_PROGRESS, EventBus
+    paths = []
+    for n in range(5):
+        path = str(tmp_path / f'bg{n}.png')
+        _save_png(path, (0, n, 0), 1)
+        paths.append(path)
+    manager = ImageManager(mode=STATIC, preload_workers=2, disk_cache=False)
+    manager.queue_preload([(p, (8, 8)) for p in paths[:3]], group='game')
+    manager.queue_preload([(paths[3], None)], priority=5, group='title')
+    manager.queue_preload([(paths[3], None), (str(tmp_path / 'missing.png'), None)])  # skipped
+    assert manager.preload_status() == (0, 4)
+    seen = []
+    with EventBus.subscription(PRELOAD_PROGRESS, lambda **kw: seen.append(kw)):
+        manager.start_preload()
+        title = manager.load_image(paths[3])  # waits for (or takes over) the queued decode
+        assert title is not None and manager.load_image(paths[3]) is title
+        for _ in range(500):
+            manager.pump_preload()
+            if not manager.preloading():
+                break
+            pygame.time.wait(10)
+    assert manager.preload_status() == (4, 4)
+    assert {'group': 'title', 'done': 1, 'total': 1} in seen
+    assert [kw['done'] for kw in seen if kw['group'] == 'game'] == [1, 2, 3]
+    assert manager.load_image(paths[0], (8, 8)).get_size() == (8, 8)
+    assert manager.cache_stats()['entries'] == 4
+
+
+def test_disk_cache_skips_decoding_on_later_launches(tmp_path, monkeypatch):
+    path = str(tmp_path / 'bg.png')
+    _save_png(path, (10, 20, 30), 1)
+    cache_dir = str(tmp_path / 'cache')
+    first = ImageManager(mode=STATIC, disk_cache=DiskImageCache(cache_dir))
+    scaled = first.load_image(path, (6, 3))
+    assert first.disk_cache.misses == 1 and len(os.listdir(cache_dir)) == 1
+
+    def no_decode(*args):
+        raise AssertionError("decoded the source again")
+    monkeypatch.setattr(pygame.image, 'load', no_decode)
+    monkeypatch.setattr(pygame.transform, 'smoothscale', no_decode)
+    later = ImageManager(mode=STATIC, disk_cache=DiskImageCache(cache_dir))
+    again = later.load_image(path, (6, 3))
+    assert later.disk_cache.hits == 1
+    assert pygame.image.tobytes(again, 'RGB') == pygame.image.tobytes(scaled, 'RGB')
+    monkeypatch.undo()
+    entry = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+    assert os.stat(entry).st_mtime > 1000  # hits refresh the mtime that prune orders by
+    os.utime(entry, (1, 1))
+    later.disk_cache.decode(path, (6, 3), True)
+    assert os.stat(entry).st_mtime > 1000
+
+    later.load_image(path, (7, 5), persist=False)  # e.g. a window size mid-drag
+    assert later.disk_cache.misses == 1 and len(os.listdir(cache_dir)) == 1
+
+    _save_png(path, (200, 0, 0), 2)  # new content, new key
+    edited = ImageManager(mode=STATIC, disk_cache=DiskImageCache(cache_dir, budget_bytes=100))
+    assert edited.load_image(path, (6, 3)).get_at((0, 0))[0] > 190
+    assert edited.disk_cache.misses == 1 and len(os.listdir(cache_dir)) == 1  # pruned to budget
@@ -1,5 +1,7 @@
+import pickle
 import pytest
-from moneySmarts.models import Player, BankAccount, Loan, Asset
+from moneySmarts.exceptions import BankAccountError
+from moneySmarts.models import Player, BankAccount, Loan, Asset, Ledger, PaymentLedger
 
 def test_player_creation():
     player = Player("TestUser")
@@ -17,12 +19,80 @@ def test_bank_account_deposit_withdraw():
     with pytest.raises(Exception):
         acc.withdraw(1000)  # Should fail
 
+def test_balances_are_exact_cents():
+    acc = BankAccount()
+    for _ in range(1000):
+        acc.deposit(0.1)
+    assert acc.balance == 100
+    assert acc._balance == 10000
+    player = Player("Cents")
+    player.cash -= 0.3
+    assert player.cash == 99.7
+    acc.withdraw_cents(1)
+    assert acc.balance == 99.99 and acc.transaction_history[-1] == {"type": "withdrawal", "amount": 0.01}
+    with pytest.raises(BankAccountError):
+        acc.withdraw_cents(10000)
+
+def test_ledger_reads_as_dicts():
+    acc = BankAccount()
+    acc.deposit(100)
+    acc.withdraw(40)
+    assert isinstance(acc.transaction_history, Ledger)
+    assert list(acc.transaction_history) == [
+        {"type": "deposit", "amount": 100},
+        {"type": "withdrawal", "amount": 40},
+    ]
+    assert acc.transaction_history[-1]["amount"] == 40
+    assert acc.transaction_history[1:5] == [{"type": "withdrawal", "amount": 40}]
+    assert not hasattr(acc, "__dict__")
+
+def test_models_pickle_and_restore_old_saves():
+    player = Player("Saver")
+    player.bank_account = BankAccount()
+    player.bank_account.deposit(25)
+    player.loans.append(Loan("Auto", 5000, 0.05, 5))
+    player.loans[0].make_payment(player.loans[0].monthly_payment)
+    restored = pickle.loads(pickle.dumps(player))
+    assert list(restored.bank_account.transaction_history) == list(player.bank_account.transaction_history)
+    assert list(restored.loans[0].payment_history) == list(player.loans[0].payment_history)
+    # Saves written before the models were slotted pickled a plain __dict__
+    loan = Loan.__new__(Loan)
+    loan.__setstate__({
+        "loan_type": "Auto", "original_amount": 5000, "current_balance": 4000,
+        "interest_rate": 0.05, "term_years": 5, "monthly_payment": 94.36,
+        "payment_history": [{"amount": 94.36, "interest": 20.0, "principal": 74.36}],
+    })
+    assert isinstance(loan.payment_history, PaymentLedger)
+    assert loan.payment_history[0]["principal"] == 74.36
+    assert loan.payments_made == 0
+    assert loan.balance_at(0) == 4000
+
 def test_loan_payment():
     loan = Loan("TestLoan", 1200, 0.12, 1)
     old_balance = loan.current_balance
     assert loan.make_payment(loan.monthly_payment)
     assert loan.current_balance < old_balance
 
+def test_loan_schedule_matches_payments():
+    loan = Loan("Mortgage", 200000, 0.06, 30)
+    replay = Loan("Mortgage", 200000, 0.06, 30)
+    for _ in range(120):
+        replay.make_payment(replay.monthly_payment)
+    assert loan.balance_at(120) == pytest.approx(replay.current_balance)
+    interest = sum(p["interest"] for p in replay.payment_history)
+    assert loan.interest_paid_between(0, 120) == pytest.approx(interest)
+    assert loan.balance_at(360) == 0
+
+def test_loan_extra_payment_reamortizes():
+    loan = Loan("Auto", 20000, 0.05, 5)
+    for _ in range(12):
+        loan.make_payment(loan.monthly_payment)
+    before = loan.remaining_payments()
+    loan.make_extra_payment(5000)
+    assert loan.remaining_payments() < before
+    assert loan.balance_at(12) == pytest.approx(loan.current_balance)
+    assert loan.balance_at(6) > loan.balance_at(12)
+
 def test_asset_depreciation():
     car = Asset("Car", "TestCar", 10000)
     car.age_asset()
@@ -0,0 +1,113 @@
+import json
+import random
+import sys
+import time
+
+import pytest
+
+from moneySmarts.sim import Policy, RecordingSink, SimGame, run_batch, run_lifetime, summarize
+from moneySmarts.sim.cli import main
+from moneySmarts.sim.runner import (
+    HISTORY_CHUNK,
+    MAX_CHUNK,
+    derive_seed,
+    iter_lifetimes,
+    run_monte_carlo,
+    shard_bounds,
+)
+from moneySmarts.utils import compute_net_worth
+
+
+def test_lifetime_runs_to_retirement_without_console(capsys):
+    result = run_lifetime(seed=3)
+    assert result.age == 65
+    assert result.months == (65 - 16) * 12
+    assert capsys.readouterr().out == ""
+
+
+def test_same_seed_reproduces_lifetime():
+    assert run_lifetime(seed=11) == run_lifetime(seed=11)
+
+
+def test_engine_throughput_holds_above_6k_lifetimes_per_minute():
+    # A regression guard, not a benchmark: the engine does ~10k lifetimes/min on one core,
+    # and per-write bookkeeping on the money slots once dragged it to ~5.5k.
+    # The coverage tracer is paused while timing; it alone costs several times that.
+    lives = 60
+    tracer = sys.gettrace()
+    sys.settrace(None)
+    try:
+        start = time.perf_counter()
+        run_batch(lives, seed=1)
+        per_minute = lives * 60 / (time.perf_counter() - start)
+    finally:
+        sys.settrace(tracer)
+    assert per_minute >= 6000, f"{per_minute:.0f} lifetimes/min"
+
+
+def test_policy_answers_life_events_and_sink_records():
+    class TradeSchoolNoCar(Policy):
+        def education(self, game, options):
+            return options[1]
+
+        def buy_car(self, game, options):
+            return "No"
+
+    sink = RecordingSink()
+    game = SimGame(policy=TradeSchoolNoCar(), sink=sink)
+    result = game.run()
+    assert result.education == "Trade School"
+    assert not result.owns_car
+    assert ("education", "Go to trade school (costs $10,000 for 2 years)") in sink.decisions
+    assert len(sink.events) == result.random_events
+
+
+def test_summary_and_cli_output(tmp_path):
+    summary = summarize(run_batch(5, seed=1))
+    assert summary['lifetimes'] == 5
+    assert summary['net_worth']['p10'] <= summary['net_worth']['p50'] <= summary['net_worth']['p90']
+    out = tmp_path / "summary.json"
+    lives = tmp_path / "lives.csv"
+    assert main(["--lives", "3", "--seed", "1", "--out", str(out), "--csv", str(lives)]) == 0
+    assert json.loads(out.read_text())['summary']['lifetimes'] == 3
+    assert len(lives.read_text().strip().splitlines()) == 4
+
+
+def test_monte_carlo_report_is_identical_for_any_worker_count():
+    serial = run_monte_carlo(24, master_seed=9, workers=1)
+    parallel = run_monte_carlo(24, master_seed=9, workers=2, chunk_size=3)  # 8 shards, 4 in flight
+    assert json.dumps(serial) == json.dumps(parallel)
+    ages = serial['net_worth_by_age']
+    assert min(ages) == 16 and max(ages) == 65
+    assert ages[40]['p10'] <= ages[40]['p50'] <= ages[40]['p90']
+
+
+def test_derived_seeds_are_distinct_per_lifetime_and_stream():
+    seeds = {derive_seed(1, i, stream) for i in range(100) for stream in ("game", "policy")}
+    assert len(seeds) == 200
+    assert derive_seed(1, 5) == derive_seed(1, 5)
+
+
+def test_large_runs_stream_in_small_shards():
+    assert max(stop - start for start, stop in shard_bounds(1_000_000, 4)) == MAX_CHUNK
+    sizes = {stop - start for start, stop in shard_bounds(1_000_000, 4, with_history=True)}
+    assert sizes == {HISTORY_CHUNK}
+    lifetimes = iter_lifetimes(1_000_000, workers=1, with_history=True)
+    result, by_age, history = next(lifetimes)  # only the first lifetime is simulated
+    assert len(history) == result.months == 588 and len(by_age) == 50
+
+
+def test_fast_forward_steps_months_until_stop():
+    stepped = SimGame(rng=random.Random(2))
+    stepped.start()
+    for _ in range(49 * 12):
+        stepped.simulate_month()
+    fast = SimGame(rng=random.Random(2))
+    fast.start()
+    assert fast.fast_forward(49 * 12) == 49 * 12
+    assert compute_net_worth(fast.player) == pytest.approx(compute_net_worth(stepped.player))
+    assert fast.rng.random() == stepped.rng.random()
+    again = SimGame(rng=random.Random(2))
+    again.start()
+    assert again.fast_forward(600, stop_on=lambda game: game.player.age == 20) < 600
+    assert again.player.age == 20
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from moneySmarts.sim import SimGame
+from moneySmarts.timeseries import COLUMN_NAMES, TimeSeries
+from moneySmarts.utils import compute_net_worth
+
+
+def play(months, seed=4):
+    game = SimGame(rng=random.Random(seed), record_history=True)
+    game.start()
+    game.run(max_months=months)
+    return game
+
+
+def test_advance_month_records_a_row_per_month():
+    game = play(30)
+    history = game.history
+    assert len(history) == history.count == 30
+    assert history.column("month") == list(range(1, 31))
+    game.advance_month()
+    assert history.column("net_worth")[-1] == pytest.approx(compute_net_worth(game.player))
+    last = dict(zip(COLUMN_NAMES, list(history.rows())[-1]))
+    parts = last["cash"] + last["checking"] + last["savings"] + last["investments"] + last["assets"]
+    assert parts - last["debt"] == pytest.approx(last["net_worth"])
+    untracked = SimGame(rng=random.Random(4))
+    untracked.start()
+    untracked.run(max_months=3)
+    assert untracked.history is None  # recording is opt-in
+
+
+def test_ring_buffer_keeps_the_latest_months():
+    history = TimeSeries(capacity=4)
+    for month in range(10):
+        history.append((month, 16, month * 1.0, 0, 0, 0, 0, 0, month * 1.0, 650))
+    assert history.wrapped and len(history) == 4
+    assert history.column("month") == [6, 7, 8, 9]
+    assert [row[0] for row in history.rows()] == [6, 7, 8, 9]
+
+
+def test_numpy_views_share_memory():
+    np = pytest.importorskip("numpy")
+    game = play(120, seed=9)
+    view = game.history.view("cash")
+    assert np.shares_memory(view, np.frombuffer(game.history.columns["cash"], dtype="d"))
+    assert np.shares_memory(game.history.series("cash"), view)
@@ -2,6 +2,7 @@ import os
 import pytest
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
 
 pygame = pytest.importorskip("pygame")
 
@@ -26,3 +27,154 @@ def test_button_creation_and_update():
     btn.draw(screen)
     pygame.quit()
 
+
+def test_gradient_rendered_once_per_size():
+    from moneySmarts import ui
+    pygame.init()
+    screen = pygame.display.set_mode((64, 48))
+    ui.clear_gradient_cache()
+    ui.draw_vertical_gradient(screen, (0, 0, 64, 48), (0, 0, 0), (200, 100, 50))
+    first = ui.gradient_surface((64, 48), (0, 0, 0), (200, 100, 50))
+    assert len(ui.GRADIENT_CACHE) == 1
+    assert screen.get_at((10, 0))[:3] == (0, 0, 0)
+    assert screen.get_at((10, 47))[:3] == (200, 100, 50)
+    ui.draw_vertical_gradient(screen, (0, 0, 64, 48), (0, 0, 0), (200, 100, 50))
+    assert ui.gradient_surface((64, 48), (0, 0, 0), (200, 100, 50)) is first
+    ui.clear_gradient_cache()
+    assert not ui.GRADIENT_CACHE
+    pygame.quit()
+
+def test_fonts_are_shared_and_dropped_on_quit():
+    from moneySmarts.fonts import font_cache, get_font, load_font
+    pygame.init()
+    assert get_font(20) is get_font(20)
+    assert get_font(20, bold=True) is not get_font(20)
+    assert load_font("missing-font.ttf", 20) is get_font(20)  # falls back to the system font
+    assert Button(0, 0, 10, 10, "a", font_size=20).font is get_font(20)
+    pygame.quit()
+    assert len(font_cache) == 0
+
+def test_rendered_text_is_cached_with_lru_eviction():
+    from moneySmarts.fonts import CachedText, TextCache, get_font
+    pygame.init()
+    font = get_font(20)
+    cache = TextCache(maxsize=2)
+    first = cache.render(font, "Cash", True, pygame.Color(0, 0, 0))
+    cache.render(font, "Bank", True, (0, 0, 0))
+    assert cache.render(font, "Cash", True, (0, 0, 0, 255)) is first
+    cache.render(font, "Debt", True, (0, 0, 0))  # evicts the least recently used ("Bank")
+    assert cache.render(font, "Cash", True, pygame.Color(0, 0, 0)) is first
+    assert (cache.hits, cache.misses, len(cache)) == (2, 3, 2)
+    label = CachedText(font)
+    surface = label.render("$10.00")
+    assert label.render("$10.00") is surface
+    assert label.render("$10.00", (255, 0, 0)) is not surface
+    pygame.quit()
+
+def test_button_states_are_baked_until_style_changes():
+    pygame.init()
+    screen = pygame.display.set_mode((200, 100))
+    button = Button(10, 10, 120, 40, "Buy", color=(10, 200, 30), hover_color=(200, 10, 30))
+    button.draw(screen)
+    normal, hover = button._surfaces[:2]
+    assert screen.get_at((15, 30))[:3] == (10, 200, 30)
+    assert screen.get_at((70, 51))[:3] == (0, 0, 0)  # shadow below the body
+    button.hovered = True
+    button.draw(screen)
+    assert button._surfaces[:2] == (normal, hover)
+    assert screen.get_at((15, 30))[:3] == (200, 10, 30)
+    button.text = "Sold"
+    assert button._surfaces is None
+    button.draw(screen)
+    assert button._surfaces[0] is not normal
+    pygame.quit()
+
+def test_confirm_dialog_buttons_live_as_long_as_the_dialog():
+    from moneySmarts.game import Game
+    from moneySmarts.screens.base_screens import TitleScreen
+    from moneySmarts.ui import GUIManager
+    pygame.init()
+    game = Game()
+    manager = game.gui_manager = GUIManager(game)
+    title = TitleScreen(game)
+    title.confirm_quit_game()
+    buttons = title.confirm_buttons
+    yes = buttons[0]
+    yes.update(yes.rect.center, False)
+    title.draw(manager.screen)
+    title.draw(manager.screen)
+    assert title.confirm_buttons is buttons and yes.hovered  # not rebuilt per frame
+    title.confirm_no()
+    assert not title.show_confirm and title.confirm_buttons is None
+    pygame.quit()
+
+def test_dirty_rect_mode_redraws_only_what_changed():
+    from moneySmarts.ui import GUIManager, Screen
+    pygame.init()
+    manager = GUIManager(None)
+    screen = Screen(None)
+    screen.buttons = [Button(10, 10, 100, 40, "Go", color=(10, 200, 30), hover_color=(200, 10, 30))]
+    manager.set_screen(screen)
+    assert manager.draw_dirty() == [manager.screen.get_rect()]
+    assert manager.draw_dirty() == []  # idle frame is skipped
+    screen.buttons[0].update((20, 20), False)
+    assert manager.draw_dirty() == [pygame.Rect(10, 10, 100, 42)]
+    assert manager.screen.get_at((15, 30))[:3] == (200, 10, 30)
+    pygame.quit()
+
+def test_loop_idles_unless_input_or_animation():
+    from moneySmarts.ui import GUIManager, Screen
+    pygame.init()
+    manager = GUIManager(None)
+    screen = Screen(None)
+    manager.set_screen(screen)
+    assert not manager.is_idle([])  # the new screen still has to be drawn
+    manager.draw_dirty()
+    assert manager.is_idle([])
+    assert not manager.is_idle([pygame.event.Event(pygame.MOUSEMOTION)])
+    screen.needs_animation = lambda: True
+    assert not manager.is_idle([])
+    pygame.quit()
+
+def test_screens_are_reused_and_stacked():
+    from moneySmarts.game import Game
+    from moneySmarts.models import Player
+    from moneySmarts.screens.game_screen import GameScreen
+    from moneySmarts.screens.random_event_screens import RandomEventScreen
+    from moneySmarts.screens.shop_screen import ShopScreen
+    from moneySmarts.ui import GUIManager
+    pygame.init()
+    game = Game()
+    game.player = Player("Ann")
+    manager = game.gui_manager = GUIManager(game)
+    home = manager.show(GameScreen)
+    buttons = home.buttons
+    shop = manager.show(ShopScreen)
+    shop.select_item(0)
+    assert shop.show_payment_popup
+    assert manager.show(GameScreen) is home and home.buttons is buttons  # nothing changed
+    assert manager.show(ShopScreen) is shop and not shop.show_payment_popup
+    home = manager.show(GameScreen)
+    event = {"name": "Windfall", "description": "Found money", "effect": 10}
+    manager.push(RandomEventScreen(game, event, 10))
+    game.player.age = 18  # can now apply for a credit card
+    manager.current_screen.continue_game()
+    assert manager.current_screen is home and not manager.stack
+    assert home.buttons is not buttons
+    pygame.quit()
+
+def test_gui_month_advance_records_history():
+    import random
+
+    from moneySmarts.game import Game
+    from moneySmarts.models import Player
+    from moneySmarts.screens.game_screen import GameScreen
+    from moneySmarts.ui import GUIManager
+    pygame.init()
+    game = Game(rng=random.Random(1), record_history=True)
+    game.player = Player("Ann")
+    manager = game.gui_manager = GUIManager(game)
+    home = manager.show(GameScreen)
+    home.continue_to_next_month()
+    assert len(game.history) == 1 and game.history.column("month") == [1]
+    pygame.quit()